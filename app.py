@@ -1,4 +1,7 @@
+import logging
+
 from classes.App import App
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
     App().run()
@@ -0,0 +1,137 @@
+"""
+Events that reach Python during a round, before and after the state table.
+
+Starts a real ``App`` on SDL's dummy drivers, enters a round and feeds it a
+synthetic flood each frame: an 8000 Hz mouse at 144 FPS plus the button
+releases, key releases, wheel ticks and text input a player produces.  The
+frame's queue is read and dispatched as ``App.run`` does, in three
+configurations:
+
+* ``before``      — every event type allowed and dispatched by an if/elif
+  chain over the states, as ``App`` did before the state table
+  (:func:`_if_elif_dispatch`, a minimal copy kept here as the baseline);
+* ``all allowed`` — the table dispatch with every event type allowed;
+* ``filtered``    — the table dispatch with the PLAYING filter installed.
+
+Only reading and dispatching the queue is timed, per frame; medians over
+alternating runs are reported and "input events/s" is how many generated
+events per second that sustains.  Run from the repository root::
+
+    python benchmarks/bench_event_dispatch.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pygame
+
+from classes.App import App
+from classes.state_manager import GameState
+
+_FPS     = 144
+_MOTION  = 8_000 // _FPS
+_FRAMES  = 600
+_ROUNDS  = 7        # alternating runs of each configuration; medians are reported
+
+
+def _flood() -> None:
+    post = pygame.event.post
+    E = pygame.event.Event
+    for i in range(_MOTION):
+        post(E(pygame.MOUSEMOTION, pos=(640, 360), rel=(1 - i % 3, i % 3 - 1), buttons=(0, 0, 0)))
+    post(E(pygame.MOUSEBUTTONUP, button=1, pos=(640, 360)))
+    post(E(pygame.MOUSEBUTTONUP, button=3, pos=(640, 360)))
+    post(E(pygame.KEYUP, key=pygame.K_w, mod=0, unicode="w", scancode=26))
+    post(E(pygame.MOUSEWHEEL, x=0, y=1, flipped=False))
+    post(E(pygame.TEXTINPUT, text="w"))
+
+
+def _if_elif_dispatch(app: App, events) -> None:
+    """
+    The pre-table dispatch: every event walks the state chain and, while
+    playing, the three input checks.  Menu branches are reduced to their
+    comparisons since the benchmark only ever runs in PLAYING.
+    """
+    S = GameState
+    for event in events:
+        if event.type == pygame.QUIT:
+            app._quit()
+        state = app._state.current_state
+        if state == S.START:
+            pass
+        elif state == S.MODE_SELECT:
+            pass
+        elif state == S.STATISTICS:
+            pass
+        elif state == S.INSTRUCTIONS:
+            pass
+        elif state == S.SETTINGS:
+            pass
+        elif state == S.PLAYING:
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                app._playing_event(event)
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F2:
+                app._playing_event(event)
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                app._playing_event(event)
+        elif state == S.PAUSED:
+            pass
+        elif state == S.RESULTS:
+            pass
+
+
+def _run(app: App, dispatch) -> tuple[float, float, float, float]:
+    received = dispatched = 0
+    samples = []
+    for _ in range(_FRAMES):
+        _flood()    # not timed: stands in for SDL filling the queue
+        start = time.perf_counter()
+        events = pygame.event.get()
+        received += len(events)
+        app._game_clock.pumped()
+        events = app._mouse.ingest(events, app._game_clock)
+        dispatched += len(events)
+        dispatch(events)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    median = samples[len(samples) // 2]
+    return received / _FRAMES, dispatched / _FRAMES, median * 1e6, (_MOTION + 5) / median
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        app = App()
+        app._start_round()
+        assert app._state.is_state(GameState.PLAYING)
+
+        playing = app._state.handler
+        configs = {
+            "before":      (lambda: pygame.event.set_allowed(None),
+                            lambda events: _if_elif_dispatch(app, events)),
+            "all allowed": (lambda: pygame.event.set_allowed(None), app._handle_events),
+            "filtered":    (lambda: app._state._apply_filter(playing), app._handle_events),
+        }
+        runs = {name: [] for name in configs}
+        for _ in range(_ROUNDS):
+            for name, (setup, dispatch) in configs.items():
+                setup()
+                runs[name].append(_run(app, dispatch))
+
+        print(f"{'':>12} {'received/frame':>15} {'dispatched/frame':>17} {'us/frame':>9} {'input events/s':>15}")
+        for name, results in runs.items():
+            received, dispatched, us, rate = sorted(results, key=lambda r: r[2])[_ROUNDS // 2]
+            print(f"{name:>12} {received:>15.1f} {dispatched:>17.1f} {us:>9.1f} {rate:>15,.0f}")
+        app._session_writer.close()
+        app._sessions.close()
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
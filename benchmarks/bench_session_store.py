@@ -0,0 +1,118 @@
+"""
+Cost of saving a round and opening the statistics screen against history size.
+
+Compares SessionStore (one INSERT per round, stored summary row) with the old
+stats.json approach (load everything, append, rewrite with indent=4).  The
+store is filled with up to 1M synthetic sessions.  Run from the repository
+root::
+
+    python benchmarks/bench_session_store.py
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from classes.session_store import SessionStore
+
+_SIZES       = (1_000, 10_000, 100_000, 1_000_000)
+_JSON_LIMIT  = 100_000     # rewriting a 1M-entry JSON file takes too long to repeat
+_APPENDS     = 200
+_JSON_SAVES  = 3
+
+
+def _session(rng: random.Random, i: int) -> dict:
+    hits = rng.randint(10, 120)
+    misses = rng.randint(0, 40)
+    return {
+        "date": f"2024-{1 + i % 12:02d}-{1 + i % 28:02d} {i % 24:02d}:{i % 60:02d}",
+        "mode": rng.choice(("basic", "dynamic")),
+        "score": rng.randint(1_000, 30_000),
+        "hits": hits,
+        "misses": misses,
+        "accuracy": round(hits / (hits + misses) * 100, 2),
+        "avg_reaction": round(rng.uniform(250, 600), 2),
+        "best_reaction": round(rng.uniform(150, 300), 2),
+        "max_combo": rng.randint(0, hits),
+    }
+
+
+def _fill(store: SessionStore, rng: random.Random, start: int, stop: int) -> None:
+    store.extend(_session(rng, i) for i in range(start, stop))
+
+
+def _bench_store_append(store: SessionStore, rng: random.Random) -> float:
+    samples = []
+    for i in range(_APPENDS):
+        record = _session(rng, i)
+        start = time.perf_counter()
+        store.append(record)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[len(samples) // 2] * 1e3
+
+
+def _bench_store_open(path: str) -> float:
+    start = time.perf_counter()
+    store = SessionStore(path, legacy_json=None)
+    store.summary()
+    elapsed = time.perf_counter() - start
+    store.close()
+    return elapsed * 1e3
+
+
+def _bench_json(path: str, data: list, rng: random.Random) -> tuple[float, float]:
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4)
+    start = time.perf_counter()
+    for i in range(_JSON_SAVES):
+        with open(path, "r") as f:
+            loaded = json.load(f)
+        loaded.append(_session(rng, i))
+        with open(path, "w") as f:
+            json.dump(loaded, f, indent=4)
+    save_ms = (time.perf_counter() - start) / _JSON_SAVES * 1e3
+
+    start = time.perf_counter()
+    with open(path, "r") as f:
+        json.load(f)
+    load_ms = (time.perf_counter() - start) * 1e3
+    return save_ms, load_ms
+
+
+def main() -> None:
+    rng = random.Random(1234)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "stats.db")
+        json_path = os.path.join(tmp, "stats.json")
+        store = SessionStore(db_path, legacy_json=None)
+        data: list = []
+
+        print(f"{'sessions':>10} {'store save ms':>14} {'store open ms':>14} "
+              f"{'json save ms':>13} {'json open ms':>13}")
+        filled = 0
+        for size in _SIZES:
+            _fill(store, rng, filled, size)
+            if size <= _JSON_LIMIT:
+                data.extend(_session(rng, i) for i in range(filled, size))
+            filled = size
+
+            append_ms = _bench_store_append(store, rng)
+            open_ms = _bench_store_open(db_path)
+            if size <= _JSON_LIMIT:
+                save_ms, load_ms = _bench_json(json_path, data, rng)
+                json_cols = f"{save_ms:>13.2f} {load_ms:>13.2f}"
+            else:
+                json_cols = f"{'-':>13} {'-':>13}"
+            print(f"{size:>10} {append_ms:>14.3f} {open_ms:>14.2f} {json_cols}")
+            filled += _APPENDS
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Per-frame update cost of TargetField against the number of live targets.
+
+Compares the vectorised TargetField with a plain list of Target objects
+updated one by one.  Run from the repository root::
+
+    python benchmarks/bench_target_field.py
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from constants import WIDTH, HEIGHT
+from classes.Target import Target
+from classes.target_field import TargetField
+
+_FRAMES    = 600
+_FRAME_MS  = 1000 / 60
+_TTL       = 1e12       # never time out during the benchmark
+_COUNTS    = (1, 10, 100, 1000)
+
+
+def _bench_field(count: int) -> float:
+    field = TargetField()
+    for _ in range(count):
+        field.spawn(WIDTH, HEIGHT, 30, _TTL, mode="dynamic", now=0.0)
+    field.mark_presented(0.0)
+    now = 0.0
+    start = time.perf_counter()
+    for _ in range(_FRAMES):
+        now += _FRAME_MS
+        field.update(now, WIDTH, HEIGHT)
+        field.hit_test(WIDTH / 2, HEIGHT / 2)
+    return (time.perf_counter() - start) / _FRAMES * 1e6
+
+
+def _bench_objects(count: int) -> float:
+    targets = [Target.spawn(WIDTH, HEIGHT, 30, _TTL, mode="dynamic") for _ in range(count)]
+    for t in targets:
+        t.spawn_time = t.last_update = 0
+    now = 0.0
+    start = time.perf_counter()
+    for _ in range(_FRAMES):
+        now += _FRAME_MS
+        for t in targets:
+            t.update(now, WIDTH, HEIGHT)
+        for t in targets:
+            t.is_hit(WIDTH / 2, HEIGHT / 2)
+    return (time.perf_counter() - start) / _FRAMES * 1e6
+
+
+def main() -> None:
+    print(f"{'targets':>8} {'TargetField us/frame':>22} {'list[Target] us/frame':>23}")
+    for count in _COUNTS:
+        print(f"{count:>8} {_bench_field(count):>22.1f} {_bench_objects(count):>23.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,9 @@
+import logging
 import sys
+import time
+from typing import Optional
+
+import numpy as np
 import pygame
 import constants
 from constants import (
@@ -7,12 +12,24 @@ from constants import (
     
 )
 from classes.asset_loader import AssetLoader
-from classes.Target import Target
+from classes.audio import AudioEngine
+from classes.clock import GameClock, game_clock
+from classes.input import RelativeMouse
+from classes.music import MusicController
+from classes.font_registry import font_registry
+from classes.Target import warm_sprite_cache
+from classes.target_field import TargetField
 from classes.score_manager import ScoreManager
+from classes.session_store import SessionStore
+from classes.session_writer import SessionWriter
 from classes.difficulty_manager import DifficultyManager
-from classes.state_manager import GameState, GameStateManager
+from classes.state_manager import GameState, GameStateManager, StateHandler
 from classes.feedback_manager import FeedbackManager
 from classes.hud import HUD
+from classes.dirty_rects import DirtyRectRenderer
+from classes.render_policy import MenuRenderPolicy
+from classes.startup_timeline import StartupTimeline
+from classes.text_cache import text_cache
 from classes.screens import (
     StartScreen, PauseScreen, ResultsScreen,
     InstructionsScreen, SettingsScreen, ModeSelectScreen, StatsScreen
@@ -24,272 +41,467 @@ _CROSSHAIR_SIZE  = 16
 _CROSSHAIR_GAP   = 5
 _SPAWN_DELAY_MS  = 150
 
+# Tracking scores time on a single target; it is not in MODE_TARGET_COUNTS
+_TRACKING_TARGETS = 1
+
+# Event types each state consumes; SDL drops everything else while it is active
+_MENU_EVENTS    = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION)
+_STATS_EVENTS   = _MENU_EVENTS + (pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL)
+_PLAYING_EVENTS = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION)
+
+logger = logging.getLogger(__name__)
 
-class App:
 
-    def __init__(self) -> None:
-        pygame.init()
-        self._screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption(TITLE)
-        self._clock = pygame.time.Clock()
-        pygame.mouse.set_visible(False)
+class App:
 
-        assets        = AssetLoader()
-        self._fonts   = assets.load_fonts()
-        self._sounds  = assets.load_sounds()
-        AssetLoader.play_music("menu_music.mp3")
+    def __init__(self, clock: Optional[GameClock] = None) -> None:
+        # Đồng hồ độ phân giải cao dùng cho thời gian phản xạ
+        self._game_clock = clock or game_clock
+        timeline = StartupTimeline()
+        self._timeline = timeline
+
+        with timeline.phase("pygame.init"):
+            AudioEngine.pre_init(constants.AUDIO_FREQUENCY, constants.AUDIO_BUFFER)
+            pygame.init()
+        with timeline.phase("display"):
+            self._screen = pygame.display.set_mode((WIDTH, HEIGHT))
+            pygame.display.set_caption(TITLE)
+            self._clock = pygame.time.Clock()
+            pygame.mouse.set_visible(False)
+
+        assets = AssetLoader()
+        with timeline.phase("fonts"):
+            self._fonts = assets.load_fonts()
+            medium_font = self._fonts["medium"]
+        logger.debug("font registry: %s", font_registry.stats())
+        with timeline.phase("sounds"):
+            self._audio = AudioEngine(assets.load_sounds(), constants.AUDIO_POOLS)
+        with timeline.phase("music"):
+            self._music = MusicController("menu_music.mp3")
+            self._music.play(constants.MUSIC_VOLUME)
+
+        with timeline.phase("sessions"):
+            self._sessions = SessionStore()
+            self._session_writer = SessionWriter()
 
         self._state    = GameStateManager(GameState.START)
-        self._score    = ScoreManager()
+        self._score    = ScoreManager(self._session_writer)
         self._diff     = DifficultyManager()
-        self._feedback = FeedbackManager()
-        self._hud      = HUD(self._fonts["medium"], self._score)
-
-        self._start_screen    = StartScreen(WIDTH, HEIGHT)
-        self._pause_screen    = PauseScreen(WIDTH, HEIGHT)
-        self._results_screen  = ResultsScreen(WIDTH, HEIGHT, self._score)
-        self._instr_screen    = InstructionsScreen(WIDTH, HEIGHT)
-        self._settings_screen = SettingsScreen(WIDTH, HEIGHT)
-        self._mode_screen     = ModeSelectScreen(WIDTH, HEIGHT)
-        self._stats_screen    = StatsScreen(WIDTH, HEIGHT)
+        self._feedback = FeedbackManager(medium_font)
+        self._hud      = HUD(medium_font, self._score)
+
+        # Screens are built on first use; only the start screen is needed
+        # for the first frame.
+        self._screens: dict[GameState, object] = {}
+        self._screen_factories = {
+            GameState.START:        lambda: StartScreen(WIDTH, HEIGHT),
+            GameState.PAUSED:       lambda: PauseScreen(WIDTH, HEIGHT),
+            GameState.RESULTS:      lambda: ResultsScreen(WIDTH, HEIGHT, self._score),
+            GameState.INSTRUCTIONS: lambda: InstructionsScreen(WIDTH, HEIGHT),
+            GameState.SETTINGS:     lambda: SettingsScreen(WIDTH, HEIGHT, self._music),
+            GameState.MODE_SELECT:  lambda: ModeSelectScreen(WIDTH, HEIGHT),
+            GameState.STATISTICS:   lambda: StatsScreen(WIDTH, HEIGHT, self._sessions),
+        }
+        with timeline.phase("screens"):
+            self._screen_for(GameState.START)
 
         self._game_timer    = 0
-        self._target        = None
+        self._targets       = TargetField()
         self._spawn_timer   = 0
         self._waiting_spawn = False
 
         self._game_frame = pygame.Surface((WIDTH, HEIGHT))
+        self._dirty      = DirtyRectRenderer((WIDTH, HEIGHT), constants.DIRTY_RECT_THRESHOLD)
+        self._last_drawn_state = None
+        self._menu_policy = MenuRenderPolicy(constants.IDLE_FPS, constants.IDLE_AFTER_MS)
         
-        self._vmouse_x = float(WIDTH // 2)
-        self._vmouse_y = float(HEIGHT // 2)
+        # Con trỏ ảo trong ván chơi, cộng dồn từ MOUSEMOTION ở chế độ tương đối
+        self._mouse = RelativeMouse(WIDTH, HEIGHT)
+
+        # Mô phỏng bước cố định (_game_timer là thời gian mô phỏng): phần dư
+        # chưa chạy và thời điểm khung hình trước (None khi vừa vào ván chơi)
+        self._sim_accum  = 0.0
+        self._last_frame_ms: Optional[float] = None
         
         self._prev_state = GameState.START
+        self._register_states()
 
     def run(self) -> None:
         while True:
-            dt     = self._clock.tick(FPS)
-            events = pygame.event.get()
+            playing = self._state.is_state(GameState.PLAYING)
+            if not playing and self._menu_policy.is_idle(pygame.time.get_ticks()):
+                # Idle menu: sleep until input arrives (or the idle tick
+                # elapses) instead of spinning at full frame rate
+                first  = pygame.event.wait(self._menu_policy.idle_timeout_ms)
+                events = pygame.event.get()
+                if first.type != pygame.NOEVENT:
+                    events.insert(0, first)
+                dt = self._clock.tick()
+            else:
+                dt     = self._clock.tick(constants.RENDER_FPS if playing else FPS)
+                events = pygame.event.get()
+            self._game_clock.pumped()
+            if playing:
+                # Chuột tần số cao: gộp MOUSEMOTION của cả khung hình một lần
+                events = self._mouse.ingest(events, self._game_clock)
+
+            self._music.update(dt)
+            if not playing:
+                self._menu_policy.notify_events(events, pygame.time.get_ticks())
             self._handle_events(events)
             self._update(dt)
             self._draw()
 
+    def _screen_for(self, state: GameState):
+        """Return the screen for *state*, constructing it on first use."""
+        screen = self._screens.get(state)
+        if screen is None:
+            start  = time.perf_counter()
+            screen = self._screen_factories[state]()
+            self._screens[state] = screen
+            logger.debug("built %s screen in %.1f ms", state.value, (time.perf_counter() - start) * 1000)
+        return screen
+
+    def _warm_next_screen(self) -> bool:
+        """Build one not-yet-constructed screen; False once all exist."""
+        for state in self._screen_factories:
+            if state not in self._screens:
+                self._screen_for(state)
+                return True
+        return False
+
     def _play(self, name: str) -> None:
-        snd = self._sounds.get(name)
-        if snd:
-            snd.play()
+        self._audio.play(name)
+
+    # ------------------------------------------------------------------
+    # State table
+    # ------------------------------------------------------------------
+
+    def _register_states(self) -> None:
+        S = GameState
+
+        def screen(state: GameState, actions: dict, event_types=_MENU_EVENTS, **hooks) -> StateHandler:
+            return StateHandler(
+                lambda event: self._screen_action(state, event, actions),
+                draw=lambda: self._screen_for(state).draw(self._screen),
+                event_types=event_types,
+                **hooks,
+            )
+
+        back = lambda: self._state.transition_to(self._prev_state)
+        register = self._state.register
+
+        register(S.START, screen(S.START, {
+            "start":        lambda: self._state.transition_to(S.MODE_SELECT),
+            "instructions": lambda: self._open_from_here(S.INSTRUCTIONS),
+            "statistics":   lambda: self._state.transition_to(S.STATISTICS),
+            "settings":     lambda: self._open_from_here(S.SETTINGS),
+            "exit":         self._quit,
+        }))
+        register(S.MODE_SELECT, screen(S.MODE_SELECT, {
+            "mode_basic":   lambda: self._start_mode("basic"),
+            "mode_dynamic": lambda: self._start_mode("dynamic"),
+            "mode_tracking": lambda: self._start_mode("tracking"),
+            "back":         lambda: self._state.transition_to(S.START),
+        }))
+        register(S.STATISTICS, screen(
+            S.STATISTICS, {"back": lambda: self._state.transition_to(S.START)},
+            event_types=_STATS_EVENTS, on_enter=self._enter_statistics,
+        ))
+        register(S.INSTRUCTIONS, screen(S.INSTRUCTIONS, {"back": back}))
+        register(S.SETTINGS,     screen(S.SETTINGS,     {"back": back}))
+        register(S.PLAYING, StateHandler(
+            self._playing_event,
+            draw=self._draw_playing,
+            update=self._update_playing,
+            on_enter=self._enter_playing,
+            on_exit=self._exit_playing,
+            event_types=_PLAYING_EVENTS,
+        ))
+        register(S.PAUSED, StateHandler(
+            lambda event: self._screen_action(S.PAUSED, event, {
+                "resume":   lambda: self._state.transition_to(S.PLAYING),
+                "restart":  self._start_round,
+                "settings": lambda: self._open_from_here(S.SETTINGS),
+                "menu":     self._go_to_menu,
+            }),
+            draw=self._draw_paused,
+            on_enter=self._enter_paused,
+            event_types=_MENU_EVENTS,
+        ))
+        register(S.RESULTS, screen(S.RESULTS, {
+            "restart": self._start_round,
+            "menu":    self._go_to_menu,
+            "exit":    self._quit,
+        }, on_enter=self._enter_results))
+
+    def _screen_action(self, state: GameState, event: pygame.event.Event, actions: dict) -> None:
+        """Pass *event* to *state*'s screen and run the action it returns."""
+        action = actions.get(self._screen_for(state).handle_event(event))
+        if action is not None:
+            action()
+
+    def _open_from_here(self, state: GameState) -> None:
+        """Open a screen whose Back button returns to the current state."""
+        self._prev_state = self._state.current_state
+        self._state.transition_to(state)
+
+    # ------------------------------------------------------------------
+    # Transitions
+    # ------------------------------------------------------------------
 
     def _start_round(self) -> None:
-        AssetLoader.stop_music()
-        self._score.reset()
+        self._music.stop(constants.MUSIC_FADE_MS)
+        self._score.reset(getattr(constants, 'GAME_MODE', 'basic'))
         self._diff.reset()
+        warm_sprite_cache(self._diff.radius_schedule())
         self._feedback.clear()
-        self._game_timer    = 0
-        self._target        = None
+        self._game_timer    = 0.0
+        self._sim_accum     = 0.0
+        self._targets.clear()
         self._waiting_spawn = True
         self._spawn_timer   = _SPAWN_DELAY_MS
-        pygame.event.set_grab(True)
-        pygame.mouse.get_rel() 
-        self._vmouse_x, self._vmouse_y = pygame.mouse.get_pos()
         self._state.transition_to(GameState.PLAYING)
 
+    def _start_mode(self, mode: str) -> None:
+        constants.GAME_MODE = mode
+        self._start_round()
+
     def _go_to_menu(self) -> None:
-        self._target = None
+        self._targets.clear()
         self._state.transition_to(GameState.START)
-        AssetLoader.play_music("menu_music.mp3", volume=getattr(constants, 'MUSIC_VOLUME', 0.5))
+        self._music.play(constants.MUSIC_VOLUME, constants.MUSIC_FADE_MS)
+
+    def _enter_playing(self, previous: GameState) -> None:
+        self._mouse.enable(pygame.mouse.get_pos())
+        self._last_frame_ms = None
+
+    def _exit_playing(self, following: GameState) -> None:
+        self._mouse.disable()
+
+    def _enter_paused(self, previous: GameState) -> None:
+        # Đóng băng khung hình cuối của ván chơi làm nền cho menu tạm dừng
+        if previous is GameState.PLAYING:
+            self._game_frame.blit(self._screen, (0, 0))
+
+    def _enter_results(self, previous: GameState) -> None:
+        self._screen_for(GameState.RESULTS).invalidate()
+        self._music.play(constants.RESULTS_MUSIC_VOLUME, constants.MUSIC_FADE_MS)
+
+    def _enter_statistics(self, previous: GameState) -> None:
+        # Show the round that may still be on its way to disk
+        self._session_writer.flush(timeout=0.5)
+        self._screen_for(GameState.STATISTICS).load_data()
+
+    # ------------------------------------------------------------------
+    # Gameplay
+    # ------------------------------------------------------------------
 
-    def _spawn_target(self) -> None:
+    def _spawn_targets(self) -> None:
         current_mode = getattr(constants, 'GAME_MODE', 'basic')
-        self._target = Target.spawn(
-            WIDTH, HEIGHT,
-            self._diff.current_radius,
-            self._diff.current_ttl,
-            mode=current_mode
-        )
+        if current_mode == "tracking":
+            # Một mục tiêu duy nhất (xem _track): mục tiêu mới luôn thay thế
+            # mục tiêu cũ, sống một thời gian cố định
+            self._targets.clear()
+            wanted = _TRACKING_TARGETS
+            ttl    = constants.TRACKING_TARGET_MS
+        else:
+            wanted = constants.MODE_TARGET_COUNTS.get(current_mode, 1)
+            ttl    = self._diff.current_ttl
+        while self._targets.count < wanted:
+            self._targets.spawn(
+                WIDTH, HEIGHT,
+                self._diff.current_radius,
+                ttl,
+                mode=current_mode,
+                now=self._game_timer,
+            )
         self._waiting_spawn = False
 
+    def _schedule_spawn(self) -> None:
+        if not self._waiting_spawn:
+            self._waiting_spawn = True
+            self._spawn_timer   = _SPAWN_DELAY_MS
+
     def _handle_events(self, events) -> None:
         for event in events:
             if event.type == pygame.QUIT:
                 self._quit()
+            self._state.dispatch(event)
+
+    def _playing_event(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self._state.transition_to(GameState.PAUSED)
+
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F2:
+            constants.DIRTY_RECTS = not constants.DIRTY_RECTS
+
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self._score.mode == "tracking":
+                return      # Tracking chỉ tính thời gian bám mục tiêu, không bắn
+            mx, my = self._mouse.position_of(event)
+            now    = self._game_clock.event_time_ms(event)
+            self._play("shot")
+            idx    = self._targets.hit_test(mx, my, self._sim_time_at(now))
+            if idx >= 0:
+                rt  = self._targets.reaction_time(idx, now)
+                pts = self._score.register_hit(rt, self._targets.ttl(idx))
+                self._feedback.add_hit_feedback((mx, my), pts)
+                self._play("hit")
+                self._targets.remove(idx)
+                self._schedule_spawn()
+            else:
+                self._score.register_miss()
+                self._feedback.add_miss_feedback((mx, my))
 
-            
-            state = self._state.current_state
-
-            if state == GameState.START:
-                action = self._start_screen.handle_event(event)
-                if   action == "start":        self._state.transition_to(GameState.MODE_SELECT)
-                elif action == "instructions": 
-                    self._prev_state = GameState.START
-                    self._state.transition_to(GameState.INSTRUCTIONS)
-                elif action == "statistics":   
-                    self._stats_screen.load_data() 
-                    self._state.transition_to(GameState.STATISTICS)
-                elif action == "settings":     
-                    self._prev_state = GameState.START
-                    self._state.transition_to(GameState.SETTINGS)
-                elif action == "exit":         self._quit()
-
-            elif state == GameState.MODE_SELECT:
-                action = self._mode_screen.handle_event(event)
-                if action == "mode_basic":
-                    constants.GAME_MODE = "basic"
-                    self._start_round()
-                elif action == "mode_dynamic":
-                    constants.GAME_MODE = "dynamic"
-                    self._start_round()
-                elif action == "back":
-                    self._state.transition_to(GameState.START)
-            
-            elif state == GameState.STATISTICS:
-                if self._stats_screen.handle_event(event) == "back":
-                    self._state.transition_to(GameState.START)
-                    
-            elif state == GameState.INSTRUCTIONS:
-                if self._instr_screen.handle_event(event) == "back":
-                    self._state.transition_to(self._prev_state)
-
-            elif state == GameState.SETTINGS:
-                if self._settings_screen.handle_event(event) == "back":
-                    self._state.transition_to(self._prev_state)
-
-            elif state == GameState.PLAYING:
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                    pygame.event.set_grab(False)
-                    self._game_frame.blit(self._screen, (0, 0))
-                    self._state.transition_to(GameState.PAUSED)
-
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    mx, my = int(self._vmouse_x), int(self._vmouse_y)
-                    now    = pygame.time.get_ticks()
-                    self._play("shot")
-                    if self._target and self._target.is_hit(mx, my):
-                        rt  = self._target.get_reaction_time(now)
-                        pts = self._score.register_hit(rt, self._target.ttl_ms)
-                        self._feedback.add_hit_feedback((mx, my), pts)
-                        self._play("hit")
-                        self._target        = None
-                        self._waiting_spawn = True
-                        self._spawn_timer   = _SPAWN_DELAY_MS
-                    else:
-                        self._score.register_miss()
-                        self._feedback.add_miss_feedback((mx, my))
-
-            elif state == GameState.PAUSED:
-                action = self._pause_screen.handle_event(event)
-                if   action == "resume":  
-                    pygame.event.set_grab(True) 
-                    pygame.mouse.get_rel()
-                    self._vmouse_x, self._vmouse_y = pygame.mouse.get_pos()
-                    self._state.transition_to(GameState.PLAYING)
-                elif action == "restart": self._start_round()
-                elif action == "settings": 
-                    self._prev_state = GameState.PAUSED 
-                    self._state.transition_to(GameState.SETTINGS)
-                elif action == "menu":    self._go_to_menu()
-
-            elif state == GameState.RESULTS:
-                action = self._results_screen.handle_event(event)
-                if   action == "restart": self._start_round()
-                elif action == "menu":    self._go_to_menu()
-                elif action == "exit":    self._quit()
+    def _sim_time_at(self, wall_ms: float) -> float:
+        """Simulation time matching the wall-clock instant *wall_ms*."""
+        if self._last_frame_ms is None:
+            return self._game_timer
+        # _game_timer + _sim_accum is where the simulation stood at _last_frame_ms
+        ahead = min(wall_ms - self._last_frame_ms, constants.MAX_FRAME_MS)
+        return max(0.0, self._game_timer + self._sim_accum + ahead)
 
     def _update(self, dt: int) -> None:
-        if not self._state.is_state(GameState.PLAYING):
-            return
+        update = self._state.handler.update
+        if update is not None:
+            update(dt)
+
+    def _update_playing(self, dt: int) -> None:
+        now = self._game_clock.now_ms()
+        frame_ms = 0.0 if self._last_frame_ms is None else min(now - self._last_frame_ms, constants.MAX_FRAME_MS)
+        self._last_frame_ms = now
+
+        # Chạy mô phỏng theo bước cố định; phần dư được nội suy khi vẽ
+        step = 1000.0 / constants.SIM_HZ
+        self._sim_accum += frame_ms
+        while self._sim_accum >= step:
+            self._sim_accum -= step
+            if not self._step(step):
+                return
+
+        if self._score.mode == "tracking":
+            self._track(frame_ms)
+        self._feedback.update(dt)
 
-        rel_x, rel_y = pygame.mouse.get_rel()
-        sens = getattr(constants, 'MOUSE_SENSITIVITY', 1.0)
-        self._vmouse_x += rel_x * sens
-        self._vmouse_y += rel_y * sens
-        self._vmouse_x = max(0.0, min(float(WIDTH), self._vmouse_x))
-        self._vmouse_y = max(0.0, min(float(HEIGHT), self._vmouse_y))
+    def _track(self, frame_ms: float) -> None:
+        """
+        Score the time the cursor spent on the target during this frame.
 
-        pygame.mouse.set_pos((WIDTH // 2, HEIGHT // 2))
-        pygame.mouse.get_rel()
-        
-        
-        self._game_timer += dt
+        Tracking shows one target at a time (:data:`_TRACKING_TARGETS`;
+        :meth:`_spawn_targets` replaces rather than adds), so it is always
+        slot 0.  With several, time on target would need the union of
+        their intervals rather than one slot's.
+        """
+        if self._targets.count == 0:
+            return
+        times, xs, ys = self._mouse.frame_path()
+        # Wall-clock sample times -> simulation time; the part of a clamped
+        # frame before its start belongs to no frame and is dropped
+        end = self._game_timer + self._sim_accum
+        sim = np.maximum(end - (self._last_frame_ms - times), end - frame_ms)
+        on_ms, total_ms = self._targets.time_on_target(0, sim, xs, ys)
+        if total_ms > 0:
+            self._score.register_tracking(on_ms, total_ms)
+
+    def _step(self, step_ms: float) -> bool:
+        """Advance the round by one fixed step; ``False`` once it has ended."""
+        self._game_timer += step_ms
         if self._game_timer >= constants.GAME_DURATION * 1000:
-            self._target = None
-            pygame.event.set_grab(False)
+            self._targets.clear()
             current_mode = getattr(constants, 'GAME_MODE', 'basic')
             self._score.save_session(current_mode) 
-
             self._state.transition_to(GameState.RESULTS)
-            AssetLoader.play_music("menu_music.mp3", volume=0.35)
-            return
+            return False
 
-        self._diff.update(self._game_timer // 1000)
+        self._diff.update(int(self._game_timer // 1000))
 
-        now = pygame.time.get_ticks()
-        if self._target:
-            if self._target.update(now, WIDTH, HEIGHT) == "timeout":
+        for _ in range(self._targets.update(self._game_timer, WIDTH, HEIGHT)):
+            # Một mục tiêu Tracking hết giờ là bình thường, không phải trượt
+            if self._score.mode != "tracking":
                 self._score.register_miss()
-                self._target        = None
-                self._waiting_spawn = True
-                self._spawn_timer   = _SPAWN_DELAY_MS
+            self._schedule_spawn()
 
         if self._waiting_spawn:
-            self._spawn_timer -= dt
+            self._spawn_timer -= step_ms
             if self._spawn_timer <= 0:
-                self._spawn_target()
+                self._spawn_targets()
+        return True
 
-        self._feedback.update(dt)
+    # ------------------------------------------------------------------
+    # Drawing
+    # ------------------------------------------------------------------
 
-    def _draw_crosshair(self, surface: pygame.Surface) -> None:
+    def _draw_crosshair(self, surface: pygame.Surface) -> pygame.Rect:
         if self._state.is_state(GameState.PLAYING):
-            mx, my = int(self._vmouse_x), int(self._vmouse_y)
+            mx, my = self._mouse.pixel
         else:
             mx, my = pygame.mouse.get_pos()
 
         c  = _CROSSHAIR_COLOR
         sz = getattr(constants, 'CROSSHAIR_SIZE', 16)
         g  = _CROSSHAIR_GAP
-        pygame.draw.line(surface, c, (mx - sz, my), (mx - g, my), 2)
-        pygame.draw.line(surface, c, (mx + g,  my), (mx + sz, my), 2)
-        pygame.draw.line(surface, c, (mx, my - sz), (mx, my - g), 2)
-        pygame.draw.line(surface, c, (mx, my + g),  (mx, my + sz), 2)
+        return pygame.draw.line(surface, c, (mx - sz, my), (mx - g, my), 2).unionall([
+            pygame.draw.line(surface, c, (mx + g,  my), (mx + sz, my), 2),
+            pygame.draw.line(surface, c, (mx, my - sz), (mx, my - g), 2),
+            pygame.draw.line(surface, c, (mx, my + g),  (mx, my + sz), 2),
+        ])
 
     def _draw(self) -> None:
         state = self._state.current_state
 
-        if state == GameState.START:
-            self._start_screen.draw(self._screen)
-            
-        elif state == GameState.MODE_SELECT:
-            self._mode_screen.draw(self._screen)
-            
-        elif state == GameState.INSTRUCTIONS:
-            self._instr_screen.draw(self._screen)
-        
-        elif state == GameState.STATISTICS:
-            self._stats_screen.draw(self._screen)
-        
-        elif state == GameState.SETTINGS:
-            self._settings_screen.draw(self._screen)
-
-        elif state == GameState.PLAYING:
-            self._screen.fill(_BG_COLOR)
-            if self._target:
-                self._target.draw(self._screen)
-            time_left = max(0.0, (constants.GAME_DURATION * 1000 - self._game_timer) / 1000)
-            self._hud.draw(self._screen, time_left)
-            self._feedback.draw(self._screen, self._fonts["medium"])
-            self._draw_crosshair(self._screen)
-
-        elif state == GameState.PAUSED:
-            self._screen.blit(self._game_frame, (0, 0))
-            self._pause_screen.draw(self._screen)
-            self._draw_crosshair(self._screen)
-
-        elif state == GameState.RESULTS:
-            self._results_screen.draw(self._screen)
-
-        if state != GameState.PLAYING: 
-            self._draw_crosshair(self._screen)
-        pygame.display.flip()
+        if state != GameState.PLAYING:
+            # Menus are static between inputs: skip the redraw and the flip
+            # unless something happened since the last drawn frame
+            if state is not self._last_drawn_state:
+                self._menu_policy.invalidate()
+            if not self._menu_policy.should_draw():
+                # Nothing to redraw: use the spare frame to build one of
+                # the remaining screens ahead of its first use
+                if constants.WARM_SCREENS and state == GameState.START:
+                    self._warm_next_screen()
+                return
+
+        self._state.handler.draw()
+        self._last_drawn_state = state
+        if state == GameState.PLAYING:
+            return
 
-    @staticmethod
-    def _quit() -> None:
+        self._draw_crosshair(self._screen)
+        pygame.display.flip()
+        self._timeline.first_frame()
+
+    def _draw_playing(self) -> None:
+        # Only the targets, labels, HUD text and crosshair change while
+        # playing; in dirty-rect mode just their old and new areas are
+        # erased and pushed to the display.
+        dirty = self._dirty
+        if not constants.DIRTY_RECTS or self._last_drawn_state is not GameState.PLAYING:
+            dirty.invalidate()
+        dirty.erase(self._screen, _BG_COLOR)
+        dirty.add(self._targets.draw(self._screen, self._sim_accum * constants.SIM_HZ / 1000.0))
+        time_left = max(0.0, (constants.GAME_DURATION * 1000 - self._game_timer) / 1000)
+        dirty.add(self._hud.draw(self._screen, time_left))
+        dirty.add(self._feedback.draw(self._screen))
+        dirty.add(self._draw_crosshair(self._screen))
+        dirty.present("dirty_rects" if constants.DIRTY_RECTS else "full_flip")
+        # Targets drawn for the first time are visible from now on
+        self._targets.mark_presented(self._game_clock.now_ms(), self._game_timer)
+
+    def _draw_paused(self) -> None:
+        self._screen.blit(self._game_frame, (0, 0))
+        self._screen_for(GameState.PAUSED).draw(self._screen)
+
+    def _quit(self) -> None:
+        # Sessions still queued for the disk are written before exiting
+        self._session_writer.close()
+        logger.info("session writer: %s", self._session_writer.stats())
+        logger.info("mouse input: %s", self._mouse.stats())
+        logger.info("events dispatched: %s", self._state.stats())
+        logger.info("playing frames: %s", self._dirty.stats())
+        logger.info("menu render policy: %s", self._menu_policy.stats())
+        logger.info("audio: %s", self._audio.stats())
+        logger.info("text cache: %s", text_cache.stats())
+        self._sessions.close()
         pygame.quit()
         sys.exit()
@@ -11,9 +11,62 @@ from constants import (
 _GREEN = GREEN
 _RED   = RED
 
+COLOR_STEPS = 32   # life-ratio buckets between green (fresh) and red (expiring)
+_RIM         = 2    # dark outline drawn around the target
+_COLORKEY    = (255, 0, 255)
+
 
 def _lerp_color(c1, c2, t):
-    return tuple(int(c1[i] + (c2[i] - c1[i]) * t) for i in range(3))
+    return (
+        int(c1[0] + (c2[0] - c1[0]) * t),
+        int(c1[1] + (c2[1] - c1[1]) * t),
+        int(c1[2] + (c2[2] - c1[2]) * t),
+    )
+
+
+_BUCKET_COLORS = [_lerp_color(_GREEN, _RED, i / (COLOR_STEPS - 1)) for i in range(COLOR_STEPS)]
+
+# (radius, colour bucket) -> pre-rendered target sprite
+_SPRITE_CACHE: dict[tuple[int, int], pygame.Surface] = {}
+
+
+def _render_sprite(radius: int, color: tuple[int, int, int]) -> pygame.Surface:
+    r    = radius
+    size = 2 * (r + _RIM) + 1
+    c    = (r + _RIM, r + _RIM)
+    # Circles are drawn without antialiasing, so a colour key is enough for
+    # the corners and blits much faster than per-pixel alpha.
+    sprite = pygame.Surface((size, size))
+    sprite.fill(_COLORKEY)
+    sprite.set_colorkey(_COLORKEY, pygame.RLEACCEL)
+    pygame.draw.circle(sprite, (20, 20, 20), c, r + _RIM)
+    pygame.draw.circle(sprite, color,        c, r)
+    pygame.draw.circle(sprite, WHITE,        c, max(1, int(r * 0.55)))
+    pygame.draw.circle(sprite, color,        c, max(1, int(r * 0.35)))
+    pygame.draw.circle(sprite, WHITE,        c, max(1, int(r * 0.15)))
+    return sprite
+
+
+def get_sprite(radius: int, bucket: int) -> pygame.Surface:
+    """Return the cached target sprite for *radius* and colour *bucket*."""
+    key = (radius, bucket)
+    sprite = _SPRITE_CACHE.get(key)
+    if sprite is None:
+        sprite = _render_sprite(radius, _BUCKET_COLORS[bucket])
+        _SPRITE_CACHE[key] = sprite
+    return sprite
+
+
+def color_bucket(life_ratio: float) -> int:
+    """Map a life ratio in ``[0, 1]`` to one of ``COLOR_STEPS`` colour buckets."""
+    return min(COLOR_STEPS - 1, int(life_ratio * (COLOR_STEPS - 1) + 0.5))
+
+
+def warm_sprite_cache(radii) -> None:
+    """Pre-render every colour bucket for each radius in *radii*."""
+    for r in radii:
+        for bucket in range(COLOR_STEPS):
+            get_sprite(r, bucket)
 
 
 class Target:
@@ -63,16 +116,11 @@ class Target:
     def draw(self, surface: pygame.Surface) -> None:
         life_ratio = min(1.0, self._elapsed / self.ttl_ms) if self.ttl_ms > 0 else 0.0
 
-        outer_color = _lerp_color(_GREEN, _RED, life_ratio)
         r = self.radius
 
         dx, dy = int(self.x), int(self.y)
-        
-        pygame.draw.circle(surface, (20, 20, 20),     (dx, dy), r + 2)
-        pygame.draw.circle(surface, outer_color,      (dx, dy), r)
-        pygame.draw.circle(surface, WHITE,            (dx, dy), max(1, int(r * 0.55)))
-        pygame.draw.circle(surface, outer_color,      (dx, dy), max(1, int(r * 0.35)))
-        pygame.draw.circle(surface, WHITE,            (dx, dy), max(1, int(r * 0.15)))
+        sprite = get_sprite(r, color_bucket(life_ratio))
+        surface.blit(sprite, (dx - r - _RIM, dy - r - _RIM))
 
         arc_ratio = max(0.0, 1.0 - life_ratio)
         if arc_ratio > 0.01:
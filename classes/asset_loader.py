@@ -1,6 +1,9 @@
 import os
 import pygame
 
+from classes.font_registry import FontSet, font_registry
+from classes.sound_bank import SoundBank
+
 _BASE       = os.path.join(os.path.dirname(__file__), "..")
 _FONTS_DIR  = os.path.join(_BASE, "assets", "fonts")
 _SOUNDS_DIR = os.path.join(_BASE, "sounds")
@@ -10,7 +13,11 @@ _FALLBACK_FONT = "segoeui"
 
 class AssetLoader:
 
-    def load_fonts(self) -> dict[str, pygame.font.Font]:
+    def load_fonts(self) -> FontSet:
+        """
+        Describe the shared fonts; each one is only created (through the
+        font registry) the first time it is looked up.
+        """
         from constants import FONT_SMALL, FONT_MEDIUM, FONT_LARGE, FONT_TITLE
 
         sizes = {
@@ -20,19 +27,19 @@ class AssetLoader:
             "title":  FONT_TITLE,
         }
 
-        fonts: dict[str, pygame.font.Font] = {}
+        specs: dict[str, tuple] = {}
         for name, size in sizes.items():
             font_path = os.path.join(_FONTS_DIR, "main.ttf")
             if os.path.isfile(font_path):
-                fonts[name] = pygame.font.Font(font_path, size)
+                specs[name] = ("file", font_path, size)
             else:
-                fonts[name] = pygame.font.SysFont(_FALLBACK_FONT, size)
+                specs[name] = ("face", _FALLBACK_FONT, size, False)
 
-        fonts["small_bold"]  = self._make_bold(FONT_SMALL)
-        fonts["medium_bold"] = self._make_bold(FONT_MEDIUM)
-        fonts["large_bold"]  = self._make_bold(FONT_LARGE)
+        specs["small_bold"]  = self._bold_spec(FONT_SMALL)
+        specs["medium_bold"] = self._bold_spec(FONT_MEDIUM)
+        specs["large_bold"]  = self._bold_spec(FONT_LARGE)
 
-        return fonts
+        return FontSet(font_registry, specs)
 
     def load_sounds(self) -> dict[str, pygame.mixer.Sound | None]:
         files = {
@@ -40,39 +47,10 @@ class AssetLoader:
             "shot": "shot.mp3",
         }
 
-        sounds: dict[str, pygame.mixer.Sound | None] = {}
-        for key, filename in files.items():
-            path = os.path.join(_SOUNDS_DIR, filename)
-            sounds[key] = self._load_sound(path)
-
-        return sounds
-
-    @staticmethod
-    def play_music(filename: str, loops: int = -1, volume: float = 0.5) -> None:
-        path = os.path.join(_SOUNDS_DIR, filename)
-        try:
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.set_volume(volume)
-            pygame.mixer.music.play(loops)
-        except Exception:
-            pass
+        return SoundBank(_SOUNDS_DIR).load_all(files)
 
-    @staticmethod
-    def stop_music() -> None:
-        try:
-            pygame.mixer.music.stop()
-        except Exception:
-            pass
-
-    def _make_bold(self, size: int) -> pygame.font.Font:
+    def _bold_spec(self, size: int) -> tuple:
         font_path = os.path.join(_FONTS_DIR, "main-bold.ttf")
         if os.path.isfile(font_path):
-            return pygame.font.Font(font_path, size)
-        return pygame.font.SysFont(_FALLBACK_FONT, size, bold=True)
-
-    @staticmethod
-    def _load_sound(path: str) -> "pygame.mixer.Sound | None":
-        try:
-            return pygame.mixer.Sound(path)
-        except Exception:
-            return None
+            return ("file", font_path, size)
+        return ("face", _FALLBACK_FONT, size, True)
@@ -0,0 +1,147 @@
+"""
+AudioEngine — low-latency playback of sound effects on reserved channels.
+
+The mixer is pre-initialised with a small output buffer (the default adds a
+noticeable delay between click and sound).  Each sound category gets its
+own pool of reserved channels, so shots can never be starved by hits or by
+anything else playing on the free channels.  When every channel of a pool
+is busy the voice that started first is stopped and reused: during rapid
+fire the newest shot always plays.
+"""
+
+from __future__ import annotations
+import logging
+from typing import Optional
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+_FREE_CHANNELS = 4   # unreserved channels left for ad-hoc Sound.play() calls
+
+
+class _ChannelPool:
+    """Reserved channels for one sound category with oldest-voice stealing."""
+
+    def __init__(self, channels: list[pygame.mixer.Channel]) -> None:
+        self._channels = channels
+        self._started  = [0] * len(channels)
+
+    def acquire(self, now_ms: int) -> tuple[pygame.mixer.Channel, bool]:
+        """Return ``(channel, stolen)`` — a free channel, or the oldest voice."""
+        for i, channel in enumerate(self._channels):
+            if not channel.get_busy():
+                self._started[i] = now_ms
+                return channel, False
+        i = min(range(len(self._channels)), key=self._started.__getitem__)
+        self._started[i] = now_ms
+        channel = self._channels[i]
+        channel.stop()
+        return channel, True
+
+
+class AudioEngine:
+    """
+    Plays named sounds on per-category channel pools.
+
+    Typical usage::
+
+        AudioEngine.pre_init()          # before pygame.init()
+        pygame.init()
+        audio = AudioEngine(sounds, {"shot": 8, "hit": 4})
+        audio.play("shot")
+
+    ``played``, ``stolen`` and ``dropped`` count voices started, voices
+    that had to steal a busy channel, and requests that could not play at
+    all (missing sound or no mixer).
+    """
+
+    _requested_buffer: int = 0
+
+    @staticmethod
+    def pre_init(frequency: int = 44100, buffer: int = 256) -> None:
+        """
+        Configure the mixer before ``pygame.init()`` opens the device.
+
+        Args:
+            frequency: Output sample rate in Hz.
+            buffer:    Output buffer size in sample frames; smaller means
+                       lower latency but more risk of underruns.
+        """
+        pygame.mixer.pre_init(frequency, -16, 2, buffer)
+        AudioEngine._requested_buffer = buffer
+
+    def __init__(self, sounds: dict[str, Optional[pygame.mixer.Sound]], pools: dict[str, int]) -> None:
+        """
+        Args:
+            sounds: ``name -> Sound`` (``None`` for sounds that failed to load).
+            pools:  ``name -> number of reserved channels`` for that sound.
+        """
+        self._sounds = sounds
+        self._pools: dict[str, _ChannelPool] = {}
+
+        self.played:  int = 0
+        self.stolen:  int = 0
+        self.dropped: int = 0
+
+        if pygame.mixer.get_init() is None:
+            return
+
+        reserved = sum(pools.values())
+        pygame.mixer.set_num_channels(reserved + _FREE_CHANNELS)
+        pygame.mixer.set_reserved(reserved)
+
+        index = 0
+        for name, size in pools.items():
+            channels = [pygame.mixer.Channel(index + i) for i in range(size)]
+            self._pools[name] = _ChannelPool(channels)
+            index += size
+
+        logger.info("audio output buffer latency ~%.1f ms (estimate)", self.output_latency_estimate_ms)
+
+    def play(self, name: str) -> None:
+        """Play sound *name* on its pool (or any free channel if it has none)."""
+        sound = self._sounds.get(name)
+        if sound is None:
+            self.dropped += 1
+            return
+
+        pool = self._pools.get(name)
+        if pool is None:
+            if sound.play() is None:
+                self.dropped += 1
+                return
+        else:
+            channel, stolen = pool.acquire(pygame.time.get_ticks())
+            channel.play(sound)
+            self.stolen += stolen
+        self.played += 1
+
+    @property
+    def output_latency_estimate_ms(self) -> float:
+        """
+        Estimated latency of the mixer's output buffer (0 without a mixer).
+
+        ``pygame.mixer.get_init()`` reports the frequency the device was
+        opened with but not the buffer size SDL negotiated, so this is the
+        requested buffer played at the negotiated frequency.
+        """
+        init = pygame.mixer.get_init()
+        if init is None or not self._requested_buffer:
+            return 0.0
+        return self._requested_buffer / init[0] * 1000
+
+    def stats(self) -> dict:
+        """Voice counters and the mixer format the device actually opened with."""
+        init = pygame.mixer.get_init()
+        frequency, fmt, channels = init if init is not None else (0, 0, 0)
+        return {
+            "played":                     self.played,
+            "stolen":                     self.stolen,
+            "dropped":                    self.dropped,
+            "frequency":                  frequency,
+            "format":                     fmt,
+            "channels":                   channels,
+            "requested_buffer":           self._requested_buffer,
+            "output_latency_estimate_ms": round(self.output_latency_estimate_ms, 2),
+        }
@@ -0,0 +1,81 @@
+"""
+GameClock — high-resolution monotonic time for reaction-time accounting.
+
+``pygame.time.get_ticks()`` has millisecond resolution and, read inside an
+event handler, also includes however long the event sat in the queue.  The
+clock reads ``time.perf_counter_ns`` and reports float milliseconds since
+its creation.  Input events are stamped with the SDL event timestamp when
+the pygame build exposes one (``event.timestamp``, converted from the
+``get_ticks`` timeline) and otherwise with the moment the queue was pumped.
+
+The time source is injectable so tests and replays can drive it.
+"""
+
+from __future__ import annotations
+import time
+from typing import Callable
+
+import pygame
+
+_NS_PER_MS = 1_000_000
+
+
+class GameClock:
+    """
+    Monotonic clock in float milliseconds.
+
+    Typical usage in the game loop::
+
+        events = pygame.event.get()
+        clock.pumped()                       # stamp the batch
+        for event in events:
+            t = clock.event_time_ms(event)   # when the click happened
+    """
+
+    def __init__(self, source: Callable[[], int] = time.perf_counter_ns) -> None:
+        """
+        Args:
+            source: Nanosecond counter; defaults to ``time.perf_counter_ns``.
+        """
+        self._source = source
+        self._origin = source()
+        self._pump_ms = 0.0
+        self._ticks_offset_ms = 0.0
+
+    def now_ns(self) -> int:
+        return self._source() - self._origin
+
+    def now_ms(self) -> float:
+        return self.now_ns() / _NS_PER_MS
+
+    def pumped(self) -> float:
+        """
+        Record that the event queue was just read; returns the pump time.
+
+        Also re-measures the offset between this clock and SDL's tick
+        counter, used to convert native event timestamps.
+        """
+        self._pump_ms = self.now_ms()
+        if pygame.get_init():
+            self._ticks_offset_ms = self._pump_ms - pygame.time.get_ticks()
+        return self._pump_ms
+
+    @property
+    def pump_ms(self) -> float:
+        return self._pump_ms
+
+    def event_time_ms(self, event: pygame.event.Event) -> float:
+        """
+        When *event* happened, on this clock.
+
+        Uses the SDL timestamp if the event carries one (never later than
+        the pump), otherwise the time of the last :meth:`pumped` call.
+        """
+        ticks = getattr(event, "timestamp", None)
+        if ticks is None:
+            return self._pump_ms
+        return min(self._pump_ms, ticks + self._ticks_offset_ms)
+
+
+# Shared instance for code that is not handed a clock explicitly
+game_clock = GameClock()
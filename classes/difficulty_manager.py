@@ -31,6 +31,19 @@ class DifficultyManager:
             constants.INITIAL_RADIUS - radius_steps * RADIUS_DECREASE_AMOUNT,
         )
 
+    def radius_schedule(self) -> list[int]:
+        """
+        Every radius ``reset``/``update`` can produce with the current
+        settings, largest first — used to warm the target sprite cache.
+        """
+        radii = {MIN_RADIUS}
+        for start in (INITIAL_RADIUS, constants.INITIAL_RADIUS):
+            r = start
+            while r > MIN_RADIUS:
+                radii.add(r)
+                r -= RADIUS_DECREASE_AMOUNT
+        return sorted(radii, reverse=True)
+
     def reset(self) -> None:
         self.current_ttl    = INITIAL_TTL
         self.current_radius = INITIAL_RADIUS
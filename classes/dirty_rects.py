@@ -0,0 +1,126 @@
+"""
+DirtyRectRenderer — partial display updates for frames with little motion.
+
+During a round only the targets, the crosshair, the floating labels and a
+few HUD strings change; the rest of the screen is plain background.  The
+renderer remembers which rectangles were drawn last frame, erases exactly
+those with the background colour, collects the rectangles drawn this
+frame, and hands the union of both sets to ``pygame.display.update``.
+When too much of the screen is dirty a single full flip is cheaper, so it
+falls back to ``pygame.display.flip``.
+
+Each frame is timed from :meth:`DirtyRectRenderer.erase` to the end of
+:meth:`DirtyRectRenderer.present` (drawing plus the display update) and
+the times are kept per rendering mode, so dirty-rect and full-flip rounds
+can be compared on the same display through :meth:`stats`.
+"""
+
+from __future__ import annotations
+import time
+from typing import Iterable
+
+import pygame
+
+_DEFAULT_THRESHOLD = 0.5   # fraction of the screen above which a full flip is used
+
+
+class DirtyRectRenderer:
+    """
+    Tracks previous and current dirty rectangles for one display surface.
+
+    Typical usage inside the draw step::
+
+        renderer.erase(screen, BG_COLOR)      # clears last frame's rects
+        renderer.add(targets.draw(screen))
+        renderer.add(hud.draw(screen, time_left))
+        renderer.present("dirty_rects")       # update(rects) or flip()
+    """
+
+    def __init__(self, size: tuple[int, int], threshold: float = _DEFAULT_THRESHOLD) -> None:
+        """
+        Args:
+            size:      Display size in pixels.
+            threshold: Fraction of the screen area that, once dirty, makes
+                       the renderer flip the whole display instead.
+        """
+        self._bounds    = pygame.Rect((0, 0), size)
+        self._threshold = threshold
+        self._previous: list[pygame.Rect] = []
+        self._current:  list[pygame.Rect] = []
+        self._full_redraw = True
+
+        self.full_frames:    int = 0
+        self.partial_frames: int = 0
+
+        # Frame times per mode label passed to present(): [frames, total s, max s]
+        self._frame_start = 0.0
+        self._frame_times: dict[str, list] = {}
+
+    def invalidate(self) -> None:
+        """Force the next frame to be cleared and flipped in full."""
+        self._full_redraw = True
+
+    @property
+    def needs_full_redraw(self) -> bool:
+        return self._full_redraw
+
+    def erase(self, surface: pygame.Surface, color: tuple[int, int, int]) -> None:
+        """Fill last frame's dirty rects (or the whole surface) with *color*."""
+        self._frame_start = time.perf_counter()
+        if self._full_redraw:
+            surface.fill(color)
+            return
+        for rect in self._previous:
+            surface.fill(color, rect)
+
+    def add(self, rects: pygame.Rect | Iterable[pygame.Rect] | None) -> None:
+        """Record one rect or an iterable of rects drawn this frame."""
+        if rects is None:
+            return
+        if isinstance(rects, pygame.Rect):
+            self._current.append(rects.clip(self._bounds))
+        else:
+            bounds = self._bounds
+            self._current.extend(r.clip(bounds) for r in rects)
+
+    def present(self, mode: str = "dirty_rects") -> None:
+        """
+        Push this frame to the display and roll current rects to previous.
+
+        Args:
+            mode: Label the frame's time is recorded under in :meth:`stats`.
+        """
+        dirty = self._previous + self._current
+        area  = sum(r.w * r.h for r in dirty)
+
+        if self._full_redraw or area > self._threshold * self._bounds.w * self._bounds.h:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(dirty)
+            self.partial_frames += 1
+
+        self._previous, self._current = self._current, self._previous
+        self._current.clear()
+        self._full_redraw = False
+
+        elapsed = time.perf_counter() - self._frame_start
+        times = self._frame_times.setdefault(mode, [0, 0.0, 0.0])
+        times[0] += 1
+        times[1] += elapsed
+        times[2] = max(times[2], elapsed)
+
+    def stats(self) -> dict:
+        """Flip/partial counts and draw-to-display frame times per mode."""
+        return {
+            "full_frames":    self.full_frames,
+            "partial_frames": self.partial_frames,
+            "frame_ms": {
+                mode: {
+                    "frames":  frames,
+                    "mean_ms": round(total / frames * 1000, 3),
+                    "max_ms":  round(worst * 1000, 3),
+                }
+                for mode, (frames, total, worst) in self._frame_times.items()
+            },
+        }
@@ -1,9 +1,13 @@
 """
 FeedbackManager — animated floating hit / miss labels drawn over the game.
 
-Each feedback entry is a small dict that tracks its screen position, the
-text to display, a remaining lifetime, the elapsed time (used to compute
-the upward float offset), and a colour.
+Labels live in a fixed-capacity pool of ``__slots__`` records.  Each record
+tracks its screen position, a remaining lifetime and the elapsed time (used
+to compute the upward float offset), and owns a pre-rendered label surface
+(text plus drop-shadow) that is composed once when the label is spawned.
+Expired slots go back on a free list and are reused, so spam-clicking
+allocates nothing per frame; a slot only re-composes its surface when it is
+reused for a different text.
 """
 
 from __future__ import annotations
@@ -11,6 +15,8 @@ from typing import Optional
 
 import pygame
 
+from classes.text_cache import render_text
+
 # ---------------------------------------------------------------------------
 # Colour palette
 # ---------------------------------------------------------------------------
@@ -25,6 +31,26 @@ SHADOW = (20,  20,  20)
 _HIT_LIFETIME_MS   = 800    # ms a hit label stays visible
 _MISS_LIFETIME_MS  = 600    # ms a miss label stays visible
 _FLOAT_SPEED       = 0.06   # pixels of upward travel per ms of elapsed time
+_SHADOW_OFFSET     = 2      # drop-shadow offset in pixels (right and down)
+_DEFAULT_CAPACITY  = 256    # labels alive at once; the oldest is recycled beyond this
+
+
+class _Label:
+    """One slot of the label pool."""
+
+    __slots__ = ("x", "y", "timer", "elapsed", "lifetime", "text", "color", "surf", "half_w", "h")
+
+    def __init__(self) -> None:
+        self.x:        float = 0.0
+        self.y:        float = 0.0
+        self.timer:    float = 0.0
+        self.elapsed:  float = 0.0
+        self.lifetime: float = 1.0
+        self.text:     str   = ""
+        self.color:    tuple[int, int, int] = WHITE
+        self.surf:     Optional[pygame.Surface] = None
+        self.half_w:   int = 0
+        self.h:        int = 0
 
 
 class FeedbackManager:
@@ -34,7 +60,7 @@ class FeedbackManager:
     Typical usage inside the game loop::
 
         # once, after constructing:
-        fb = FeedbackManager()
+        fb = FeedbackManager(font)
 
         # on a hit:
         fb.add_hit_feedback(mouse_pos, points)
@@ -44,12 +70,20 @@ class FeedbackManager:
 
         # every frame (dt is milliseconds since last tick):
         fb.update(dt)
-        fb.draw(surface, font)
+        fb.draw(surface)
     """
 
-    def __init__(self) -> None:
-        """Initialise with an empty list of active feedback entries."""
-        self._entries: list[dict] = []
+    def __init__(self, font: pygame.font.Font, capacity: int = _DEFAULT_CAPACITY) -> None:
+        """
+        Args:
+            font:     Font used to render every label.
+            capacity: Maximum number of labels alive at once.
+        """
+        self._font   = font
+        self._slots  = [_Label() for _ in range(capacity)]
+        self._free   = list(range(capacity - 1, -1, -1))   # popped from the end
+        self._active: list[int] = []
+        self._blit_seq: list[tuple[pygame.Surface, tuple[int, int]]] = []
 
     # ------------------------------------------------------------------
     # Adding entries
@@ -63,14 +97,7 @@ class FeedbackManager:
             pos:    (x, y) pixel position — typically the click location.
             points: Points awarded for the hit; displayed after a ``+`` sign.
         """
-        self._entries.append({
-            "text":    f"+{points}",
-            "x":       float(pos[0]),
-            "y":       float(pos[1]),
-            "timer":   _HIT_LIFETIME_MS,
-            "elapsed": 0.0,
-            "color":   YELLOW,
-        })
+        self._spawn(pos, f"+{points}", YELLOW, _HIT_LIFETIME_MS)
 
     def add_miss_feedback(self, pos: tuple[int, int]) -> None:
         """
@@ -79,14 +106,40 @@ class FeedbackManager:
         Args:
             pos: (x, y) pixel position — typically the click location.
         """
-        self._entries.append({
-            "text":    "MISS",
-            "x":       float(pos[0]),
-            "y":       float(pos[1]),
-            "timer":   _MISS_LIFETIME_MS,
-            "elapsed": 0.0,
-            "color":   RED,
-        })
+        self._spawn(pos, "MISS", RED, _MISS_LIFETIME_MS)
+
+    def _spawn(self, pos: tuple[int, int], text: str, color: tuple[int, int, int], lifetime: float) -> None:
+        if self._free:
+            idx = self._free.pop()
+            self._active.append(idx)
+        else:
+            # Pool exhausted: recycle the label closest to expiring
+            idx = min(self._active, key=lambda i: self._slots[i].timer)
+
+        slot = self._slots[idx]
+        slot.x        = float(pos[0])
+        slot.y        = float(pos[1])
+        slot.timer    = lifetime
+        slot.elapsed  = 0.0
+        slot.lifetime = lifetime
+
+        if slot.surf is None or slot.text != text or slot.color != color:
+            slot.text  = text
+            slot.color = color
+            slot.surf  = self._compose(text, color)
+            slot.half_w = (slot.surf.get_width() - _SHADOW_OFFSET) // 2
+            slot.h      = slot.surf.get_height() - _SHADOW_OFFSET
+
+    def _compose(self, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        """Render *text* and its drop-shadow into one per-slot surface."""
+        shadow_surf = render_text(self._font, text, SHADOW)
+        text_surf   = render_text(self._font, text, color)
+        w, h = text_surf.get_size()
+        label = pygame.Surface((w + _SHADOW_OFFSET, h + _SHADOW_OFFSET), pygame.SRCALPHA)
+        label.fill((*SHADOW, 0))
+        label.blit(shadow_surf, (_SHADOW_OFFSET, _SHADOW_OFFSET))
+        label.blit(text_surf, (0, 0))
+        return label
 
     # ------------------------------------------------------------------
     # Update & draw
@@ -94,54 +147,57 @@ class FeedbackManager:
 
     def update(self, dt: float) -> None:
         """
-        Advance all feedback entries by *dt* milliseconds and remove
-        any whose lifetime has expired.
+        Advance all feedback entries by *dt* milliseconds and return
+        any whose lifetime has expired to the free list.
 
         Args:
             dt: Delta time in milliseconds since the last frame.
         """
-        for entry in self._entries:
-            entry["timer"]   -= dt
-            entry["elapsed"] += dt
-
-        self._entries = [e for e in self._entries if e["timer"] > 0]
-
-    def draw(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
+        slots  = self._slots
+        active = self._active
+        keep   = 0
+        for idx in active:
+            slot = slots[idx]
+            slot.timer   -= dt
+            slot.elapsed += dt
+            if slot.timer > 0:
+                active[keep] = idx
+                keep += 1
+            else:
+                self._free.append(idx)
+        del active[keep:]
+
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect]:
         """
         Render all active feedback labels onto *surface*.
 
         Labels float upward over time and fade in opacity as their lifetime
-        expires.  A dark drop-shadow is drawn two pixels below-right for
-        legibility against any background.
+        expires.  All labels are submitted in a single ``Surface.blits``
+        call.
 
         Args:
             surface: Destination surface.
-            font:    Font used to render each label.
-        """
-        for entry in self._entries:
-            # Compute upward offset based on how long the entry has been alive
-            y_offset = entry["elapsed"] * _FLOAT_SPEED
-
-            draw_x = int(entry["x"])
-            draw_y = int(entry["y"] - y_offset)
-
-            # Determine lifetime fraction remaining (1.0 → fresh, 0.0 → expired)
-            lifetime = _HIT_LIFETIME_MS if entry["color"] == YELLOW else _MISS_LIFETIME_MS
-            alpha_frac = max(0.0, entry["timer"] / lifetime)
-            alpha = int(alpha_frac * 255)
 
-            # Render to a temporary surface so we can apply per-pixel alpha
-            shadow_surf = font.render(entry["text"], True, SHADOW)
-            text_surf   = font.render(entry["text"], True, entry["color"])
-
-            shadow_surf.set_alpha(alpha)
-            text_surf.set_alpha(alpha)
-
-            shadow_rect = shadow_surf.get_rect(midbottom=(draw_x + 2, draw_y + 2))
-            text_rect   = text_surf.get_rect(midbottom=(draw_x, draw_y))
-
-            surface.blit(shadow_surf, shadow_rect)
-            surface.blit(text_surf,   text_rect)
+        Returns:
+            The rectangles that were drawn to.
+        """
+        seq = self._blit_seq
+        seq.clear()
+        for idx in self._active:
+            slot = self._slots[idx]
+            # Lifetime fraction remaining (1.0 → fresh, 0.0 → expired)
+            alpha = int(max(0.0, slot.timer / slot.lifetime) * 255)
+            slot.surf.set_alpha(alpha)
+
+            # Upward offset based on how long the label has been alive;
+            # the label's text is anchored by its midbottom
+            draw_x = int(slot.x) - slot.half_w
+            draw_y = int(slot.y - slot.elapsed * _FLOAT_SPEED) - slot.h
+            seq.append((slot.surf, (draw_x, draw_y)))
+
+        if not seq:
+            return []
+        return surface.blits(seq)
 
     # ------------------------------------------------------------------
     # Utility
@@ -149,9 +205,10 @@ class FeedbackManager:
 
     def clear(self) -> None:
         """Remove all active feedback entries (e.g. on round reset)."""
-        self._entries.clear()
+        self._free.extend(self._active)
+        self._active.clear()
 
     @property
     def active_count(self) -> int:
         """Number of feedback labels currently alive."""
-        return len(self._entries)
+        return len(self._active)
@@ -0,0 +1,171 @@
+"""
+FontRegistry — one place that creates every ``pygame.font.Font``.
+
+Fonts are deduplicated by ``(face, size, bold)`` and only created the first
+time they are asked for.  Resolving a system face name (``SysFont``) makes
+pygame scan every installed font, which is slow on Linux where it shells
+out to ``fc-list``.  The registry records what ``SysFont`` resolved each
+``(face, bold)`` pair to — the font file and whether bold had to be faked —
+in a small JSON cache, so later launches open the file directly and never
+trigger the system font scan.  Delete the cache file after installing or
+removing fonts to have names resolved again.
+"""
+
+from __future__ import annotations
+import json
+import os
+import time
+from collections.abc import Mapping
+from typing import Iterator, Optional
+
+import pygame
+
+_BASE       = os.path.join(os.path.dirname(__file__), "..")
+_CACHE_PATH = os.path.join(_BASE, ".cache", "fonts.json")
+
+DEFAULT_FACE = "segoeui"
+
+
+class FontRegistry:
+    """
+    Deduplicating, lazily populated font store with a persisted
+    face-name resolution cache.
+
+    ``resolve_ms`` accumulates the time spent resolving face names and
+    ``system_scans`` counts how many resolutions needed ``SysFont``; on a
+    warm cache the latter stays at zero.
+    """
+
+    def __init__(self, cache_path: str = _CACHE_PATH) -> None:
+        """
+        Args:
+            cache_path: JSON file holding resolved font paths between runs.
+        """
+        self._cache_path = cache_path
+        self._fonts: dict[tuple, pygame.font.Font] = {}
+        self._resolved: dict[str, list] = self._load_cache()
+
+        self.fonts_created: int   = 0
+        self.system_scans:  int   = 0
+        self.resolve_ms:    float = 0.0
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get(self, face: str, size: int, bold: bool = False) -> pygame.font.Font:
+        """Return the font for a system *face* name, creating it on first use."""
+        key = (face, size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            path, fake_bold = self._resolve(face, bold)
+            font = self._open(path, size)
+            if fake_bold:
+                font.set_bold(True)
+            self._fonts[key] = font
+        return font
+
+    def get_file(self, path: str, size: int) -> pygame.font.Font:
+        """Return the font for a font *path* on disk, creating it on first use."""
+        key = (os.path.abspath(path), size, False)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._open(path, size)
+            self._fonts[key] = font
+        return font
+
+    def _open(self, path: Optional[str], size: int) -> pygame.font.Font:
+        self.fonts_created += 1
+        return pygame.font.Font(path, size)
+
+    # ------------------------------------------------------------------
+    # Face-name resolution
+    # ------------------------------------------------------------------
+
+    def _resolve(self, face: str, bold: bool) -> tuple[Optional[str], bool]:
+        """
+        Return ``(font file or None, fake bold)`` for *face*, exactly as
+        ``SysFont`` would pick it.  ``None`` means pygame's default font.
+        """
+        start = time.perf_counter()
+        cache_key = f"{face}|{int(bold)}"
+        entry = self._resolved.get(cache_key)
+        if entry is not None and (entry[0] is None or os.path.isfile(entry[0])):
+            self.resolve_ms += (time.perf_counter() - start) * 1000
+            return entry[0], entry[1]
+
+        resolved: list = []
+
+        def _record(fontpath, size, set_bold, set_italic):
+            resolved[:] = [fontpath, bool(set_bold)]
+            return None
+
+        self.system_scans += 1
+        pygame.font.SysFont(face, 1, bold=bold, constructor=_record)
+        self._resolved[cache_key] = resolved
+        self._save_cache()
+        self.resolve_ms += (time.perf_counter() - start) * 1000
+        return resolved[0], resolved[1]
+
+    def _load_cache(self) -> dict[str, list]:
+        try:
+            with open(self._cache_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save_cache(self) -> None:
+        tmp = self._cache_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self._cache_path), exist_ok=True)
+            with open(tmp, "w") as f:
+                json.dump(self._resolved, f, indent=4)
+            os.replace(tmp, self._cache_path)
+        except OSError:
+            pass   # the cache is an optimisation; a read-only install still works
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "fonts_created": self.fonts_created,
+            "system_scans":  self.system_scans,
+            "resolve_ms":    round(self.resolve_ms, 2),
+        }
+
+
+class FontSet(Mapping):
+    """
+    Read-only mapping of font names to fonts that are only created when
+    looked up, e.g. ``fonts["medium"]``.
+    """
+
+    def __init__(self, registry: FontRegistry, specs: dict[str, tuple]) -> None:
+        """
+        Args:
+            registry: Registry that creates the fonts.
+            specs:    ``name -> ("file", path, size)`` or
+                      ``name -> ("face", face, size, bold)``.
+        """
+        self._registry = registry
+        self._specs    = specs
+
+    def __getitem__(self, name: str) -> pygame.font.Font:
+        spec = self._specs[name]
+        if spec[0] == "file":
+            return self._registry.get_file(spec[1], spec[2])
+        return self._registry.get(spec[1], spec[2], spec[3])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+
+# Shared registry used by the asset loader and every screen.
+font_registry = FontRegistry()
+
+
+def get_font(size: int, bold: bool = False, face: str = DEFAULT_FACE) -> pygame.font.Font:
+    """Return a system font from the shared :data:`font_registry`."""
+    return font_registry.get(face, size, bold)
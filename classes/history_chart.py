@@ -0,0 +1,308 @@
+"""
+HistoryChart — line chart of a long per-session series with pan and zoom.
+
+A kiosk can collect hundreds of thousands of sessions; drawing one vertex
+per session would be both slow and unreadable.  The series is reduced to
+about one point per horizontal pixel with a Largest-Triangle-Three-Buckets
+style downsampling that keeps peaks and dips visible, computed with NumPy.
+
+Zoom levels are discrete (each wheel step is a factor of
+``_ZOOM_STEP``).  For each level the whole series is downsampled once at
+that level's resolution and cached, so panning only slices the cached
+indices with ``searchsorted``.  The rendered chart is also kept until the
+view changes.
+"""
+
+from __future__ import annotations
+import math
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+import numpy as np
+import pygame
+
+from classes.text_cache import render_text
+
+_BG_COLOR      = (30, 30, 30)
+_BORDER_COLOR  = (180, 180, 180)
+_GRID_COLOR    = (55, 55, 65)
+_LINE_COLOR    = (50, 120, 200)
+_AVG_COLOR     = (255, 215, 0)
+_LABEL_COLOR   = (180, 180, 180)
+
+_PAD           = 12       # inner padding around the plot area
+_ZOOM_STEP     = 1.25     # span ratio between neighbouring zoom levels
+_MIN_SPAN      = 10       # sessions visible at the deepest zoom
+_CACHE_LEVELS  = 32       # downsampled (series, level) results kept
+
+
+# ---------------------------------------------------------------------------
+# Downsampling
+# ---------------------------------------------------------------------------
+
+def lttb_indices(y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Indices of *threshold* points of *y* that preserve its visual shape.
+
+    This is Largest-Triangle-Three-Buckets with one change that makes it
+    fully vectorised: the triangle's left vertex is the mean of the
+    previous bucket instead of the point selected there, so all buckets
+    are solved at once.  The first and last points are always kept.
+
+    Args:
+        y:         Series values, x is the sample index.
+        threshold: Number of points wanted (>= 3).
+
+    Returns:
+        Sorted ``int64`` indices into *y*.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n, dtype=np.int64)
+
+    # threshold - 2 buckets over the interior points [1, n - 1)
+    edges  = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    starts = edges[:-1]
+    counts = np.diff(edges)
+
+    csum   = np.concatenate(([0.0], np.cumsum(y, dtype=np.float64)))
+    mean_y = (csum[edges[1:]] - csum[starts]) / counts
+    mean_x = (starts + edges[1:] - 1) / 2.0
+
+    # Left vertex: previous bucket's mean; right vertex: next bucket's mean
+    ax = np.concatenate(([0.0], mean_x[:-1]))
+    ay = np.concatenate(([float(y[0])], mean_y[:-1]))
+    cx = np.concatenate((mean_x[1:], [float(n - 1)]))
+    cy = np.concatenate((mean_y[1:], [float(y[-1])]))
+
+    bucket = np.repeat(np.arange(len(counts)), counts)
+    xi     = np.arange(1, n - 1, dtype=np.float64)
+    yi     = y[1:n - 1]
+    area   = np.abs((ax[bucket] - cx[bucket]) * (yi - ay[bucket])
+                    - (ax[bucket] - xi) * (cy[bucket] - ay[bucket]))
+
+    # First point of each bucket that reaches the bucket's maximum area
+    best  = np.maximum.reduceat(area, starts - 1)
+    hits  = np.flatnonzero(area == best[bucket])
+    _, first = np.unique(bucket[hits], return_index=True)
+    chosen = hits[first] + 1
+
+    return np.concatenate(([0], chosen, [n - 1])).astype(np.int64)
+
+
+def rolling_mean(y: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean over *window* samples (shorter at the start)."""
+    if len(y) == 0:
+        return y.astype(np.float64)
+    csum = np.concatenate(([0.0], np.cumsum(y, dtype=np.float64)))
+    idx  = np.arange(1, len(y) + 1)
+    lo   = np.maximum(0, idx - window)
+    return (csum[idx] - csum[lo]) / (idx - lo)
+
+
+# ---------------------------------------------------------------------------
+# Chart
+# ---------------------------------------------------------------------------
+
+class HistoryChart:
+    """
+    Interactive chart of one series: drag to pan, mouse wheel to zoom.
+
+    Typical usage::
+
+        chart = HistoryChart(pygame.Rect(400, 130, 840, 430), font)
+        chart.set_series(("score", None), scores)
+        ...
+        chart.handle_event(event)
+        chart.draw(surface)
+    """
+
+    def __init__(self, rect: pygame.Rect, font: pygame.font.Font, window: int = 20) -> None:
+        """
+        Args:
+            rect:   Screen area of the chart.
+            font:   Font for the axis labels.
+            window: Sessions in the rolling average.
+        """
+        self.rect    = pygame.Rect(rect)
+        self._font   = font
+        self._window = window
+        self._plot   = self.rect.inflate(-2 * _PAD, -2 * _PAD - 40)
+        self._plot.top = self.rect.top + _PAD + 24
+
+        self._key: Hashable = None
+        self._y   = np.zeros(0)
+        self._avg = np.zeros(0)
+        self._level = 0
+        self._start = 0.0          # first visible session index
+        self._drag_x: Optional[int] = None
+        self._drag_start = 0.0
+
+        self._levels: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self._surface: Optional[pygame.Surface] = None
+        self._surface_key: Optional[tuple] = None
+
+    # ------------------------------------------------------------------
+    # Data
+    # ------------------------------------------------------------------
+
+    def set_series(self, key: Hashable, values: np.ndarray) -> None:
+        """Show *values* (one per session, oldest first), fully zoomed out."""
+        self._key   = key
+        self._y     = np.asarray(values, dtype=np.float64)
+        self._avg   = rolling_mean(self._y, self._window)
+        self._level = 0
+        self._start = 0.0
+        self._surface_key = None
+
+    def clear_cache(self) -> None:
+        """Drop downsampled levels (call when the underlying data changed)."""
+        self._levels.clear()
+        self._surface_key = None
+
+    @property
+    def _max_level(self) -> int:
+        n = len(self._y)
+        if n <= _MIN_SPAN:
+            return 0
+        return int(math.ceil(math.log(n / _MIN_SPAN, _ZOOM_STEP)))
+
+    def _span(self, level: int) -> float:
+        n = len(self._y)
+        return max(min(n, _MIN_SPAN), n / _ZOOM_STEP ** level)
+
+    def _level_indices(self, level: int) -> np.ndarray:
+        """Downsampled indices of the whole series at *level* (cached)."""
+        key = (self._key, len(self._y), level, self._plot.width)
+        idx = self._levels.get(key)
+        if idx is not None:
+            self._levels.move_to_end(key)
+            return idx
+        points = int(self._plot.width * len(self._y) / self._span(level))
+        idx = lttb_indices(self._y, points)
+        self._levels[key] = idx
+        if len(self._levels) > _CACHE_LEVELS:
+            self._levels.popitem(last=False)
+        return idx
+
+    # ------------------------------------------------------------------
+    # Input
+    # ------------------------------------------------------------------
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Pan/zoom on mouse input; returns ``True`` if the event was used."""
+        n = len(self._y)
+        if n < 2:
+            return False
+
+        if event.type == pygame.MOUSEWHEEL:
+            mx, my = pygame.mouse.get_pos()
+            if not self.rect.collidepoint(mx, my):
+                return False
+            self._zoom(event.y, mx)
+            return True
+
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.rect.collidepoint(event.pos):
+            self._drag_x = event.pos[0]
+            self._drag_start = self._start
+            return True
+
+        if event.type == pygame.MOUSEBUTTONUP and event.button == 1 and self._drag_x is not None:
+            self._drag_x = None
+            return True
+
+        if event.type == pygame.MOUSEMOTION and self._drag_x is not None:
+            per_px = self._span(self._level) / self._plot.width
+            self._start = self._drag_start - (event.pos[0] - self._drag_x) * per_px
+            self._clamp()
+            return True
+        return False
+
+    def _zoom(self, steps: int, mouse_x: int) -> None:
+        level = max(0, min(self._max_level, self._level + steps))
+        if level == self._level:
+            return
+        # Keep the session under the cursor in place
+        frac   = min(1.0, max(0.0, (mouse_x - self._plot.left) / self._plot.width))
+        anchor = self._start + frac * self._span(self._level)
+        self._level = level
+        self._start = anchor - frac * self._span(level)
+        self._clamp()
+
+    def _clamp(self) -> None:
+        n = len(self._y)
+        self._start = max(0.0, min(self._start, n - self._span(self._level)))
+
+    # ------------------------------------------------------------------
+    # Drawing
+    # ------------------------------------------------------------------
+
+    def draw(self, surface: pygame.Surface, title: str = "") -> None:
+        # Quantised to whole pixels of pan, so sub-pixel drags reuse the image
+        offset = round(self._start / self._span(self._level) * self._plot.width) if len(self._y) else 0
+        key = (self._key, len(self._y), self._level, offset, title)
+        if self._surface is None or self._surface_key != key:
+            self._surface = self._render(title)
+            self._surface_key = key
+        surface.blit(self._surface, self.rect)
+
+    def _render(self, title: str) -> pygame.Surface:
+        layer = pygame.Surface(self.rect.size)
+        local = layer.get_rect()
+        plot  = self._plot.move(-self.rect.x, -self.rect.y)
+        pygame.draw.rect(layer, _BG_COLOR, local, border_radius=8)
+        pygame.draw.rect(layer, _BORDER_COLOR, local, width=2, border_radius=8)
+        if title:
+            head = render_text(self._font, title, (255, 255, 255))
+            layer.blit(head, head.get_rect(midtop=(local.centerx, _PAD - 4)))
+
+        n = len(self._y)
+        if n < 2:
+            msg = render_text(self._font, "Not enough sessions yet", _LABEL_COLOR)
+            layer.blit(msg, msg.get_rect(center=plot.center))
+            return layer
+
+        span  = self._span(self._level)
+        first = int(self._start)
+        last  = min(n - 1, int(math.ceil(self._start + span)))
+
+        idx = self._level_indices(self._level)
+        lo, hi = np.searchsorted(idx, [first, last])
+        # One point beyond each edge so the line reaches the border
+        idx = idx[max(0, lo - 1):min(len(idx), hi + 2)]
+
+        raw = self._y[idx]
+        avg = self._avg[idx]
+        y_min = float(min(raw.min(), avg.min()))
+        y_max = float(max(raw.max(), avg.max()))
+        if y_max - y_min < 1e-9:
+            y_max = y_min + 1.0
+
+        px = plot.left + (idx - self._start) / span * plot.width
+        def to_points(values: np.ndarray) -> list[tuple[float, float]]:
+            py = plot.bottom - (values - y_min) / (y_max - y_min) * plot.height
+            return list(zip(px.tolist(), py.tolist()))
+
+        for i in range(5):
+            gy = plot.top + plot.height * i // 4
+            pygame.draw.line(layer, _GRID_COLOR, (plot.left, gy), (plot.right, gy))
+
+        clip = layer.get_clip()
+        layer.set_clip(plot.inflate(2, 2))
+        if len(idx) >= 2:
+            pygame.draw.lines(layer, _LINE_COLOR, False, to_points(raw))
+            pygame.draw.aalines(layer, _AVG_COLOR, False, to_points(avg))
+        layer.set_clip(clip)
+
+        # Axis labels: value range on the left, session range underneath
+        top    = render_text(self._font, f"{y_max:.0f}", _LABEL_COLOR)
+        bottom = render_text(self._font, f"{y_min:.0f}", _LABEL_COLOR)
+        layer.blit(top,    top.get_rect(topleft=(plot.left + 4, plot.top + 2)))
+        layer.blit(bottom, bottom.get_rect(bottomleft=(plot.left + 4, plot.bottom - 2)))
+        left  = render_text(self._font, f"#{first + 1}", _LABEL_COLOR)
+        right = render_text(self._font, f"#{last + 1}", _LABEL_COLOR)
+        layer.blit(left,  left.get_rect(topleft=(plot.left, plot.bottom + 4)))
+        layer.blit(right, right.get_rect(topright=(plot.right, plot.bottom + 4)))
+        legend = render_text(self._font, f"{self._window}-game average", _AVG_COLOR)
+        layer.blit(legend, legend.get_rect(midtop=(plot.centerx, plot.bottom + 4)))
+        return layer
@@ -1,8 +1,11 @@
 from __future__ import annotations
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 import math
 import pygame
 
+from classes.text_cache import render_text
+
 if TYPE_CHECKING:
     from classes.score_manager import ScoreManager
 
@@ -15,6 +18,11 @@ HUD_BG       = (0,   0,   0, 160)   # used only when blitting onto a temp surfac
 # Padding from screen edges
 _MARGIN = 14
 
+# Combo banner glow: blit offsets of the coloured copy around the white core
+_GLOW_OFFSETS = [(-3, -3), (3, -3), (-3, 3), (3, 3), (-4, 0), (4, 0), (0, -4), (0, 4)]
+_GLOW_PAD     = 4
+_COMBO_CACHE_SIZE = 8   # composed banners kept; older combo values are evicted
+
 
 class HUD:
     """
@@ -23,7 +31,7 @@ class HUD:
     The HUD displays three zones:
     - Top-left  → time remaining
     - Top-centre → current score
-    - Top-right  → hit / miss counters
+    - Top-right  → hit / miss counters (time on target in tracking mode)
     """
 
     def __init__(self, font: pygame.font.Font, score_manager: ScoreManager) -> None:
@@ -35,6 +43,8 @@ class HUD:
         self._font  = font
         self._sm    = score_manager
 
+        self._combo_cache: OrderedDict[tuple[int, int], pygame.Surface] = OrderedDict()
+
     # ------------------------------------------------------------------
     # Drawing helpers
     # ------------------------------------------------------------------
@@ -46,7 +56,7 @@ class HUD:
         pos: tuple[int, int],
         color: tuple[int, int, int] = WHITE,
         anchor: str = "topleft",
-    ) -> None:
+    ) -> pygame.Rect:
         """
         Blit *text* onto *surface* with a 2-px dark drop-shadow.
 
@@ -56,9 +66,12 @@ class HUD:
             pos:     (x, y) reference point; interpretation depends on *anchor*.
             color:   Foreground colour.
             anchor:  One of ``"topleft"``, ``"midtop"``, or ``"topright"``.
+
+        Returns:
+            The area covered by the text and its shadow.
         """
-        shadow_surf = self._font.render(text, True, SHADOW)
-        text_surf   = self._font.render(text, True, color)
+        shadow_surf = render_text(self._font, text, SHADOW)
+        text_surf   = render_text(self._font, text, color)
 
         shadow_rect = shadow_surf.get_rect()
         text_rect   = text_surf.get_rect()
@@ -72,39 +85,78 @@ class HUD:
 
         surface.blit(shadow_surf, shadow_rect)
         surface.blit(text_surf,   text_rect)
+        return text_rect.union(shadow_rect)
 
     # ------------------------------------------------------------------
     # Public interface
     # ------------------------------------------------------------------
 
-    def _draw_combo(self, surface: pygame.Surface) -> None:
-        """Vẽ chữ Combo chớp giật siêu đẹp ở giữa cạnh dưới màn hình"""
-        combo = self._sm.current_combo
-        if combo < 2:
-            return  # Chỉ hiện khi Combo từ 2 trở lên
-        
+    @staticmethod
+    def _combo_style(combo: int, multiplier: float) -> tuple[int, tuple[int, int, int], float, str]:
+        """Return ``(tier, color, scale, text)`` for the combo banner."""
         # Thiết lập hiệu ứng dựa trên cấp độ Combo
         if combo >= 30:
-            color, scale, text = (255, 50, 50), 1.6, f"GODLIKE! {combo}x"
+            tier, color, scale, text = 4, (255, 50, 50), 1.6, f"GODLIKE! {combo}x"
         elif combo >= 20:
-            color, scale, text = (255, 120, 0), 1.4, f"INSANE! {combo}x"
+            tier, color, scale, text = 3, (255, 120, 0), 1.4, f"INSANE! {combo}x"
         elif combo >= 10:
-            color, scale, text = (255, 230, 0), 1.2, f"GREAT! {combo}x"
+            tier, color, scale, text = 2, (255, 230, 0), 1.2, f"GREAT! {combo}x"
         elif combo >= 5:
-            color, scale, text = (50, 200, 255), 1.1, f"COMBO: {combo}x"
+            tier, color, scale, text = 1, (50, 200, 255), 1.1, f"COMBO: {combo}x"
         else:
-            color, scale, text = (200, 200, 200), 1.0, f"COMBO: {combo}x"
+            tier, color, scale, text = 0, (200, 200, 200), 1.0, f"COMBO: {combo}x"
 
         # Thêm thông báo hệ số điểm
-        multi = self._sm.multiplier
-        if multi > 1.0:
-            text += f" (x{multi:.1f} Pts)"
+        if multiplier > 1.0:
+            text += f" (x{multiplier:.1f} Pts)"
+        return tier, color, scale, text
 
-        # Tạo chữ nền màu (Glow)
-        color_surf = self._font.render(text, True, color)
+    def _build_combo_banner(self, color: tuple[int, int, int], scale: float, text: str) -> pygame.Surface:
+        """
+        Compose the glow and white core of a combo banner into one surface.
+
+        The returned surface is padded by ``_GLOW_PAD`` on every side so the
+        glow offsets fit; its centre matches the centre of the text.
+        """
+        color_surf = render_text(self._font, text, color)
+        white_surf = render_text(self._font, text, WHITE)
         if scale > 1.0:
             new_w, new_h = int(color_surf.get_width() * scale), int(color_surf.get_height() * scale)
             color_surf = pygame.transform.smoothscale(color_surf, (new_w, new_h))
+            white_surf = pygame.transform.smoothscale(white_surf, (new_w, new_h))
+
+        w, h = color_surf.get_size()
+        banner = pygame.Surface((w + 2 * _GLOW_PAD, h + 2 * _GLOW_PAD), pygame.SRCALPHA)
+        # Transparent pixels carry the glow colour so blended edges don't darken
+        banner.fill((*color, 0))
+
+        # Vẽ viền màu siêu dày (Hiệu ứng phát sáng / Arcade style)
+        for dx, dy in _GLOW_OFFSETS:
+            banner.blit(color_surf, (_GLOW_PAD + dx, _GLOW_PAD + dy))
+
+        # Vẽ lõi chữ màu Trắng để chữ nổi bật lên
+        banner.blit(white_surf, (_GLOW_PAD, _GLOW_PAD))
+        return banner
+
+    def _draw_combo(self, surface: pygame.Surface) -> pygame.Rect | None:
+        """Vẽ chữ Combo chớp giật siêu đẹp ở giữa cạnh dưới màn hình"""
+        combo = self._sm.current_combo
+        if combo < 2:
+            return None  # Chỉ hiện khi Combo từ 2 trở lên
+
+        tier, color, scale, text = self._combo_style(combo, self._sm.multiplier)
+
+        # The banner only changes when the combo does, so it is composed once
+        # per (combo, tier) and reused; old combo values are evicted.
+        key = (combo, tier)
+        banner = self._combo_cache.get(key)
+        if banner is None:
+            banner = self._build_combo_banner(color, scale, text)
+            self._combo_cache[key] = banner
+            if len(self._combo_cache) > _COMBO_CACHE_SIZE:
+                self._combo_cache.popitem(last=False)
+        else:
+            self._combo_cache.move_to_end(key)
 
         # Hiệu ứng rung lắc (Camera Shake) cho Combo cao
         offset_x, offset_y = 0, 0
@@ -117,46 +169,46 @@ class HUD:
         # Toạ độ giữa màn hình phía dưới
         cx = surface.get_width() // 2 + offset_x
         cy = surface.get_height() - 50 + offset_y
-        rect = color_surf.get_rect(center=(cx, cy))
+        return surface.blit(banner, banner.get_rect(center=(cx, cy)))
 
-        # Vẽ viền màu siêu dày (Hiệu ứng phát sáng / Arcade style)
-        for dx, dy in [(-3,-3), (3,-3), (-3,3), (3,3), (-4,0), (4,0), (0,-4), (0,4)]:
-            rect_glow = rect.copy()
-            rect_glow.x += dx
-            rect_glow.y += dy
-            surface.blit(color_surf, rect_glow)
-
-        # Vẽ lõi chữ màu Trắng để chữ nổi bật lên
-        white_surf = self._font.render(text, True, WHITE)
-        if scale > 1.0:
-            white_surf = pygame.transform.smoothscale(white_surf, (new_w, new_h))
-        surface.blit(white_surf, rect)
-        
-    def draw(self, surface: pygame.Surface, time_left_seconds: float) -> None:
+    def draw(self, surface: pygame.Surface, time_left_seconds: float) -> list[pygame.Rect]:
         """
         Render the HUD bar across the top of *surface*.
 
         Args:
             surface:            The main game surface.
             time_left_seconds:  Remaining game time in seconds (integer display).
+
+        Returns:
+            The rectangles that were drawn to.
         """
         w = surface.get_width()
 
         time_str  = f"Time: {int(time_left_seconds)}s"
         score_str = f"Score: {self._sm.score}"
-        hm_str    = f"Hits: {self._sm.hits}   Misses: {self._sm.misses}"
+        if self._sm.mode == "tracking":
+            # Whole percent: a string that changes every frame would churn
+            # the shared text cache
+            hm_str = f"On Target: {int(self._sm.tracking_accuracy)}%"
+        else:
+            hm_str = f"Hits: {self._sm.hits}   Misses: {self._sm.misses}"
+
+        rects = [
+            # Top-left — time
+            self._render_shadowed(surface, time_str,  (_MARGIN, _MARGIN), anchor="topleft"),
 
-        # Top-left — time
-        self._render_shadowed(surface, time_str,  (_MARGIN, _MARGIN), anchor="topleft")
+            # Top-centre — score
+            self._render_shadowed(surface, score_str, (w // 2, _MARGIN),  anchor="midtop"),
 
-        # Top-centre — score
-        self._render_shadowed(surface, score_str, (w // 2, _MARGIN),  anchor="midtop")
+            # Top-right — hits / misses
+            self._render_shadowed(surface, hm_str, (w - _MARGIN, _MARGIN), anchor="topright"),
+        ]
 
-        # Top-right — hits / misses
-        self._render_shadowed(surface, hm_str, (w - _MARGIN, _MARGIN), anchor="topright")
-        
         # Combo
-        self._draw_combo(surface)
+        combo_rect = self._draw_combo(surface)
+        if combo_rect is not None:
+            rects.append(combo_rect)
+        return rects
 
     def draw_hit_feedback(
         self,
@@ -0,0 +1,252 @@
+"""
+RelativeMouse — virtual cursor driven by raw relative mouse motion.
+
+With the system cursor hidden and input grabbed, SDL switches to relative
+mouse mode: the pointer is no longer confined by the window and every
+``MOUSEMOTION`` event carries the raw movement in ``event.rel``.  The game
+used to poll ``get_rel()`` once per frame and warp the cursor back to the
+centre, which costs extra calls, generates synthetic motion and drops
+whatever moved between the poll and the warp.  Here every motion delta is
+added to a float position, so no movement is lost and the fractional part
+left by ``MOUSE_SENSITIVITY`` carries into the next sample.
+
+A 1000–8000 Hz mouse delivers dozens to hundreds of motion events per
+frame.  Rather than walking each one through the game's event dispatch,
+:meth:`RelativeMouse.ingest` pulls them out of the frame's batch in one
+pass, stores them as (timestamp, dx, dy) rows in a preallocated
+:class:`MotionBuffer` and integrates the whole frame with one NumPy
+``cumsum``.  Clicks keep their place in the sample stream, so a click is
+resolved against the cursor position at the moment it happened, not where
+the cursor ended up by the end of the frame.  :meth:`RelativeMouse.frame_path`
+exposes the frame's path with sample times for scoring that needs the
+cursor between frames (tracking).
+"""
+
+from __future__ import annotations
+from itertools import chain
+from typing import Optional
+
+import numpy as np
+import pygame
+
+import constants
+from classes.clock import GameClock
+
+_CAPACITY = 16384   # motion samples kept (about two seconds at 8 kHz)
+
+
+class MotionBuffer:
+    """
+    Fixed-size ring of raw ``(timestamp_ms, dx, dy)`` motion samples.
+
+    Allocated once; writing a frame is at most two slice assignments.  The
+    newest ``capacity`` samples are kept for analytics (path length,
+    flick speed, overshoot) via :meth:`latest`.
+    """
+
+    def __init__(self, capacity: int = _CAPACITY) -> None:
+        self.capacity = capacity
+        self._data = np.zeros((capacity, 3), dtype=np.float64)
+        self.total: int = 0     # samples ever written
+
+    def extend(self, rows: np.ndarray) -> None:
+        """Append *rows* (shape ``(n, 3)``), overwriting the oldest samples."""
+        n = len(rows)
+        if n >= self.capacity:
+            rows = rows[-self.capacity:]
+            self.total += n - self.capacity
+            n = self.capacity
+        start = self.total % self.capacity
+        first = min(n, self.capacity - start)
+        self._data[start:start + first] = rows[:first]
+        self._data[:n - first] = rows[first:]
+        self.total += n
+
+    def latest(self, n: Optional[int] = None) -> np.ndarray:
+        """Copy of the newest *n* samples (all that are kept by default), oldest first."""
+        kept = min(self.total, self.capacity)
+        n = kept if n is None else min(n, kept)
+        end = self.total % self.capacity
+        idx = np.arange(end - n, end) % self.capacity
+        return self._data[idx]
+
+    def clear(self) -> None:
+        self.total = 0
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+
+class RelativeMouse:
+    """
+    Float-precision virtual cursor fed from ``MOUSEMOTION`` deltas.
+
+    Typical usage::
+
+        mouse = RelativeMouse(WIDTH, HEIGHT)
+        mouse.enable(pygame.mouse.get_pos())    # round starts
+        events = mouse.ingest(pygame.event.get(), clock)
+        for event in events:                    # motion already applied
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                x, y = mouse.position_of(event)
+        mouse.disable()                         # pause / results
+    """
+
+    def __init__(self, width: int, height: int, capacity: int = _CAPACITY) -> None:
+        """
+        Args:
+            width:    Right edge of the area the cursor is kept in.
+            height:   Bottom edge of that area.
+            capacity: Raw samples kept in :attr:`samples`.
+        """
+        self._w = float(width)
+        self._h = float(height)
+        self.x  = self._w / 2
+        self.y  = self._h / 2
+        self.samples = MotionBuffer(capacity)
+
+        # Cursor path of the current frame: position and time of each sample,
+        # between the previous pump (_t0) and this one (_t1)
+        self._start = (self.x, self.y)
+        self._path  = np.zeros((0, 2))
+        self._times = np.zeros(0)
+        self._t0 = self._t1 = 0.0
+        self._last_pump: Optional[float] = None
+        self._marks: dict[int, int] = {}   # id(click event) -> samples before it
+
+        self._frames = 0
+        self._max_per_frame = 0
+        self._clamped_frames = 0
+
+    def enable(self, start: tuple[float, float] | None = None) -> None:
+        """Grab input (relative mode, with the cursor hidden) from *start*."""
+        if start is not None:
+            self.x, self.y = float(start[0]), float(start[1])
+        self._last_pump = None      # time spent disabled is not part of any frame
+        pygame.event.set_grab(True)
+        pygame.event.clear(pygame.MOUSEMOTION)   # motion from before the grab
+
+    @staticmethod
+    def disable() -> None:
+        pygame.event.set_grab(False)
+
+    # ------------------------------------------------------------------
+    # Per-frame ingestion
+    # ------------------------------------------------------------------
+
+    def ingest(self, events: list, clock: GameClock) -> list:
+        """
+        Apply and buffer every ``MOUSEMOTION`` in *events*.
+
+        Args:
+            events: The frame's batch, in queue order.
+            clock:  Clock that was pumped for this batch; stamps samples.
+
+        Returns:
+            The remaining (non-motion) events, in order.  Clicks among them
+            can be located with :meth:`position_of`.
+        """
+        motion = pygame.MOUSEMOTION
+        moves  = [e for e in events if e.type == motion]
+        self._start = (self.x, self.y)
+        self._marks.clear()
+        self._t1 = clock.pump_ms
+        self._t0 = self._t1 if self._last_pump is None else self._last_pump
+        self._last_pump = self._t1
+        if not moves:
+            self._path  = self._path[:0]
+            self._times = self._times[:0]
+            return events
+
+        # Samples preceding each click: its list position minus the
+        # non-motion events before it
+        others = [(i, e) for i, e in enumerate(events) if e.type != motion]
+        click  = pygame.MOUSEBUTTONDOWN
+        self._marks = {id(e): i - j for j, (i, e) in enumerate(others) if e.type == click}
+
+        n    = len(moves)
+        rels = np.fromiter(chain.from_iterable([e.rel for e in moves]), np.float64, 2 * n)
+        rows = np.empty((n, 3), dtype=np.float64)
+        rows[:, 1:] = rels.reshape(n, 2)
+        if hasattr(moves[0], "timestamp"):
+            rows[:, 0] = [clock.event_time_ms(e) for e in moves]
+        else:
+            # No per-event times: assume a steady polling rate over the frame
+            rows[:, 0] = np.linspace(self._t0, self._t1, n + 1)[1:]
+        self.samples.extend(rows)
+        self._times = rows[:, 0]
+
+        sens   = getattr(constants, "MOUSE_SENSITIVITY", 1.0)
+        deltas = rows[:, 1:] * sens
+        # The path cannot stray further than the summed step lengths; only
+        # when that could reach an edge does order-dependent clamping matter
+        reach_x, reach_y = np.abs(deltas).sum(axis=0).tolist()
+        x0, y0 = self._start
+        if reach_x <= min(x0, self._w - x0) and reach_y <= min(y0, self._h - y0):
+            path = np.cumsum(deltas, axis=0)
+            path += self._start
+        else:
+            path = self._clamped_path(deltas)
+            self._clamped_frames += 1
+        self._path = path
+        self.x, self.y = float(path[-1, 0]), float(path[-1, 1])
+
+        self._frames += 1
+        self._max_per_frame = max(self._max_per_frame, n)
+        return [e for _, e in others]
+
+    def _clamped_path(self, deltas: np.ndarray) -> np.ndarray:
+        path = np.empty_like(deltas)
+        x, y = self._start
+        for k, (dx, dy) in enumerate(deltas.tolist()):
+            x = min(self._w, max(0.0, x + dx))
+            y = min(self._h, max(0.0, y + dy))
+            path[k] = x, y
+        return path
+
+    def position_of(self, event: pygame.event.Event) -> tuple[int, int]:
+        """
+        Cursor pixel at the moment of *event* in the last ingested batch.
+
+        Falls back to the current position for events that were not part
+        of that batch.
+        """
+        k = self._marks.get(id(event))
+        if k is None:
+            return self.pixel
+        if k == 0:
+            return int(self._start[0]), int(self._start[1])
+        x, y = self._path[min(k, len(self._path)) - 1]
+        return int(x), int(y)
+
+    def frame_path(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Cursor path over the last ingested frame, as ``(times, xs, ys)``.
+
+        The path starts where the cursor was at the previous pump, passes
+        through every motion sample and ends at this frame's pump time;
+        between knots the cursor is taken to move in a straight line.
+        Times are on the clock passed to :meth:`ingest`.
+        """
+        n = len(self._path)
+        times = np.empty(n + 2)
+        xs    = np.empty(n + 2)
+        ys    = np.empty(n + 2)
+        times[0], times[1:-1], times[-1] = self._t0, self._times, self._t1
+        xs[0], ys[0] = self._start
+        xs[1:-1], ys[1:-1] = self._path[:, 0], self._path[:, 1]
+        xs[-1], ys[-1] = self.x, self.y
+        return times, xs, ys
+
+    @property
+    def pixel(self) -> tuple[int, int]:
+        """Cursor position rounded down to whole pixels."""
+        return int(self.x), int(self.y)
+
+    def stats(self) -> dict:
+        return {
+            "samples":        self.samples.total,
+            "frames":         self._frames,
+            "max_per_frame":  self._max_per_frame,
+            "clamped_frames": self._clamped_frames,
+        }
@@ -0,0 +1,134 @@
+"""
+Closed-form target trajectories.
+
+A moving target used to be integrated step by step (``x += vx * dt`` and a
+velocity flip at each wall), so its position was only known at the last
+update.  Here every trajectory is a function of the target's age, which
+means the position can be evaluated at any instant: the moment of a click,
+the timestamp of a mouse sample, or a render time between two steps.
+
+A pattern produces an unbounded path from the spawn point, and
+:func:`reflect` folds it into the playfield with a triangle wave.  Folding
+is exactly what repeated wall bounces do to a coordinate, so bounces need
+no state either.  :func:`position` works on NumPy arrays, so one call
+evaluates a whole :class:`~classes.target_field.TargetField`.  Pattern
+parameters are turned into a few per-target constants at spawn
+(:func:`coefficients`) so evaluation is only a handful of array
+operations.
+
+Patterns (``vx, vy`` is the initial velocity in pixel/ms):
+
+* ``linear``       — constant velocity.
+* ``strafe``       — back and forth along the heading, reversing every
+  ``period / 2`` ms, like a player tapping A/D.
+* ``sinusoidal``   — constant velocity plus a sideways sine of ``amp``
+  pixels and ``period`` ms.
+* ``accelerating`` — speeds up along the heading by ``accel`` pixel/ms².
+"""
+
+from __future__ import annotations
+import math
+from random import choice, randint
+
+import numpy as np
+
+LINEAR       = 0
+STRAFE       = 1
+SINUSOIDAL   = 2
+ACCELERATING = 3
+
+PATTERNS = {
+    "linear":       LINEAR,
+    "strafe":       STRAFE,
+    "sinusoidal":   SINUSOIDAL,
+    "accelerating": ACCELERATING,
+}
+
+
+def coefficients(vx: float, vy: float, pattern: int = LINEAR, amp: float = 0.0,
+                 period: float = 0.0, accel: float = 0.0) -> tuple[float, ...]:
+    """
+    Per-target constants used by :func:`position`, computed once at spawn.
+
+    Returns:
+        ``(nx, ny, c2, amp, omega, half)``: unit normal of the heading, the
+        quadratic coefficient of the distance travelled (accelerating), the
+        sideways amplitude and angular frequency (sinusoidal), and the
+        half-period of a strafe (0 for other patterns).
+    """
+    speed = math.hypot(vx, vy)
+    if speed == 0:
+        return 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+    nx, ny = -vy / speed, vx / speed
+    c2    = 0.5 * accel / speed if pattern == ACCELERATING else 0.0
+    side  = amp if pattern == SINUSOIDAL and period > 0 else 0.0
+    omega = 2.0 * math.pi / period if side else 0.0
+    half  = period / 2.0 if pattern == STRAFE and period > 0 else 0.0
+    return nx, ny, c2, side, omega, half
+
+
+def reflect(u, lo, hi):
+    """
+    Fold the unbounded coordinate *u* into ``[lo, hi]`` as wall bounces would.
+
+    Works on arrays; *hi* must be greater than *lo*.
+    """
+    span = hi - lo
+    m = np.mod(u - lo, 2.0 * span)
+    return lo + span - np.abs(m - span)
+
+
+def position(x0, y0, vx, vy, coeffs, t, radius, width, height):
+    """
+    Positions after *t* ms, kept *radius* pixels inside ``width`` x ``height``.
+
+    Args:
+        x0, y0, vx, vy: Spawn points and initial velocities (arrays).
+        coeffs:         ``(nx, ny, c2, amp, omega, half)`` arrays, see
+                        :func:`coefficients`.
+        t:              Age of each target in ms.
+        radius:         Target radii.
+        width, height:  Playfield size.
+
+    Returns:
+        ``(x, y)`` arrays.
+    """
+    nx, ny, c2, amp, omega, half = coeffs
+    t = np.asarray(t, dtype=np.float64)
+
+    # Distance along the heading, in units of the initial velocity
+    along = t + c2 * t * t
+    strafe = half > 0
+    if strafe.any():
+        safe  = np.where(strafe, half, 1.0)
+        along = np.where(strafe, reflect(t, 0.0, safe), along)
+
+    x = x0 + vx * along
+    y = y0 + vy * along
+    if amp.any():
+        side = amp * np.sin(omega * t)
+        x = x + nx * side
+        y = y + ny * side
+
+    r = radius.astype(np.float64)
+    return reflect(x, r, width - r), reflect(y, r, height - r)
+
+
+def random_params(name: str) -> tuple[int, float, float, float]:
+    """
+    Random ``(pattern, amp, period, accel)`` for the pattern called *name*.
+
+    ``"random"`` picks one of :data:`PATTERNS` first.
+    """
+    if name == "random":
+        name = choice(list(PATTERNS))
+    pattern = PATTERNS[name]
+    amp = period = accel = 0.0
+    if pattern == STRAFE:
+        period = float(randint(600, 1400))
+    elif pattern == SINUSOIDAL:
+        amp    = float(randint(40, 120))
+        period = float(randint(800, 1600))
+    elif pattern == ACCELERATING:
+        accel  = randint(1, 3) / 10000.0
+    return pattern, amp, period, accel
@@ -0,0 +1,128 @@
+"""
+MusicController — background music that stays loaded between transitions.
+
+``pygame.mixer.music.load`` opens and starts decoding the file on the main
+thread, which shows up as a frame spike whenever the menu music restarts.
+The controller loads the stream once and afterwards only pauses, unpauses
+and changes volume.  Volume changes are linear ramps advanced by
+:meth:`update` from the game loop, so cross-fades never block a frame
+(``pygame.mixer.music.fadeout`` would).
+
+Fades run on a level between 0 and 1, and the mixer plays that level
+scaled by :attr:`MusicController.volume`, the player's music volume from
+the settings screen.  A transition therefore never overwrites the
+player's choice, and pausing the music during a round does not change it.
+"""
+
+from __future__ import annotations
+import os
+
+import pygame
+
+_BASE       = os.path.join(os.path.dirname(__file__), "..")
+_SOUNDS_DIR = os.path.join(_BASE, "sounds")
+
+
+class MusicController:
+    """
+    Non-blocking fades between volumes of a single looping music stream.
+
+    Typical usage::
+
+        music = MusicController("menu_music.mp3")
+        music.play(0.5)                  # loads and starts once
+        music.stop(fade_ms=400)          # fades out, then pauses
+        music.play(0.35, fade_ms=400)    # unpauses and fades back in
+        music.set_volume(0.8)            # settings screen: scales every level
+
+        # every frame:
+        music.update(dt)
+    """
+
+    def __init__(self, filename: str, sounds_dir: str = _SOUNDS_DIR) -> None:
+        """
+        Args:
+            filename:   Music file inside *sounds_dir*.
+            sounds_dir: Directory holding the music file.
+        """
+        self._path    = os.path.join(sounds_dir, filename)
+        self._loaded  = False
+        self._paused  = False
+        self._volume  = 1.0     # player's music volume
+        self._level   = 0.0     # current fade level, before scaling by _volume
+        self._from    = 0.0
+        self._target  = 0.0
+        self._fade_ms = 0.0
+        self._elapsed = 0.0
+        self._pause_at_end = False
+
+    def play(self, level: float, fade_ms: float = 0, loops: int = -1) -> None:
+        """Start (first call) or resume the music and ramp to *level*."""
+        if pygame.mixer.get_init() is None:
+            return
+        try:
+            if not self._loaded:
+                pygame.mixer.music.load(self._path)
+                pygame.mixer.music.set_volume(0.0 if fade_ms > 0 else level * self._volume)
+                pygame.mixer.music.play(loops)
+                self._loaded = True
+            elif self._paused:
+                pygame.mixer.music.unpause()
+            self._paused = False
+        except pygame.error:
+            return
+        self._ramp_to(level, fade_ms, pause_at_end=False)
+
+    def stop(self, fade_ms: float = 0) -> None:
+        """Fade the music out and pause it, keeping the stream loaded."""
+        if not self._loaded or self._paused:
+            return
+        self._ramp_to(0.0, fade_ms, pause_at_end=True)
+
+    def update(self, dt: float) -> None:
+        """Advance the current fade by *dt* milliseconds."""
+        if self._fade_ms <= 0:
+            return
+        self._elapsed = min(self._fade_ms, self._elapsed + dt)
+        t = self._elapsed / self._fade_ms
+        self._level = self._from + (self._target - self._from) * t
+        self._apply()
+        if self._elapsed >= self._fade_ms:
+            self._finish_fade()
+
+    @property
+    def fading(self) -> bool:
+        return self._fade_ms > 0
+
+    @property
+    def volume(self) -> float:
+        """The player's music volume, 0.0–1.0."""
+        return self._volume
+
+    def set_volume(self, volume: float) -> None:
+        """Set the player's music volume; applies at once, even mid-fade."""
+        self._volume = min(1.0, max(0.0, volume))
+        self._apply()
+
+    def _ramp_to(self, level: float, fade_ms: float, pause_at_end: bool) -> None:
+        self._from    = self._level
+        self._target  = level
+        self._elapsed = 0.0
+        self._pause_at_end = pause_at_end
+        if fade_ms > 0:
+            self._fade_ms = float(fade_ms)
+        else:
+            self._fade_ms = 0.0
+            self._level   = level
+            self._apply()
+            self._finish_fade()
+
+    def _apply(self) -> None:
+        if self._loaded and pygame.mixer.get_init() is not None:
+            pygame.mixer.music.set_volume(self._level * self._volume)
+
+    def _finish_fade(self) -> None:
+        self._fade_ms = 0.0
+        if self._pause_at_end:
+            pygame.mixer.music.pause()
+            self._paused = True
@@ -0,0 +1,149 @@
+"""
+ReactionStats — running statistics over one round's reaction times.
+
+Samples are kept in a compact ``array('d')`` for anything that needs the
+raw data, but nothing the HUD or results screen shows walks it: the mean
+and variance are updated with Welford's method, min and max directly, and
+each percentile by a P² estimator (Jain & Chlamtac, 1985), which tracks a
+quantile with five markers and O(1) work per sample.  P² needs a few dozen
+samples to settle, so short rounds (up to ``_EXACT_LIMIT`` hits) use a small
+sorted copy for exact percentiles instead.  All reads are O(1).
+"""
+
+from __future__ import annotations
+import bisect
+import math
+from array import array
+
+PERCENTILES = (0.5, 0.9, 0.99)
+
+_EXACT_LIMIT = 256  # samples kept sorted for exact percentiles
+
+
+class _P2Quantile:
+    """Streaming estimate of the *p*-quantile with the P² algorithm."""
+
+    __slots__ = ("p", "_q", "_n", "_want", "_step", "_count")
+
+    def __init__(self, p: float) -> None:
+        self.p = p
+        self._q: list[float] = []                       # marker heights
+        self._n = [0, 1, 2, 3, 4]                       # marker positions
+        self._want = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]  # desired positions
+        self._step = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+        self._count = 0
+
+    def add(self, x: float) -> None:
+        self._count += 1
+        q = self._q
+        if self._count <= 5:
+            q.append(x)
+            q.sort()
+            return
+
+        n = self._n
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._want[i] += self._step[i]
+
+        # Move the three middle markers towards their desired positions
+        for i in (1, 2, 3):
+            d = self._want[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                s = 1 if d > 0 else -1
+                qp = q[i] + s / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + s) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - s) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not q[i - 1] < qp < q[i + 1]:
+                    qp = q[i] + s * (q[i + s] - q[i]) / (n[i + s] - n[i])
+                q[i] = qp
+                n[i] += s
+
+    @property
+    def value(self) -> float:
+        """Current estimate (exact while there are five samples or fewer)."""
+        if self._count > 5:
+            return self._q[2]
+        return _interpolate(self._q, self.p)
+
+
+def _interpolate(ordered: list[float], p: float) -> float:
+    """Linearly interpolated *p*-quantile of the sorted list *ordered*."""
+    if not ordered:
+        return 0.0
+    pos = p * (len(ordered) - 1)
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+class ReactionStats:
+    """
+    Reaction times of one round with O(1) aggregates.
+
+    Typical usage::
+
+        stats = ReactionStats()
+        stats.add(231.0)
+        stats.mean, stats.std, stats.percentile(0.9)
+    """
+
+    def __init__(self) -> None:
+        self.samples = array("d")
+        self.reset()
+
+    def reset(self) -> None:
+        del self.samples[:]
+        self.count: int = 0
+        self.mean:  float = 0.0
+        self._m2:   float = 0.0
+        self.min:   float = 0.0
+        self.max:   float = 0.0
+        self._sorted: list[float] = []
+        self._quantiles = {p: _P2Quantile(p) for p in PERCENTILES}
+
+    def add(self, value: float) -> None:
+        self.samples.append(value)
+        self.count += 1
+        if self.count == 1:
+            self.min = self.max = value
+        else:
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if self.count <= _EXACT_LIMIT:
+            bisect.insort(self._sorted, value)
+        for estimator in self._quantiles.values():
+            estimator.add(value)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0 with fewer than two samples)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def percentile(self, p: float) -> float:
+        """Estimated *p*-quantile for one of :data:`PERCENTILES` (0 if empty)."""
+        if self.count <= _EXACT_LIMIT:
+            return _interpolate(self._sorted, p)
+        return self._quantiles[p].value
+
+    def __len__(self) -> int:
+        return self.count
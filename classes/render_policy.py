@@ -0,0 +1,82 @@
+"""
+MenuRenderPolicy — redraw skipping and idle frame rate for the menu states.
+
+Menu screens only change in response to input (hover, clicks, key presses)
+or a state transition.  The policy marks the frame dirty when one of those
+happens and lets the game loop skip drawing and flipping otherwise.  After
+``idle_after_ms`` without input it reports itself idle so the loop can
+sleep until the next event instead of ticking at full rate.
+"""
+
+from __future__ import annotations
+
+import pygame
+
+_DEFAULT_IDLE_FPS      = 10
+_DEFAULT_IDLE_AFTER_MS = 3000
+
+
+class MenuRenderPolicy:
+    """
+    Decides whether a menu frame needs drawing and how fast to tick.
+
+    Typical usage inside the game loop::
+
+        policy.notify_events(events, now)
+        ...
+        if policy.should_draw():
+            screen.draw(surface)
+            pygame.display.flip()
+    """
+
+    def __init__(
+        self,
+        idle_fps: int = _DEFAULT_IDLE_FPS,
+        idle_after_ms: int = _DEFAULT_IDLE_AFTER_MS,
+    ) -> None:
+        """
+        Args:
+            idle_fps:      Wake-up rate while idle (frames per second).
+            idle_after_ms: Time without input before the policy goes idle.
+        """
+        self._idle_fps      = max(1, idle_fps)
+        self._idle_after_ms = idle_after_ms
+        self._last_input_ms = pygame.time.get_ticks()
+        self._dirty         = True
+
+        self.frames_drawn:   int = 0
+        self.frames_skipped: int = 0
+
+    def notify_events(self, events: list[pygame.event.Event], now_ms: int) -> None:
+        """Mark the frame dirty if any event arrived this frame."""
+        if events:
+            self._dirty = True
+            self._last_input_ms = now_ms
+
+    def invalidate(self) -> None:
+        """Force the next frame to be drawn (state change, animation, data change)."""
+        self._dirty = True
+
+    def should_draw(self) -> bool:
+        """Consume the dirty flag; counts the frame as drawn or skipped."""
+        if self._dirty:
+            self._dirty = False
+            self.frames_drawn += 1
+            return True
+        self.frames_skipped += 1
+        return False
+
+    def is_idle(self, now_ms: int) -> bool:
+        """True once no input has arrived for ``idle_after_ms``."""
+        return not self._dirty and now_ms - self._last_input_ms >= self._idle_after_ms
+
+    @property
+    def idle_timeout_ms(self) -> int:
+        """How long the loop may block waiting for input while idle."""
+        return 1000 // self._idle_fps
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "frames_drawn":   self.frames_drawn,
+            "frames_skipped": self.frames_skipped,
+        }
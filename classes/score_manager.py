@@ -1,17 +1,30 @@
-import json
-import os
 from datetime import datetime
+from typing import Optional
+
+import constants
+from classes.reaction_stats import ReactionStats
+from classes.session_writer import SessionWriter
+
+
 class ScoreManager:
 
-    def __init__(self):
+    def __init__(self, writer: Optional[SessionWriter] = None):
+        self._writer = writer
+        self.mode: str = "basic"
         self.hits: int = 0
         self.misses: int = 0
         self.score: int = 0
-        self.reaction_times: list[float] = []
+        # Thời gian phản xạ: mảng array('d') + thống kê cập nhật liên tục (đọc O(1))
+        self.reactions = ReactionStats()
         
         # Combo System: 
         self.current_combo: int = 0
         self.max_combo: int = 0
+
+        # Chế độ Tracking: thời gian giữ tâm trên mục tiêu / thời gian mục tiêu hiện
+        self.tracking_on_ms: float = 0.0
+        self.tracking_total_ms: float = 0.0
+        self._tracking_points: float = 0.0
         
     @property
     def multiplier(self) -> float:
@@ -32,20 +45,42 @@ class ScoreManager:
         points = int((100 + time_bonus) * self.multiplier)
         self.score += points
         self.hits += 1
-        self.reaction_times.append(reaction_time_ms)
+        self.reactions.add(reaction_time_ms)
         return points
 
     def register_miss(self) -> None:
         self.misses += 1
         self.current_combo = 0
 
-    def reset(self) -> None:
+    def register_tracking(self, on_target_ms: float, total_ms: float) -> int:
+        """Cộng thời gian bám mục tiêu của một khung hình; trả về số điểm vừa cộng"""
+        self.tracking_on_ms    += on_target_ms
+        self.tracking_total_ms += total_ms
+        # Giữ phần lẻ của điểm để tổng không phụ thuộc vào FPS
+        self._tracking_points += on_target_ms * constants.TRACKING_POINTS_PER_S / 1000.0
+        points = int(self._tracking_points)
+        self._tracking_points -= points
+        self.score += points
+        return points
+
+    def reset(self, mode: str = "basic") -> None:
+        self.mode = mode
         self.hits = 0
         self.misses = 0
         self.score = 0
-        self.reaction_times = []
+        self.reactions.reset()
         self.current_combo = 0
         self.max_combo = 0
+        self.tracking_on_ms = 0.0
+        self.tracking_total_ms = 0.0
+        self._tracking_points = 0.0
+
+    @property
+    def tracking_accuracy(self) -> float:
+        """Phần trăm thời gian tâm nằm trên mục tiêu (chế độ Tracking)"""
+        if self.tracking_total_ms <= 0:
+            return 0.0
+        return self.tracking_on_ms / self.tracking_total_ms * 100
 
     @property
     def accuracy(self) -> float:
@@ -54,31 +89,32 @@ class ScoreManager:
             return 0.0
         return self.hits / total * 100
 
+    @property
+    def reaction_times(self):
+        """Tất cả thời gian phản xạ của ván (array('d'))"""
+        return self.reactions.samples
+
     @property
     def avg_reaction_time(self) -> float:
-        if not self.reaction_times:
-            return 0.0
-        return sum(self.reaction_times) / len(self.reaction_times)
+        return self.reactions.mean
 
     @property
     def best_reaction_time(self) -> float:
-        if not self.reaction_times:
-            return 0.0
-        return min(self.reaction_times)
+        return self.reactions.min
+
+    @property
+    def reaction_std(self) -> float:
+        return self.reactions.std
+
+    def reaction_percentile(self, p: float) -> float:
+        """Phân vị thời gian phản xạ, p thuộc PERCENTILES (0.5, 0.9, 0.99)"""
+        return self.reactions.percentile(p)
 
     def save_session(self, mode: str = "basic") -> None:
-        """Lưu kết quả ván chơi vào file JSON"""
-        stats_file = "stats.json"
-        data = []
-        
-        # Đọc dữ liệu cũ nếu có
-        if os.path.exists(stats_file):
-            try:
-                with open(stats_file, "r") as f:
-                    data = json.load(f)
-            except Exception:
-                pass
-                
+        """Gửi kết quả ván chơi cho SessionWriter (ghi ở luồng nền, không chặn game)"""
+        if self._writer is None:
+            self._writer = SessionWriter()
+
         # Tạo record mới
         session = {
             "date": datetime.now().strftime("%Y-%m-%d %H:%M"),
@@ -86,16 +122,15 @@ class ScoreManager:
             "score": self.score,
             "hits": self.hits,
             "misses": self.misses,
-            "accuracy": round(self.accuracy, 2),
+            # Tracking không bắn: accuracy để trống, dùng tracking_accuracy
+            "accuracy": round(self.accuracy, 2) if mode != "tracking" else None,
             "avg_reaction": round(self.avg_reaction_time, 2),
             "best_reaction": round(self.best_reaction_time, 2),
-            "max_combo": self.max_combo
+            "max_combo": self.max_combo,
+            "reaction_std": round(self.reaction_std, 2),
+            "p50_reaction": round(self.reaction_percentile(0.5), 2),
+            "p90_reaction": round(self.reaction_percentile(0.9), 2),
+            "p99_reaction": round(self.reaction_percentile(0.99), 2),
+            "tracking_accuracy": round(self.tracking_accuracy, 2) if mode == "tracking" else None,
         }
-        data.append(session)
-        
-        # Ghi đè file
-        try:
-            with open(stats_file, "w") as f:
-                json.dump(data, f, indent=4)
-        except Exception:
-            pass
\ No newline at end of file
+        self._writer.submit(session)
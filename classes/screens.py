@@ -1,10 +1,19 @@
 from __future__ import annotations
+import sqlite3
 from typing import Optional, TYPE_CHECKING
 
+import numpy as np
 import pygame
 
+from classes.font_registry import get_font
+from classes.history_chart import HistoryChart
+from classes.stats_summary import StatsSummary
+from classes.text_cache import render_text
+
 if TYPE_CHECKING:
+    from classes.music import MusicController
     from classes.score_manager import ScoreManager
+    from classes.session_store import SessionStore
 
 WHITE          = (255, 255, 255)
 BLACK          = (0,   0,   0)
@@ -24,11 +33,11 @@ SUBTITLE_COLOR = (200, 200, 200)
 
 
 def _make_font(size: int) -> pygame.font.Font:
-    return pygame.font.SysFont("segoeui", size, bold=False)
+    return get_font(size, bold=False)
 
 
 def _make_bold_font(size: int) -> pygame.font.Font:
-    return pygame.font.SysFont("segoeui", size, bold=True)
+    return get_font(size, bold=True)
 
 
 def _draw_button(
@@ -41,7 +50,7 @@ def _draw_button(
     bg_color = BTN_HOVER if hovered else BTN_NORMAL
     pygame.draw.rect(surface, bg_color,   rect, border_radius=8)
     pygame.draw.rect(surface, BTN_BORDER, rect, width=2, border_radius=8)
-    text_surf = font.render(label, True, BTN_TEXT)
+    text_surf = render_text(font, label, BTN_TEXT)
     surface.blit(text_surf, text_surf.get_rect(center=rect.center))
 
 
@@ -54,13 +63,18 @@ def _render_shadow(
     shadow_color: tuple[int, int, int] = (20, 20, 20),
     shadow_offset: int = 3,
 ) -> None:
-    shadow_surf = font.render(text, True, shadow_color)
-    text_surf   = font.render(text, True, color)
+    shadow_surf = render_text(font, text, shadow_color)
+    text_surf   = render_text(font, text, color)
     sx, sy = center[0] + shadow_offset, center[1] + shadow_offset
     surface.blit(shadow_surf, shadow_surf.get_rect(center=(sx, sy)))
     surface.blit(text_surf,   text_surf.get_rect(center=center))
 
 
+def _button_at(rects: list[pygame.Rect], pos: tuple[int, int]) -> int:
+    """Index of the rect under *pos*, or -1; one ``collidelist`` scan in C."""
+    return pygame.Rect(pos, (1, 1)).collidelist(rects)
+
+
 class StartScreen:
 
     _BUTTON_W   = 260
@@ -92,28 +106,37 @@ class StartScreen:
             rect.centerx = cx
             rect.y = y
             self._buttons.append((rect, action))
+        self._hitboxes = [rect for rect, _ in self._buttons]
+
+        self._static: Optional[pygame.Surface] = None
 
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            pos = pygame.mouse.get_pos()
-            for rect, action in self._buttons:
-                if rect.collidepoint(pos):
-                    return action
+            i = _button_at(self._hitboxes, pygame.mouse.get_pos())
+            if i >= 0:
+                return self._buttons[i][1]
         return None
 
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.fill(DARK_GRAY)
-        pygame.draw.rect(surface, (30, 30, 50), pygame.Rect(0, 0, self._w, 8))
-        
+    def _build_static(self) -> pygame.Surface:
+        layer = pygame.Surface((self._w, self._h))
+        layer.fill(DARK_GRAY)
+        pygame.draw.rect(layer, (30, 30, 50), pygame.Rect(0, 0, self._w, 8))
+
         _render_shadow(
-            surface, "AIM TRAINER",
+            layer, "AIM TRAINER",
             self._title_font,
             (self._w // 2, self._h // 2 - 80),
             color=TITLE_COLOR,
         )
-        
-        sub_surf = self._subtitle_font.render("Test your reflexes", True, SUBTITLE_COLOR)
-        surface.blit(sub_surf, sub_surf.get_rect(center=(self._w // 2, self._h // 2 - 20)))
+
+        sub_surf = render_text(self._subtitle_font, "Test your reflexes", SUBTITLE_COLOR)
+        layer.blit(sub_surf, sub_surf.get_rect(center=(self._w // 2, self._h // 2 - 20)))
+        return layer
+
+    def draw(self, surface: pygame.Surface) -> None:
+        if self._static is None:
+            self._static = self._build_static()
+        surface.blit(self._static, (0, 0))
 
         mouse_pos = pygame.mouse.get_pos()
         labels = ["Start Game", "Instructions", "Statistics", "Settings", "Exit Game"]
@@ -150,26 +173,27 @@ class PauseScreen:
             rect.centerx = cx
             rect.y = y
             self._buttons.append((rect, action))
+        self._hitboxes = [rect for rect, _ in self._buttons]
 
+        # Dark overlay with the title composed in; blitted over the frozen game frame
         self._overlay = pygame.Surface((width, height), pygame.SRCALPHA)
         self._overlay.fill(DARK_OVERLAY)
+        _render_shadow(
+            self._overlay, "PAUSED",
+            self._title_font,
+            (self._w // 2, self._h // 2 - 60),
+            color=WHITE,
+        )
 
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            pos = pygame.mouse.get_pos()
-            for rect, action in self._buttons:
-                if rect.collidepoint(pos):
-                    return action
+            i = _button_at(self._hitboxes, pygame.mouse.get_pos())
+            if i >= 0:
+                return self._buttons[i][1]
         return None
 
     def draw(self, surface: pygame.Surface) -> None:
         surface.blit(self._overlay, (0, 0))
-        _render_shadow(
-            surface, "PAUSED",
-            self._title_font,
-            (self._w // 2, self._h // 2 - 60),
-            color=WHITE,
-        )
         mouse_pos = pygame.mouse.get_pos()
         labels = ["Resume", "Restart", "Settings", "Quit to Menu"]
         for (rect, _), label in zip(self._buttons, labels):
@@ -211,22 +235,29 @@ class ResultsScreen:
             x = start_x + i * (self._BUTTON_W + self._BUTTON_GAP)
             rect = pygame.Rect(x, btn_y, self._BUTTON_W, self._BUTTON_H)
             self._buttons.append((rect, action))
+        self._hitboxes = [rect for rect, _ in self._buttons]
+
+        self._static: Optional[pygame.Surface] = None
+
+    def invalidate(self) -> None:
+        """Rebuild the stats layer on the next draw (call when a round ends)."""
+        self._static = None
 
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            pos = pygame.mouse.get_pos()
-            for rect, action in self._buttons:
-                if rect.collidepoint(pos):
-                    return action
+            i = _button_at(self._hitboxes, pygame.mouse.get_pos())
+            if i >= 0:
+                return self._buttons[i][1]
         return None
 
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.fill(DARK_GRAY)
+    def _build_static(self) -> pygame.Surface:
+        layer = pygame.Surface((self._w, self._h))
+        layer.fill(DARK_GRAY)
 
         cx = self._w // 2
 
-        _render_shadow(surface, "RESULTS", self._title_font, (cx, 60), color=TITLE_COLOR)
-        pygame.draw.line(surface, BTN_BORDER, (cx - 200, 100), (cx + 200, 100), 2)
+        _render_shadow(layer, "RESULTS", self._title_font, (cx, 60), color=TITLE_COLOR)
+        pygame.draw.line(layer, BTN_BORDER, (cx - 200, 100), (cx + 200, 100), 2)
 
         stats = [
             ("Score",              f"{self._sm.score}",                     YELLOW),
@@ -236,17 +267,33 @@ class ResultsScreen:
             ("Accuracy",           f"{self._sm.accuracy:.1f}%",             WHITE),
             ("Avg Reaction",       f"{self._sm.avg_reaction_time:.0f} ms",  WHITE),
             ("Best Reaction",      f"{self._sm.best_reaction_time:.0f} ms", YELLOW),
+            ("Reaction Std Dev",   f"{self._sm.reaction_std:.0f} ms",       WHITE),
+            ("P50 / P90 / P99",    " / ".join(f"{self._sm.reaction_percentile(p):.0f}" for p in (0.5, 0.9, 0.99)) + " ms", WHITE),
         ]
+        if self._sm.mode == "tracking":
+            # Chế độ Tracking không bắn: chỉ hiện thời gian bám mục tiêu
+            stats = [
+                ("Score",             f"{self._sm.score}",                         YELLOW),
+                ("Tracking Accuracy", f"{self._sm.tracking_accuracy:.1f}%",        GREEN),
+                ("Time on Target",    f"{self._sm.tracking_on_ms / 1000:.1f} s",   WHITE),
+                ("Target Time",       f"{self._sm.tracking_total_ms / 1000:.1f} s", WHITE),
+            ]
 
         row_h   = 38
         start_y = 120
 
         for i, (label, value, color) in enumerate(stats):
             y = start_y + i * row_h
-            label_surf = self._label_font.render(label + ":", True, GRAY)
-            surface.blit(label_surf, label_surf.get_rect(midright=(cx - 10, y + row_h // 2)))
-            value_surf = self._stat_font.render(value, True, color)
-            surface.blit(value_surf, value_surf.get_rect(midleft=(cx + 10, y + row_h // 2)))
+            label_surf = render_text(self._label_font, label + ":", GRAY)
+            layer.blit(label_surf, label_surf.get_rect(midright=(cx - 10, y + row_h // 2)))
+            value_surf = render_text(self._stat_font, value, color)
+            layer.blit(value_surf, value_surf.get_rect(midleft=(cx + 10, y + row_h // 2)))
+        return layer
+
+    def draw(self, surface: pygame.Surface) -> None:
+        if self._static is None:
+            self._static = self._build_static()
+        surface.blit(self._static, (0, 0))
 
         mouse_pos = pygame.mouse.get_pos()
         labels = ["Play Again", "Main Menu", "Exit"]
@@ -267,6 +314,8 @@ class InstructionsScreen:
         self._body_font      = _make_font(24)
         self._highlight_font = _make_bold_font(24)
         self._btn_font       = _make_font(22)
+        self._icon_font      = _make_bold_font(18)
+        self._key_font       = _make_bold_font(12)
 
         self._back_btn = pygame.Rect(0, 0, self._BUTTON_W, self._BUTTON_H)
         self._back_btn.center = (width // 2, height - 60)
@@ -280,6 +329,8 @@ class InstructionsScreen:
             ("crown",  "Time Limit:",    " You have 60 seconds. Get the high score!")
         ]
 
+        self._static: Optional[pygame.Surface] = None
+
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             return "back"
@@ -288,12 +339,13 @@ class InstructionsScreen:
                 return "back"
         return None
 
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.fill(DARK_GRAY)
-        pygame.draw.rect(surface, (30, 30, 50), pygame.Rect(0, 0, self._w, 8))
+    def _build_static(self) -> pygame.Surface:
+        layer = pygame.Surface((self._w, self._h))
+        layer.fill(DARK_GRAY)
+        pygame.draw.rect(layer, (30, 30, 50), pygame.Rect(0, 0, self._w, 8))
 
        
-        _render_shadow(surface, "HOW TO PLAY", self._title_font,
+        _render_shadow(layer, "HOW TO PLAY", self._title_font,
                        (self._w // 2, 70), color=TITLE_COLOR)
 
         
@@ -305,7 +357,7 @@ class InstructionsScreen:
         overlay = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
         pygame.draw.rect(overlay, (20, 20, 30, 150), overlay.get_rect(), border_radius=16)
         pygame.draw.rect(overlay, BTN_BORDER, overlay.get_rect(), width=2, border_radius=16)
-        surface.blit(overlay, panel_rect.topleft)
+        layer.blit(overlay, panel_rect.topleft)
 
         
         start_y = panel_rect.y + 50
@@ -318,43 +370,48 @@ class InstructionsScreen:
 
             
             if icon == "target":
-                pygame.draw.circle(surface, RED, (icon_x, y), 14)
-                pygame.draw.circle(surface, WHITE, (icon_x, y), 10)
-                pygame.draw.circle(surface, RED, (icon_x, y), 5)
+                pygame.draw.circle(layer, RED, (icon_x, y), 14)
+                pygame.draw.circle(layer, WHITE, (icon_x, y), 10)
+                pygame.draw.circle(layer, RED, (icon_x, y), 5)
             
             elif icon == "time":
-                pygame.draw.circle(surface, BLUE, (icon_x, y), 15, 3)
-                pygame.draw.line(surface, WHITE, (icon_x, y), (icon_x, y - 8), 2)
-                pygame.draw.line(surface, WHITE, (icon_x, y), (icon_x + 6, y + 5), 2)
+                pygame.draw.circle(layer, BLUE, (icon_x, y), 15, 3)
+                pygame.draw.line(layer, WHITE, (icon_x, y), (icon_x, y - 8), 2)
+                pygame.draw.line(layer, WHITE, (icon_x, y), (icon_x + 6, y + 5), 2)
             
             elif icon == "score":
-                pts_surf = _make_bold_font(18).render("+100", True, GREEN)
-                surface.blit(pts_surf, pts_surf.get_rect(center=(icon_x, y)))
+                pts_surf = render_text(self._icon_font, "+100", GREEN)
+                layer.blit(pts_surf, pts_surf.get_rect(center=(icon_x, y)))
             
             elif icon == "key":
                 key_rect = pygame.Rect(0, 0, 38, 26)
                 key_rect.center = (icon_x, y)
-                pygame.draw.rect(surface, GRAY, key_rect, border_radius=4)
-                pygame.draw.rect(surface, WHITE, key_rect, width=2, border_radius=4)
-                k_surf = _make_bold_font(12).render("ESC", True, BLACK)
-                surface.blit(k_surf, k_surf.get_rect(center=(icon_x, y)))
+                pygame.draw.rect(layer, GRAY, key_rect, border_radius=4)
+                pygame.draw.rect(layer, WHITE, key_rect, width=2, border_radius=4)
+                k_surf = render_text(self._key_font, "ESC", BLACK)
+                layer.blit(k_surf, k_surf.get_rect(center=(icon_x, y)))
             
             elif icon == "crown":
                 
-                pygame.draw.polygon(surface, YELLOW, [
+                pygame.draw.polygon(layer, YELLOW, [
                     (icon_x - 14, y - 10), (icon_x - 7, y + 2),  (icon_x, y - 12),
                     (icon_x + 7, y + 2),   (icon_x + 14, y - 10),
                     (icon_x + 10, y + 12), (icon_x - 10, y + 12)
                 ])
 
             
-            hl_surf = self._highlight_font.render(hl_text, True, TITLE_COLOR)
-            surface.blit(hl_surf, (text_x, y - hl_surf.get_height() // 2))
+            hl_surf = render_text(self._highlight_font, hl_text, TITLE_COLOR)
+            layer.blit(hl_surf, (text_x, y - hl_surf.get_height() // 2))
 
-            norm_surf = self._body_font.render(norm_text, True, WHITE)
-            surface.blit(norm_surf, (text_x + hl_surf.get_width(), y - norm_surf.get_height() // 2))
+            norm_surf = render_text(self._body_font, norm_text, WHITE)
+            layer.blit(norm_surf, (text_x + hl_surf.get_width(), y - norm_surf.get_height() // 2))
+        return layer
+
+    def draw(self, surface: pygame.Surface) -> None:
+        if self._static is None:
+            self._static = self._build_static()
+        surface.blit(self._static, (0, 0))
 
-        
         mouse_pos = pygame.mouse.get_pos()
         _draw_button(surface, self._back_btn, "Back", self._btn_font,
                      hovered=self._back_btn.collidepoint(mouse_pos))
@@ -363,9 +420,10 @@ class SettingsScreen:
     _BUTTON_W = 200
     _BUTTON_H = 48
 
-    def __init__(self, width: int, height: int) -> None:
+    def __init__(self, width: int, height: int, music: MusicController) -> None:
         self._w = width
         self._h = height
+        self._music = music
 
         self._title_font = _make_bold_font(48)
         self._label_font = _make_bold_font(24)
@@ -416,6 +474,9 @@ class SettingsScreen:
         self.sens_opts  = ["0.5x", "0.8x", "1.0x", "1.2x", "1.5x", "2.0x"]
         self.sens_idx   = 2 
 
+        # Title, labels and arrow buttons; the values are drawn per frame
+        self._static: Optional[pygame.Surface] = None
+
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
         import constants 
         import sys
@@ -428,10 +489,10 @@ class SettingsScreen:
             if self._back_btn.collidepoint(m_pos):
                 return "back"
             
-            curr_vol = round(pygame.mixer.music.get_volume(), 1)
+            curr_vol = round(self._music.volume, 1)
             
-            if self._vol_down.collidepoint(m_pos):     pygame.mixer.music.set_volume(max(0.0, curr_vol - 0.1))
-            elif self._vol_up.collidepoint(m_pos):     pygame.mixer.music.set_volume(min(1.0, curr_vol + 0.1))
+            if self._vol_down.collidepoint(m_pos):     self._music.set_volume(round(curr_vol - 0.1, 1))
+            elif self._vol_up.collidepoint(m_pos):     self._music.set_volume(round(curr_vol + 0.1, 1))
             
             elif self._dur_down.collidepoint(m_pos):   constants.GAME_DURATION = max(10, constants.GAME_DURATION - 10)
             elif self._dur_up.collidepoint(m_pos):     constants.GAME_DURATION = min(300, constants.GAME_DURATION + 10)
@@ -463,45 +524,73 @@ class SettingsScreen:
 
         return None
     
+    def _build_static(self) -> pygame.Surface:
+        layer = pygame.Surface((self._w, self._h))
+        layer.fill(DARK_GRAY)
+
+        _render_shadow(layer, "SETTINGS", self._title_font, (self._w // 2, 50), color=TITLE_COLOR)
+        cx = self._w // 2
+
+        rows = [
+            ("Music Volume:",   self._vol_down,   self._vol_up),
+            ("Game Duration:",  self._dur_down,   self._dur_up),
+            ("Difficulty:",     self._diff_down,  self._diff_up),
+            ("Target Size:",    self._size_down,  self._size_up),
+            ("Crosshair Size:", self._cross_down, self._cross_up),
+            ("Mouse Speed:",    self._sens_down,  self._sens_up),
+        ]
+
+        y = 120
+        gap_y = 52
+        for label_text, btn_down, btn_up in rows:
+            label_surf = render_text(self._label_font, label_text, GRAY)
+            # Chữ bên trái cách mép giữa màn hình một khoảng
+            layer.blit(label_surf, label_surf.get_rect(midright=(cx - 40, y + 20)))
+
+            _draw_button(layer, btn_down, "<", self._btn_font)
+            _draw_button(layer, btn_up,   ">", self._btn_font)
+
+            y += gap_y
+        return layer
+
     def draw(self, surface: pygame.Surface) -> None:
         import constants
-        surface.fill(DARK_GRAY)
-        
-        _render_shadow(surface, "SETTINGS", self._title_font, (self._w // 2, 50), color=TITLE_COLOR)
+        if self._static is None:
+            self._static = self._build_static()
+        surface.blit(self._static, (0, 0))
         cx = self._w // 2
 
-        curr_vol_str = f"{int(round(pygame.mixer.music.get_volume(), 1) * 100)}%"
+        curr_vol_str = f"{int(round(self._music.volume * 100))}%"
 
-        items = [
-            ("Music Volume:", curr_vol_str, self._vol_down, self._vol_up),
-            ("Game Duration:", f"{constants.GAME_DURATION}s", self._dur_down, self._dur_up),
-            ("Difficulty:", self.diff_opts[self.diff_idx], self._diff_down, self._diff_up),
-            ("Target Size:", self.size_opts[self.size_idx], self._size_down, self._size_up),
-            ("Crosshair Size:", self.cross_opts[self.cross_idx], self._cross_down, self._cross_up),
-            ("Mouse Speed:", self.sens_opts[self.sens_idx], self._sens_down, self._sens_up)
+        values = [
+            curr_vol_str,
+            f"{constants.GAME_DURATION}s",
+            self.diff_opts[self.diff_idx],
+            self.size_opts[self.size_idx],
+            self.cross_opts[self.cross_idx],
+            self.sens_opts[self.sens_idx],
         ]
 
         y = 120
         gap_y = 52
-        for label_text, val_text, btn_down, btn_up in items:
-            label_surf = self._label_font.render(label_text, True, GRAY)
-            # Chữ bên trái cách mép giữa màn hình một khoảng
-            surface.blit(label_surf, label_surf.get_rect(midright=(cx - 40, y + 20)))
-            
-            _draw_button(surface, btn_down, "<", self._btn_font)
-            
-            val_surf = self._val_font.render(val_text, True, WHITE)
+        for val_text in values:
+            val_surf = render_text(self._val_font, val_text, WHITE)
             # Chữ ở giữa 2 nút < >
             surface.blit(val_surf, val_surf.get_rect(center=(cx + 65, y + 20)))
-            
-            _draw_button(surface, btn_up, ">", self._btn_font)
-            
             y += gap_y
 
         mouse_pos = pygame.mouse.get_pos()
         _draw_button(surface, self._back_btn, "Back", self._btn_font,
                      hovered=self._back_btn.collidepoint(mouse_pos))
         
+# (normal, hovered) background of each mode card
+_MODE_CARD_COLORS = {
+    "mode_basic":    ((40, 50, 70), (60, 80, 110)),
+    "mode_dynamic":  ((70, 40, 40), (110, 60, 60)),
+    "mode_tracking": ((40, 70, 50), (60, 110, 75)),
+}
+
+
 class ModeSelectScreen:
 
     def __init__(self, width: int, height: int) -> None:
@@ -520,13 +609,17 @@ class ModeSelectScreen:
         card_w = 320
         card_h = 140
         
-        # Tọa độ thẻ Basic Mode (Đẩy sang Trái)
+        # Tọa độ thẻ Basic Mode (Bên trái)
         self.rect_basic = pygame.Rect(0, 0, card_w, card_h)
-        self.rect_basic.center = (cx - 170, cy)
+        self.rect_basic.center = (cx - 340, cy)
         
-        # Tọa độ thẻ Dynamic Mode (Đẩy sang Phải)
+        # Tọa độ thẻ Dynamic Mode (Ở giữa)
         self.rect_dynamic = pygame.Rect(0, 0, card_w, card_h)
-        self.rect_dynamic.center = (cx + 170, cy)
+        self.rect_dynamic.center = (cx, cy)
+
+        # Tọa độ thẻ Tracking Mode (Bên phải)
+        self.rect_tracking = pygame.Rect(0, 0, card_w, card_h)
+        self.rect_tracking.center = (cx + 340, cy)
 
         # Nút Back to Menu (Ở dưới cùng)
         self.rect_back = pygame.Rect(0, 0, 200, 50)
@@ -535,9 +628,13 @@ class ModeSelectScreen:
         # Danh sách chứa (Rect hitbox, Tên action, Tên hiển thị, Mô tả)
         self._buttons = [
             (self.rect_basic, "mode_basic", "BASIC MODE", "Static targets to train pure reflex."),
-            (self.rect_dynamic, "mode_dynamic", "DYNAMIC MODE", "Moving targets! Test your tracking."),
+            (self.rect_dynamic, "mode_dynamic", "DYNAMIC MODE", "Moving targets! Test your flicks."),
+            (self.rect_tracking, "mode_tracking", "TRACKING MODE", "Keep your crosshair on the target."),
             (self.rect_back, "back", "Back", "")
         ]
+        self._hitboxes = [rect for rect, _, _, _ in self._buttons]
+
+        self._static: Optional[pygame.Surface] = None
 
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
         # Bấm ESC để quay lại Menu
@@ -545,17 +642,23 @@ class ModeSelectScreen:
             return "back"
             
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            pos = event.pos
-            for rect, action, _, _ in self._buttons:
-                if rect.collidepoint(pos):
-                    return action
+            i = _button_at(self._hitboxes, event.pos)
+            if i >= 0:
+                return self._buttons[i][1]
         return None
 
+    def _build_static(self) -> pygame.Surface:
+        layer = pygame.Surface((self._w, self._h))
+        layer.fill(DARK_GRAY)
+        pygame.draw.rect(layer, (30, 30, 50), pygame.Rect(0, 0, self._w, 8))
+
+        _render_shadow(layer, "SELECT GAME MODE", self._title_font, (self._w // 2, 90), color=TITLE_COLOR)
+        return layer
+
     def draw(self, surface: pygame.Surface) -> None:
-        surface.fill(DARK_GRAY)
-        pygame.draw.rect(surface, (30, 30, 50), pygame.Rect(0, 0, self._w, 8))
-        
-        _render_shadow(surface, "SELECT GAME MODE", self._title_font, (self._w // 2, 90), color=TITLE_COLOR)
+        if self._static is None:
+            self._static = self._build_static()
+        surface.blit(self._static, (0, 0))
 
         mouse_pos = pygame.mouse.get_pos()
         
@@ -570,12 +673,13 @@ class ModeSelectScreen:
                 text_color = BTN_TEXT
                 font = self._back_font
             else:
-                # Mode Basic (Tone Xanh) và Dynamic (Tone Đỏ)
+                # Mode Basic (Tone Xanh dương), Dynamic (Tone Đỏ), Tracking (Tone Xanh lá)
+                normal, hover = _MODE_CARD_COLORS[action]
                 if is_hovered:
-                    bg_color = (60, 80, 110) if action == "mode_basic" else (110, 60, 60)
+                    bg_color = hover
                     border_color = TITLE_COLOR
                 else:
-                    bg_color = (40, 50, 70) if action == "mode_basic" else (70, 40, 40)
+                    bg_color = normal
                     border_color = GRAY
                 text_color = WHITE
                 font = self._btn_font
@@ -586,103 +690,174 @@ class ModeSelectScreen:
 
             # Vẽ chữ bên trong
             if is_back:
-                text_surf = font.render(label, True, text_color)
+                text_surf = render_text(font, label, text_color)
                 surface.blit(text_surf, text_surf.get_rect(center=rect.center))
             else:
                 # Tiêu đề chế độ (Nửa trên của Card)
                 highlight = TITLE_COLOR if is_hovered else text_color
-                text_surf = font.render(label, True, highlight)
+                text_surf = render_text(font, label, highlight)
                 surface.blit(text_surf, text_surf.get_rect(center=(rect.centerx, rect.centery - 15)))
                 
                 # Mô tả chế độ (Nửa dưới của Card)
-                desc_surf = self._desc_font.render(desc, True, (200, 200, 200))
+                desc_surf = render_text(self._desc_font, desc, (200, 200, 200))
                 surface.blit(desc_surf, desc_surf.get_rect(center=(rect.centerx, rect.centery + 25)))
                 
-import json
-import os
+_CHART_METRICS = [("score", "Score"), ("accuracy", "Accuracy"), ("avg_reaction", "Reaction")]
+_CHART_TITLES  = {"score": "Score", "accuracy": "Accuracy (%)", "avg_reaction": "Avg Reaction (ms)"}
+
 
 class StatsScreen:
-    def __init__(self, width: int, height: int) -> None:
+    def __init__(self, width: int, height: int, store: SessionStore) -> None:
         self._w = width
         self._h = height
+        self._store = store
         self._title_font = _make_bold_font(48)
         self._label_font = _make_bold_font(22)
         self._val_font   = _make_font(22)
         self._btn_font   = _make_font(22)
+        self._small_font = _make_font(18)
 
         self._back_btn = pygame.Rect(0, 0, 200, 48)
         self._back_btn.center = (width // 2, height - 50)
-        self.data = []
+        self.summary = StatsSummary()
+        self._static: Optional[pygame.Surface] = None
+        self._static_revision = -1
+
+        # Biểu đồ lịch sử: kéo để cuộn, lăn chuột để phóng to
+        self._chart  = HistoryChart(pygame.Rect(400, 130, width - 440, 430), self._small_font)
+        self._metric = "score"
+        self._mode: Optional[str] = None
+        self._series: dict[tuple, tuple] = {}     # (metric, mode) -> (values, last row id)
+        self._stale: set[tuple] = set()
+        self._metric_tabs = [
+            (field, label, pygame.Rect(400 + i * 120, 92, 110, 30))
+            for i, (field, label) in enumerate(_CHART_METRICS)
+        ]
+        self._mode_tabs: list[tuple[Optional[str], str, pygame.Rect]] = []
 
     def load_data(self) -> None:
-        """Đọc file JSON mỗi khi mở màn hình này lên"""
-        self.data = []
-        if os.path.exists("stats.json"):
+        """Đọc bản tóm tắt (một dòng) từ SessionStore mỗi khi mở màn hình"""
+        try:
+            self.summary = self._store.summary()
+        except sqlite3.Error:
+            self.summary = StatsSummary()
+        # Bảng kỷ lục và biểu đồ chỉ vẽ lại khi có ván mới
+        if self.summary.revision != self._static_revision:
+            self._static = None
+            self._stale = set(self._series)
+            self._chart.clear_cache()
+            modes = [(None, "All")] + [(m, m.capitalize()) for m in sorted(self.summary.high_scores)]
+            right = self._chart.rect.right
+            self._mode_tabs = [
+                (mode, label, pygame.Rect(right - (len(modes) - i) * 120 + 10, 92, 110, 30))
+                for i, (mode, label) in enumerate(modes)
+            ]
+            if self._mode not in self.summary.high_scores:
+                self._mode = None
+            self._select(self._metric, self._mode)
+
+    def _select(self, metric: str, mode: Optional[str]) -> None:
+        """Đổi chuỗi dữ liệu của biểu đồ; chỉ đọc thêm các ván mới từ lần trước"""
+        self._metric, self._mode = metric, mode
+        key = (metric, mode)
+        values, last_id = self._series.get(key, (None, 0))
+        if values is None or key in self._stale:
             try:
-                with open("stats.json", "r") as f:
-                    self.data = json.load(f)
-            except Exception:
-                pass
+                # Ván Tracking lưu độ chính xác ở cột riêng
+                column = "tracking_accuracy" if metric == "accuracy" and mode == "tracking" else metric
+                new_values, last_id = self._store.series(column, mode, after_id=last_id)
+            except sqlite3.Error:
+                new_values = np.zeros(0)
+            values = new_values if values is None else np.concatenate((values, new_values))
+            self._series[key] = (values, last_id)
+            self._stale.discard(key)
+        self._chart.set_series(key, values)
 
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE: return "back"
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self._back_btn.collidepoint(event.pos): return "back"
+            for field, _, rect in self._metric_tabs:
+                if rect.collidepoint(event.pos):
+                    self._select(field, self._mode)
+                    return None
+            for mode, _, rect in self._mode_tabs:
+                if rect.collidepoint(event.pos):
+                    self._select(self._metric, mode)
+                    return None
+        self._chart.handle_event(event)
         return None
 
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.fill(DARK_GRAY)
-        pygame.draw.rect(surface, (30, 30, 50), pygame.Rect(0, 0, self._w, 8))
-        _render_shadow(surface, "PLAYER STATISTICS", self._title_font, (self._w // 2, 50), color=TITLE_COLOR)
+    def _build_static(self) -> pygame.Surface:
+        layer = pygame.Surface((self._w, self._h))
+        layer.fill(DARK_GRAY)
+        pygame.draw.rect(layer, (30, 30, 50), pygame.Rect(0, 0, self._w, 8))
+        _render_shadow(layer, "PLAYER STATISTICS", self._title_font, (self._w // 2, 50), color=TITLE_COLOR)
 
-        if not self.data:
-            msg = self._val_font.render("No game data found. Play a round first!", True, GRAY)
-            surface.blit(msg, msg.get_rect(center=(self._w // 2, self._h // 2)))
+        if not self.summary.total_games:
+            msg = render_text(self._val_font, "No game data found. Play a round first!", GRAY)
+            layer.blit(msg, msg.get_rect(center=(self._w // 2, self._h // 2)))
         else:
             # --- TÍNH TOÁN KỶ LỤC ---
-            total_games = len(self.data)
-            high_score = max((d.get("score", 0) for d in self.data), default=0)
-            best_acc = max((d.get("accuracy", 0) for d in self.data), default=0)
-            valid_rt = [d.get("best_reaction", 0) for d in self.data if d.get("best_reaction", 0) > 0]
-            best_react = min(valid_rt) if valid_rt else 0
+            summary = self.summary
+            high_score = summary.high_score
 
             # --- VẼ BẢNG KỶ LỤC (BÊN TRÁI) ---
             start_x, start_y = 60, 150
-            pygame.draw.rect(surface, (35, 35, 45), (start_x - 20, start_y - 20, 300, 240), border_radius=12)
-            pygame.draw.rect(surface, GRAY, (start_x - 20, start_y - 20, 300, 240), width=2, border_radius=12)
+            pygame.draw.rect(layer, (35, 35, 45), (start_x - 20, start_y - 20, 300, 240), border_radius=12)
+            pygame.draw.rect(layer, GRAY, (start_x - 20, start_y - 20, 300, 240), width=2, border_radius=12)
             
             stats = [
-                ("Total Matches:", f"{total_games}", WHITE),
+                ("Total Matches:", f"{summary.total_games}", WHITE),
                 ("High Score:", f"{high_score}", YELLOW),
-                ("Best Accuracy:", f"{best_acc}%", GREEN),
-                ("Best Reaction:", f"{best_react} ms", TITLE_COLOR),
             ]
+            for mode, best in sorted(summary.high_scores.items()):
+                stats.append((f"  {mode.capitalize()}:", f"{best}", YELLOW))
+            stats += [
+                ("Best Accuracy:", f"{summary.best_accuracy}%", GREEN),
+                ("Best Reaction:", f"{summary.best_reaction} ms", TITLE_COLOR),
+            ]
+            row_h = min(50, 200 // max(1, len(stats) - 1))
             for i, (lbl, val, col) in enumerate(stats):
-                y = start_y + i * 50
-                surface.blit(self._label_font.render(lbl, True, GRAY), (start_x, y))
-                val_surf = self._val_font.render(val, True, col)
-                surface.blit(val_surf, val_surf.get_rect(topright=(start_x + 260, y)))
-
-            # --- VẼ BIỂU ĐỒ 10 TRẬN GẦN NHẤT (BÊN PHẢI) ---
-            graph_x, graph_y, graph_w, graph_h = 420, 130, 320, 240
-            pygame.draw.rect(surface, (30, 30, 30), (graph_x, graph_y, graph_w, graph_h), border_radius=8)
-            pygame.draw.rect(surface, GRAY, (graph_x, graph_y, graph_w, graph_h), width=2, border_radius=8)
+                y = start_y + i * row_h
+                layer.blit(render_text(self._label_font, lbl, GRAY), (start_x, y))
+                val_surf = render_text(self._val_font, val, col)
+                layer.blit(val_surf, val_surf.get_rect(topright=(start_x + 260, y)))
+
+            # --- VẼ BIỂU ĐỒ 10 TRẬN GẦN NHẤT (BÊN TRÁI, DƯỚI BẢNG KỶ LỤC) ---
+            graph_x, graph_y, graph_w, graph_h = 40, 390, 300, 170
+            pygame.draw.rect(layer, (30, 30, 30), (graph_x, graph_y, graph_w, graph_h), border_radius=8)
+            pygame.draw.rect(layer, GRAY, (graph_x, graph_y, graph_w, graph_h), width=2, border_radius=8)
             
-            title = self._val_font.render("Recent Scores (Last 10)", True, WHITE)
-            surface.blit(title, title.get_rect(center=(graph_x + graph_w // 2, graph_y + 20)))
+            title = render_text(self._val_font, "Recent Scores (Last 10)", WHITE)
+            layer.blit(title, title.get_rect(center=(graph_x + graph_w // 2, graph_y + 20)))
 
-            recent = [d.get("score", 0) for d in self.data[-10:]]
+            recent = [d.get("score") or 0 for d in summary.recent]
             if recent:
                 max_s = max(recent) if max(recent) > 0 else 1
                 bar_w = 20
                 gap = (graph_w - 40 - len(recent) * bar_w) // (len(recent) + 1)
                 
                 for i, s in enumerate(recent):
-                    b_height = int((s / max_s) * 150) # Chiều cao tối đa 150px
+                    b_height = int((s / max_s) * 110) # Chiều cao tối đa 110px
                     bx = graph_x + 20 + gap + i * (bar_w + gap)
-                    by = graph_y + graph_h - 20 - b_height
+                    by = graph_y + graph_h - 15 - b_height
                     color = YELLOW if s == high_score else BLUE
-                    pygame.draw.rect(surface, color, (bx, by, bar_w, b_height), border_radius=3)
+                    pygame.draw.rect(layer, color, (bx, by, bar_w, b_height), border_radius=3)
+        return layer
+
+    def draw(self, surface: pygame.Surface) -> None:
+        if self._static is None:
+            self._static = self._build_static()
+            self._static_revision = self.summary.revision
+        surface.blit(self._static, (0, 0))
 
         mouse_pos = pygame.mouse.get_pos()
+        if self.summary.total_games:
+            for field, label, rect in self._metric_tabs:
+                _draw_button(surface, rect, label, self._small_font, hovered=field == self._metric)
+            for mode, label, rect in self._mode_tabs:
+                _draw_button(surface, rect, label, self._small_font, hovered=mode == self._mode)
+            mode_name = self._mode.capitalize() if self._mode else "All modes"
+            self._chart.draw(surface, f"{_CHART_TITLES[self._metric]} - {mode_name}")
         _draw_button(surface, self._back_btn, "Back", self._btn_font, hovered=self._back_btn.collidepoint(mouse_pos))
\ No newline at end of file
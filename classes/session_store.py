@@ -0,0 +1,241 @@
+"""
+SessionStore — SQLite-backed history of finished rounds.
+
+Every round used to be appended by reading the whole ``stats.json``,
+adding one dict and rewriting the file, so the cost of saving grew with
+the history.  The store keeps one row per session in a SQLite table with
+indexes on ``mode`` and ``date``; appending is a single ``INSERT`` no
+matter how many rounds came before.  The database runs in WAL mode, so a
+reader (the statistics screen) never blocks a writer.
+
+On first open an existing ``stats.json`` is imported once; the JSON file is
+left untouched and a flag in the ``meta`` table prevents a second import.
+
+A :class:`StatsSummary` is kept in the ``meta`` table and updated in the
+same transaction as every insert, so the statistics screen reads one row
+instead of scanning the history.
+"""
+
+from __future__ import annotations
+import json
+import os
+import sqlite3
+from typing import Any, Iterable, Iterator, Optional
+
+import numpy as np
+
+from classes.stats_summary import StatsSummary
+
+_DB_PATH     = "stats.db"
+_LEGACY_JSON = "stats.json"
+_SUMMARY_KEY = "summary"
+
+# Column name -> SQLite type, in record order.  Columns added here later are
+# created on existing databases by _ensure_columns().
+FIELDS: dict[str, str] = {
+    "date":          "TEXT",
+    "mode":          "TEXT",
+    "score":         "INTEGER",
+    "hits":          "INTEGER",
+    "misses":        "INTEGER",
+    "accuracy":      "REAL",
+    "avg_reaction":  "REAL",
+    "best_reaction": "REAL",
+    "max_combo":     "INTEGER",
+    "reaction_std":  "REAL",
+    "p50_reaction":  "REAL",
+    "p90_reaction":  "REAL",
+    "p99_reaction":  "REAL",
+    "tracking_accuracy": "REAL",
+}
+
+
+class SessionStore:
+    """
+    Append-only store of session records (plain dicts, as saved by
+    :meth:`ScoreManager.save_session`).
+
+    Typical usage::
+
+        store = SessionStore()
+        store.append({"date": "...", "mode": "basic", "score": 9000, ...})
+        recent = store.recent(10)
+    """
+
+    def __init__(
+        self,
+        path: str = _DB_PATH,
+        legacy_json: Optional[str] = _LEGACY_JSON,
+        synchronous: str = "NORMAL",
+    ) -> None:
+        """
+        Args:
+            path:        SQLite database file.
+            legacy_json: ``stats.json`` to import on first open (``None`` to skip).
+            synchronous: SQLite ``synchronous`` pragma; ``"FULL"`` makes every
+                         committed append survive a power loss.
+        """
+        self._path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._create_schema()
+        if legacy_json:
+            self._migrate_json(legacy_json)
+        self._ensure_summary()
+
+    # ------------------------------------------------------------------
+    # Schema
+    # ------------------------------------------------------------------
+
+    def _create_schema(self) -> None:
+        columns = ", ".join(f"{name} {sqltype}" for name, sqltype in FIELDS.items())
+        with self._conn:
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS sessions (id INTEGER PRIMARY KEY, {columns})")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self._ensure_columns()
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_mode ON sessions (mode, id)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_date ON sessions (date)")
+
+    def _ensure_columns(self) -> None:
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(sessions)")}
+        for name, sqltype in FIELDS.items():
+            if name not in existing:
+                self._conn.execute(f"ALTER TABLE sessions ADD COLUMN {name} {sqltype}")
+
+    def _migrate_json(self, legacy_json: str) -> None:
+        if self.get_meta("migrated_json") is not None or not os.path.exists(legacy_json):
+            return
+        try:
+            with open(legacy_json, "r") as f:
+                records = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(records, list):
+            return
+        with self._conn:
+            self._extend(r for r in records if isinstance(r, dict))
+            self._set_meta("migrated_json", legacy_json)
+
+    def _ensure_summary(self) -> None:
+        # Databases written before the summary existed get it built once
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            if self.get_meta(_SUMMARY_KEY) is None:
+                summary = StatsSummary.rebuild(self._iter_records())
+                self._set_meta(_SUMMARY_KEY, summary.to_json())
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _insert_sql() -> str:
+        names = ", ".join(FIELDS)
+        marks = ", ".join("?" for _ in FIELDS)
+        return f"INSERT INTO sessions ({names}) VALUES ({marks})"
+
+    @staticmethod
+    def _row(record: dict[str, Any]) -> tuple:
+        return tuple(record.get(name) for name in FIELDS)
+
+    def append(self, record: dict[str, Any]) -> int:
+        """
+        Insert one session and fold it into the summary, in one transaction.
+
+        Returns:
+            The new row id.
+        """
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            cur = self._conn.execute(self._insert_sql(), self._row(record))
+            summary = self.summary()
+            summary.add(record)
+            self._set_meta(_SUMMARY_KEY, summary.to_json())
+        return cur.lastrowid
+
+    def extend(self, records: Iterable[dict[str, Any]]) -> None:
+        """Insert many sessions (and update the summary) in one transaction."""
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._extend(records)
+
+    def _extend(self, records: Iterable[dict[str, Any]]) -> None:
+        summary = self.summary()
+
+        def rows():
+            for record in records:
+                summary.add(record)
+                yield self._row(record)
+
+        self._conn.executemany(self._insert_sql(), rows())
+        self._set_meta(_SUMMARY_KEY, summary.to_json())
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def count(self, mode: Optional[str] = None) -> int:
+        if mode is None:
+            return self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+        return self._conn.execute("SELECT COUNT(*) FROM sessions WHERE mode = ?", (mode,)).fetchone()[0]
+
+    def recent(self, n: int, mode: Optional[str] = None) -> list[dict[str, Any]]:
+        """The last *n* sessions (optionally of one *mode*), oldest first."""
+        names = ", ".join(FIELDS)
+        if mode is None:
+            rows = self._conn.execute(
+                f"SELECT {names} FROM sessions ORDER BY id DESC LIMIT ?", (n,)).fetchall()
+        else:
+            rows = self._conn.execute(
+                f"SELECT {names} FROM sessions WHERE mode = ? ORDER BY id DESC LIMIT ?", (mode, n)).fetchall()
+        return [dict(zip(FIELDS, row)) for row in reversed(rows)]
+
+    def series(self, field: str, mode: Optional[str] = None, after_id: int = 0) -> tuple[np.ndarray, int]:
+        """
+        One numeric column for charting, oldest first.  Sessions without a
+        value (e.g. ``accuracy`` of a tracking round) are skipped.
+
+        Args:
+            field:    Numeric column from :data:`FIELDS`.
+            mode:     Only sessions of this mode (``None`` for all).
+            after_id: Only sessions newer than this row id, to extend a
+                      series that was loaded before.
+
+        Returns:
+            ``(values, last_id)`` — pass ``last_id`` back as *after_id*.
+        """
+        if FIELDS.get(field) not in ("INTEGER", "REAL"):
+            raise ValueError(f"not a numeric session field: {field!r}")
+        last_id = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM sessions").fetchone()[0]
+        sql = f"SELECT {field} FROM sessions WHERE {field} IS NOT NULL AND id > ? AND id <= ?"
+        params: tuple = (after_id, last_id)
+        if mode is not None:
+            sql += " AND mode = ?"
+            params += (mode,)
+        cur = self._conn.execute(sql + " ORDER BY id", params)
+        return np.fromiter((row[0] for row in cur), dtype=np.float64), last_id
+
+    def summary(self) -> StatsSummary:
+        """Records over the whole history, read from a single row."""
+        text = self.get_meta(_SUMMARY_KEY)
+        return StatsSummary.from_json(text) if text else StatsSummary()
+
+    def load_all(self) -> list[dict[str, Any]]:
+        """Every session, oldest first."""
+        return list(self._iter_records())
+
+    def _iter_records(self) -> Iterator[dict[str, Any]]:
+        names = ", ".join(FIELDS)
+        for row in self._conn.execute(f"SELECT {names} FROM sessions ORDER BY id"):
+            yield dict(zip(FIELDS, row))
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,167 @@
+"""
+SessionWriter — saves finished rounds on a background thread.
+
+The round ends inside ``App._update``; writing the session there put disk
+latency on that frame.  ``submit`` only puts the record on a bounded queue
+and returns, so the results screen shows up on the next frame however slow
+the disk is.  A single writer thread owns its own SQLite connection and
+inserts each record in its own transaction with ``synchronous=FULL``: a
+crash or power loss leaves either the whole session or none of it.
+
+Failures are logged and counted instead of disappearing.  ``close`` (called
+from ``App._quit`` and at interpreter exit) drains the queue first.
+"""
+
+from __future__ import annotations
+import atexit
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from classes.session_store import SessionStore, _DB_PATH
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()   # queue sentinel that ends the writer thread
+
+
+class SessionWriter:
+    """
+    Background writer for session records.
+
+    Typical usage::
+
+        writer = SessionWriter()
+        writer.submit(record)        # never blocks
+        writer.flush(timeout=1.0)    # wait until everything submitted is on disk
+        writer.close()
+
+    ``written``, ``failed`` and ``dropped`` count sessions stored, sessions
+    whose insert raised, and sessions rejected because the queue was full.
+    """
+
+    def __init__(self, path: str = _DB_PATH, maxsize: int = 64) -> None:
+        """
+        Args:
+            path:    SQLite database file (shared with the readers'
+                     :class:`SessionStore`).
+            maxsize: Records that may wait for the disk before ``submit``
+                     starts dropping them.
+        """
+        self._path  = path
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._done  = threading.Condition()
+        self._submitted = 0
+        self._finished  = 0
+        self._closed    = False
+
+        self.written: int = 0
+        self.failed:  int = 0
+        self.dropped: int = 0
+        self.last_latency_ms:  float = 0.0
+        self.max_latency_ms:   float = 0.0
+        self._total_latency_ms: float = 0.0
+
+        self._thread = threading.Thread(target=self._run, name="session-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    # ------------------------------------------------------------------
+    # Game thread
+    # ------------------------------------------------------------------
+
+    def submit(self, record: dict[str, Any]) -> bool:
+        """Queue *record* for writing; returns ``False`` if it was dropped."""
+        if self._closed:
+            self.dropped += 1
+            logger.error("session writer closed; dropping session %s", record.get("date"))
+            return False
+        with self._done:
+            self._submitted += 1
+        try:
+            self._queue.put_nowait((time.perf_counter(), record))
+        except queue.Full:
+            with self._done:
+                self._submitted -= 1
+            self.dropped += 1
+            logger.error("session queue full; dropping session %s", record.get("date"))
+            return False
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted record has been handled; ``False`` on timeout."""
+        with self._done:
+            return self._done.wait_for(lambda: self._finished >= self._submitted, timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write what is queued, then stop the thread (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.error("session writer did not finish within %.1f s", timeout)
+
+    @property
+    def pending(self) -> int:
+        return self._submitted - self._finished
+
+    def stats(self) -> dict[str, float]:
+        avg = self._total_latency_ms / self.written if self.written else 0.0
+        return {
+            "written":         self.written,
+            "failed":          self.failed,
+            "dropped":         self.dropped,
+            "pending":         self.pending,
+            "avg_latency_ms":  round(avg, 3),
+            "max_latency_ms":  round(self.max_latency_ms, 3),
+            "last_latency_ms": round(self.last_latency_ms, 3),
+        }
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        try:
+            store = SessionStore(self._path, legacy_json=None, synchronous="FULL")
+        except sqlite3.Error:
+            logger.exception("could not open session store %s", self._path)
+            store = None
+
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            queued_at, record = item
+            self._write(store, queued_at, record)
+
+        if store is not None:
+            store.close()
+
+    def _write(self, store: Optional[SessionStore], queued_at: float, record: dict[str, Any]) -> None:
+        try:
+            if store is None:
+                self.failed += 1
+                logger.error("session store unavailable; session %s not saved", record.get("date"))
+                return
+            store.append(record)
+        except sqlite3.Error:
+            self.failed += 1
+            logger.exception("failed to save session %s", record.get("date"))
+        else:
+            # Latency from submit to durable commit, including time queued
+            ms = (time.perf_counter() - queued_at) * 1000
+            self.written += 1
+            self.last_latency_ms = ms
+            self.max_latency_ms  = max(self.max_latency_ms, ms)
+            self._total_latency_ms += ms
+            logger.debug("session saved in %.2f ms", ms)
+        finally:
+            with self._done:
+                self._finished += 1
+                self._done.notify_all()
@@ -0,0 +1,119 @@
+"""
+SoundBank — decode each sound effect once and reuse the raw PCM.
+
+``pygame.mixer.Sound("hit.mp3")`` decodes and resamples the MP3 on every
+launch.  The bank does that once, then writes the samples exactly as the
+mixer holds them (its native rate, sample format and channel count) to a
+cache file next to the assets.  On later runs the cache file is
+memory-mapped and handed to ``pygame.mixer.Sound(buffer=...)``, skipping
+the decoder.  The mixer still copies the samples into its own chunk, so
+the mapping only spares the intermediate ``bytes`` a plain read would
+build; the load is one copy of the PCM, not zero.
+
+Each cache file starts with a small header recording the source file's
+mtime and size and the mixer format it was decoded for; any mismatch
+(edited asset, different mixer settings) makes the bank decode again and
+rewrite the cache.
+"""
+
+from __future__ import annotations
+import logging
+import mmap
+import os
+import struct
+import time
+from typing import Optional
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+_BASE       = os.path.join(os.path.dirname(__file__), "..")
+_SOUNDS_DIR = os.path.join(_BASE, "sounds")
+
+_MAGIC  = b"AIMPCM1\0"
+# magic, source mtime_ns, source size, frequency, sample size, channels
+_HEADER = struct.Struct("<8sqqiii")
+
+
+class SoundBank:
+    """
+    Loads sound effects through a per-asset raw PCM cache.
+
+    ``load_times`` maps each loaded name to ``(milliseconds, source)``
+    where source is ``"cache"`` or ``"decode"``.
+    """
+
+    def __init__(self, sounds_dir: str = _SOUNDS_DIR, cache_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            sounds_dir: Directory holding the source audio files.
+            cache_dir:  Where PCM cache files go; defaults to
+                        ``<sounds_dir>/.cache``.
+        """
+        self._sounds_dir = sounds_dir
+        self._cache_dir  = cache_dir or os.path.join(sounds_dir, ".cache")
+        self.load_times: dict[str, tuple[float, str]] = {}
+
+    def load_all(self, files: dict[str, str]) -> dict[str, pygame.mixer.Sound | None]:
+        """Load every ``name -> filename`` pair; failed loads map to ``None``."""
+        return {name: self.load(name, filename) for name, filename in files.items()}
+
+    def load(self, name: str, filename: str) -> "pygame.mixer.Sound | None":
+        """Load one sound, from the PCM cache when it is still valid."""
+        mixer_format = pygame.mixer.get_init()
+        if mixer_format is None:
+            return None
+
+        path = os.path.join(self._sounds_dir, filename)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        start  = time.perf_counter()
+        header = _HEADER.pack(_MAGIC, st.st_mtime_ns, st.st_size, *mixer_format)
+        cache_path = os.path.join(self._cache_dir, f"{filename}.pcm")
+
+        sound  = self._load_cached(cache_path, header)
+        source = "cache"
+        if sound is None:
+            source = "decode"
+            try:
+                sound = pygame.mixer.Sound(path)
+            except Exception:
+                return None
+            self._write_cache(cache_path, header, sound)
+
+        ms = (time.perf_counter() - start) * 1000
+        self.load_times[name] = (ms, source)
+        logger.info("sound %-6s %6.2f ms (%s)", name, ms, source)
+        return sound
+
+    @staticmethod
+    def _load_cached(cache_path: str, header: bytes) -> "pygame.mixer.Sound | None":
+        try:
+            with open(cache_path, "rb") as f:
+                if f.read(_HEADER.size) != header:
+                    return None
+                # Sound(buffer=) copies into the mixer's chunk, so the
+                # mapping can be closed as soon as it returns
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)[_HEADER.size:]
+                    try:
+                        return pygame.mixer.Sound(buffer=view)
+                    finally:
+                        view.release()
+        except (OSError, ValueError, pygame.error):
+            return None
+
+    def _write_cache(self, cache_path: str, header: bytes, sound: pygame.mixer.Sound) -> None:
+        tmp = cache_path + ".tmp"
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(header)
+                f.write(sound.get_raw())
+            os.replace(tmp, cache_path)
+        except OSError:
+            pass   # the cache is an optimisation; a read-only install still works
@@ -0,0 +1,46 @@
+"""
+StartupTimeline — wall-clock timings of each initialisation phase.
+
+Used by ``App.__init__`` to show where time-to-first-frame goes::
+
+    timeline = StartupTimeline()
+    with timeline.phase("pygame.init"):
+        pygame.init()
+    ...
+    timeline.first_frame()      # logs the whole timeline once
+"""
+
+from __future__ import annotations
+import logging
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimeline:
+    """Records ``(phase, milliseconds)`` pairs from process start-up."""
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self.phases: list[tuple[str, float]] = []
+        self.first_frame_ms: float | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the body of the ``with`` block as phase *name*."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, (time.perf_counter() - start) * 1000))
+
+    def first_frame(self) -> None:
+        """Record time-to-first-frame and log the timeline (only once)."""
+        if self.first_frame_ms is not None:
+            return
+        self.first_frame_ms = (time.perf_counter() - self._origin) * 1000
+        for name, ms in self.phases:
+            logger.info("startup %-12s %8.1f ms", name, ms)
+        logger.info("startup %-12s %8.1f ms", "first frame", self.first_frame_ms)
@@ -1,4 +1,21 @@
+"""
+Game states and the table that dispatches to them.
+
+Each state registers a :class:`StateHandler`: its event, update and draw
+callbacks, enter/exit hooks, and the event types it actually consumes.
+On a transition the manager runs the hooks and narrows SDL's event filter
+to that state's types (``pygame.event.set_blocked`` / ``set_allowed``), so
+events nobody would look at — button releases and wheel ticks during a
+round, key releases in the menus — are dropped by SDL and never turn into
+Python objects.  ``QUIT`` and window events are always let through.
+"""
+
+from __future__ import annotations
+import time
 from enum import Enum
+from typing import Callable, Iterable, Optional
+
+import pygame
 
 
 class GameState(Enum):
@@ -12,15 +29,125 @@ class GameState(Enum):
     STATISTICS   = "statistics"
 
 
+# Never filtered out, whatever the state
+_ALWAYS_ALLOWED = tuple(
+    getattr(pygame, name) for name in (
+        "QUIT", "ACTIVEEVENT", "VIDEORESIZE", "VIDEOEXPOSE",
+        "WINDOWSHOWN", "WINDOWHIDDEN", "WINDOWEXPOSED", "WINDOWMOVED",
+        "WINDOWRESIZED", "WINDOWSIZECHANGED", "WINDOWMINIMIZED",
+        "WINDOWMAXIMIZED", "WINDOWRESTORED", "WINDOWENTER", "WINDOWLEAVE",
+        "WINDOWFOCUSGAINED", "WINDOWFOCUSLOST", "WINDOWCLOSE",
+    )
+    if hasattr(pygame, name)
+)
+
+
+class StateHandler:
+    """
+    Callbacks for one :class:`GameState`; everything but *handle_event* is optional.
+
+    Args:
+        handle_event: Called with each event while the state is active.
+        draw:         Draws the state's frame onto the display surface.
+        update:       Called once per frame with the frame time in ms.
+        on_enter:     Called after entering, with the previous state.
+        on_exit:      Called before leaving, with the next state.
+        event_types:  Event types the state consumes; ``None`` allows all.
+    """
+
+    __slots__ = ("handle_event", "draw", "update", "on_enter", "on_exit", "event_types")
+
+    def __init__(
+        self,
+        handle_event: Callable[[pygame.event.Event], None],
+        draw: Optional[Callable[[], None]] = None,
+        update: Optional[Callable[[int], None]] = None,
+        on_enter: Optional[Callable[[GameState], None]] = None,
+        on_exit: Optional[Callable[[GameState], None]] = None,
+        event_types: Optional[Iterable[int]] = None,
+    ) -> None:
+        self.handle_event = handle_event
+        self.draw         = draw
+        self.update       = update
+        self.on_enter     = on_enter
+        self.on_exit      = on_exit
+        self.event_types  = None if event_types is None else tuple(event_types)
+
+
 class GameStateManager:
 
     def __init__(self, initial_state: GameState = GameState.START) -> None:
         self.current_state: GameState = initial_state
+        self._handlers: dict[GameState, StateHandler] = {}
+
+        # Events handed to each state and the time spent in it
+        self._events:  dict[GameState, int]   = {}
+        self._seconds: dict[GameState, float] = {}
+        self._entered_at = time.perf_counter()
+
+    def register(self, state: GameState, handler: StateHandler) -> None:
+        """Add *state* to the dispatch table; applies its filter if it is current."""
+        self._handlers[state] = handler
+        if state is self.current_state:
+            self._apply_filter(handler)
+
+    @property
+    def handler(self) -> Optional[StateHandler]:
+        return self._handlers.get(self.current_state)
 
     def transition_to(self, state: GameState) -> None:
         if not isinstance(state, GameState):
             raise TypeError(f"Expected a GameState member, got {type(state)!r}.")
+        previous = self.current_state
+        if state is previous:
+            return
+
+        old = self._handlers.get(previous)
+        if old is not None and old.on_exit is not None:
+            old.on_exit(state)
+
+        now = time.perf_counter()
+        self._seconds[previous] = self._seconds.get(previous, 0.0) + now - self._entered_at
+        self._entered_at = now
         self.current_state = state
 
+        new = self._handlers.get(state)
+        if new is not None:
+            self._apply_filter(new)
+            if new.on_enter is not None:
+                new.on_enter(previous)
+
     def is_state(self, state: GameState) -> bool:
         return self.current_state is state
+
+    def dispatch(self, event: pygame.event.Event) -> None:
+        """Hand *event* to the current state's handler."""
+        state = self.current_state
+        self._events[state] = self._events.get(state, 0) + 1
+        handler = self._handlers.get(state)
+        if handler is not None:
+            handler.handle_event(event)
+
+    @staticmethod
+    def _apply_filter(handler: StateHandler) -> None:
+        if not pygame.display.get_init():
+            return
+        if handler.event_types is None:
+            pygame.event.set_allowed(None)
+        else:
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(list(handler.event_types + _ALWAYS_ALLOWED))
+
+    def stats(self) -> dict:
+        """Events dispatched per state, with the rate over the time spent there."""
+        seconds = dict(self._seconds)
+        seconds[self.current_state] = (
+            seconds.get(self.current_state, 0.0) + time.perf_counter() - self._entered_at
+        )
+        return {
+            state.value: {
+                "events":     count,
+                "per_second": round(count / seconds[state], 1) if seconds.get(state) else 0.0,
+            }
+            for state, count in self._events.items()
+        }
@@ -0,0 +1,89 @@
+"""
+StatsSummary — running records for the statistics screen.
+
+The screen only needs a handful of numbers (games played, best score per
+mode, best accuracy, fastest reaction, the last few scores).  Recomputing
+them means scanning every session ever played; keeping them up to date is
+O(1) per new session.  :class:`SessionStore` stores the summary as one JSON
+row next to the sessions and updates it in the same transaction as each
+insert, so it can never disagree with the table.
+"""
+
+from __future__ import annotations
+import json
+from collections import deque
+from typing import Any, Iterable
+
+RECENT_SIZE = 10
+
+
+class StatsSummary:
+    """
+    Aggregates over every session, maintained incrementally.
+
+    ``revision`` increases with every :meth:`add`; views cache what they
+    render from the summary and rebuild only when the revision changes.
+    """
+
+    def __init__(self) -> None:
+        self.total_games:   int = 0
+        self.high_scores:   dict[str, int] = {}
+        self.best_accuracy: float = 0.0
+        self.best_reaction: float = 0.0      # fastest non-zero reaction, 0 if none
+        self.recent: deque[dict[str, Any]] = deque(maxlen=RECENT_SIZE)
+        self.revision:      int = 0
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Fold one session record into the summary."""
+        mode     = record.get("mode") or "basic"
+        score    = record.get("score") or 0
+        accuracy = record.get("accuracy") or 0.0     # None for tracking rounds
+        reaction = record.get("best_reaction") or 0.0
+
+        self.total_games += 1
+        if score > self.high_scores.get(mode, 0):
+            self.high_scores[mode] = score
+        if accuracy > self.best_accuracy:
+            self.best_accuracy = accuracy
+        if reaction > 0 and (self.best_reaction == 0 or reaction < self.best_reaction):
+            self.best_reaction = reaction
+        self.recent.append({"date": record.get("date"), "mode": mode, "score": score})
+        self.revision += 1
+
+    @property
+    def high_score(self) -> int:
+        return max(self.high_scores.values(), default=0)
+
+    @classmethod
+    def rebuild(cls, records: Iterable[dict[str, Any]]) -> "StatsSummary":
+        """Summary of *records* from scratch (used once for older databases)."""
+        summary = cls()
+        for record in records:
+            summary.add(record)
+        return summary
+
+    # ------------------------------------------------------------------
+    # Serialisation
+    # ------------------------------------------------------------------
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "total_games":   self.total_games,
+            "high_scores":   self.high_scores,
+            "best_accuracy": self.best_accuracy,
+            "best_reaction": self.best_reaction,
+            "recent":        list(self.recent),
+            "revision":      self.revision,
+        })
+
+    @classmethod
+    def from_json(cls, text: str) -> "StatsSummary":
+        data = json.loads(text)
+        summary = cls()
+        summary.total_games   = data.get("total_games", 0)
+        summary.high_scores   = dict(data.get("high_scores", {}))
+        summary.best_accuracy = data.get("best_accuracy", 0.0)
+        summary.best_reaction = data.get("best_reaction", 0.0)
+        summary.recent.extend(data.get("recent", []))
+        summary.revision      = data.get("revision", summary.total_games)
+        return summary
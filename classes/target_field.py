@@ -0,0 +1,395 @@
+"""
+TargetField — structure-of-arrays store for any number of live targets.
+
+Every per-target attribute (position, velocity, radius, spawn time, TTL)
+lives in its own NumPy array, and live targets are packed densely into the
+first ``count`` slots.  Movement, wall bounces, timeouts and click
+hit-testing are each a handful of vectorised operations over those slices,
+so the per-frame cost stays flat from one target up to a stress field of
+hundreds of movers.  Motion is closed-form (see :mod:`classes.motion`):
+each target keeps its spawn point and trajectory parameters, so its
+position can be evaluated at any time, including the exact moment of a
+click.  Removing a target moves the last live target into the
+freed slot, which keeps the packing dense without shifting arrays.
+
+Time comes in two kinds.  ``update`` is driven by the fixed-step
+simulation clock, which ages targets, times them out and moves them.
+Reaction times are measured on the wall clock instead.  Positions are
+cached at the last update for drawing; ``hit_test`` can evaluate them at
+the click's own simulation time instead.  A new target is
+*pending* until :meth:`mark_presented` is called after the frame that first
+shows it; both its simulated age and its reaction-time clock start there.
+Drawing interpolates between the last two simulation steps.
+"""
+
+from __future__ import annotations
+import math
+from random import randint
+
+import numpy as np
+import pygame
+
+import constants
+from constants import YELLOW
+from classes import motion, tracking
+from classes.Target import get_sprite, COLOR_STEPS
+
+_DEFAULT_CAPACITY = 16
+_ARC_WIDTH        = 3
+_ARC_START        = -math.pi / 2
+
+
+class TargetField:
+    """
+    A growable pool of targets updated and hit-tested as a batch.
+
+    Typical usage inside the game loop::
+
+        field = TargetField()
+        field.spawn(WIDTH, HEIGHT, radius, ttl_ms, mode="dynamic", now=now)
+
+        timeouts = field.update(now, WIDTH, HEIGHT)   # removes expired targets
+        idx = field.hit_test(mx, my)                  # -1 when nothing is hit
+        if idx >= 0:
+            rt = field.reaction_time(idx, now)
+            field.remove(idx)
+        field.draw(surface)
+    """
+
+    def __init__(self, capacity: int = _DEFAULT_CAPACITY) -> None:
+        """
+        Args:
+            capacity: Initial number of slots; the arrays double when full.
+        """
+        self._count = 0
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int) -> None:
+        old = getattr(self, "_x", None)
+        n   = self._count
+        arrays = {
+            "_x":           np.float64,
+            "_y":           np.float64,
+            "_x0":          np.float64,
+            "_y0":          np.float64,
+            "_vx":          np.float64,
+            "_vy":          np.float64,
+            "_nx":          np.float64,
+            "_ny":          np.float64,
+            "_c2":          np.float64,
+            "_amp":         np.float64,
+            "_omega":       np.float64,
+            "_half":        np.float64,
+            "_radius":      np.int32,
+            "_spawn_time":  np.float64,
+            "_last_update": np.float64,
+            "_ttl":         np.float64,
+            "_elapsed":     np.float64,
+            "_pending":     np.bool_,
+            "_shown_at":    np.float64,
+            "_prev_x":      np.float64,
+            "_prev_y":      np.float64,
+        }
+        for name, dtype in arrays.items():
+            fresh = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                fresh[:n] = getattr(self, name)[:n]
+            setattr(self, name, fresh)
+        self._capacity = capacity
+        self._bounds = (0.0, 0.0)   # playfield size of the last update
+
+    # ------------------------------------------------------------------
+    # Adding / removing targets
+    # ------------------------------------------------------------------
+
+    def add(
+        self,
+        x: float,
+        y: float,
+        radius: int,
+        ttl_ms: float,
+        now: float,
+        vx: float = 0.0,
+        vy: float = 0.0,
+        pattern: int = motion.LINEAR,
+        amp: float = 0.0,
+        period: float = 0.0,
+        accel: float = 0.0,
+    ) -> int:
+        """
+        Append one target and return its slot index.
+
+        *pattern* and its parameters describe the trajectory from ``(x, y)``
+        at the initial velocity ``(vx, vy)``; see :mod:`classes.motion`.
+        """
+        if self._count == self._capacity:
+            self._allocate(self._capacity * 2)
+        i = self._count
+        self._x[i]           = x
+        self._y[i]           = y
+        self._x0[i]          = x
+        self._y0[i]          = y
+        self._vx[i]          = vx
+        self._vy[i]          = vy
+        (self._nx[i], self._ny[i], self._c2[i],
+         self._amp[i], self._omega[i], self._half[i]) = motion.coefficients(
+            vx, vy, pattern, amp, period, accel)
+        self._radius[i]      = radius
+        self._ttl[i]         = ttl_ms
+        self._spawn_time[i]  = now
+        self._last_update[i] = now
+        self._elapsed[i]     = 0.0
+        self._pending[i]     = True
+        self._shown_at[i]    = now
+        self._prev_x[i]      = x
+        self._prev_y[i]      = y
+        self._count += 1
+        return i
+
+    def spawn(
+        self,
+        width: int,
+        height: int,
+        radius: int,
+        ttl_ms: float,
+        mode: str = "basic",
+        now: float = 0.0,
+    ) -> int:
+        """
+        Add a target at a random position, mirroring :meth:`Target.spawn`.
+
+        In ``"dynamic"`` mode the target gets a random heading, a speed
+        between 0.2 and 0.6 pixel/ms and the motion pattern named by
+        ``constants.DYNAMIC_PATTERN``; ``"tracking"`` targets move the same way.
+        """
+        x = randint(radius + 1, width  - radius - 1)
+        y = randint(radius + 1, height - radius - 1)
+        vx, vy = 0.0, 0.0
+        params = (motion.LINEAR, 0.0, 0.0, 0.0)
+        if mode in ("dynamic", "tracking"):
+            speed = randint(20, 60) / 100.0
+            angle = math.radians(randint(0, 359))
+            vx = math.cos(angle) * speed
+            vy = math.sin(angle) * speed
+            params = motion.random_params(getattr(constants, "DYNAMIC_PATTERN", "linear"))
+        return self.add(float(x), float(y), radius, ttl_ms, now, vx, vy, *params)
+
+    def remove(self, index: int) -> None:
+        """Remove the target in slot *index* (the last target takes its slot)."""
+        last = self._count - 1
+        if not 0 <= index <= last:
+            raise IndexError(f"target index {index} out of range (count {self._count}).")
+        if index != last:
+            for arr in self._arrays():
+                arr[index] = arr[last]
+        self._count = last
+
+    def _remove_mask(self, mask: np.ndarray) -> int:
+        """Drop every live target where *mask* is true; returns how many."""
+        n = self._count
+        keep = ~mask
+        kept = int(np.count_nonzero(keep))
+        if kept != n:
+            for arr in self._arrays():
+                arr[:kept] = arr[:n][keep]
+            self._count = kept
+        return n - kept
+
+    def clear(self) -> None:
+        self._count = 0
+
+    def _arrays(self):
+        return (
+            self._x, self._y, self._x0, self._y0, self._vx, self._vy,
+            self._nx, self._ny, self._c2, self._amp, self._omega, self._half, self._radius,
+            self._spawn_time, self._last_update, self._ttl, self._elapsed,
+            self._pending, self._shown_at, self._prev_x, self._prev_y,
+        )
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+
+    def update(self, current_time_ms: float, screen_width: int, screen_height: int) -> int:
+        """
+        Advance every target to simulation time *current_time_ms*.
+
+        Expired targets are removed and movers are placed on their
+        trajectories, folded into the screen by the walls.  Positions are
+        exact for any *current_time_ms*; the fixed step only sets how
+        often timeouts are checked and how far apart the two positions
+        used for interpolated drawing are.
+
+        Returns:
+            The number of targets that timed out during this update.
+        """
+        n = self._count
+        if n == 0:
+            return 0
+
+        # Targets not shown yet stay frozen at age zero
+        pending = self._pending[:n]
+        if pending.any():
+            self._spawn_time[:n][pending]  = current_time_ms
+            self._last_update[:n][pending] = current_time_ms
+
+        elapsed = self._elapsed[:n]
+        np.subtract(current_time_ms, self._spawn_time[:n], out=elapsed)
+        expired = elapsed >= self._ttl[:n]
+        timeouts = 0
+        if expired.any():
+            timeouts = self._remove_mask(expired)
+            n = self._count
+            if n == 0:
+                return timeouts
+
+        self._bounds = (float(screen_width), float(screen_height))
+        self._last_update[:n] = current_time_ms
+        self._prev_x[:n] = self._x[:n]
+        self._prev_y[:n] = self._y[:n]
+        # Vị trí theo công thức đóng; va chạm viền là phép phản xạ
+        self._x[:n], self._y[:n] = self._positions(slice(0, n), self._elapsed[:n])
+        return timeouts
+
+    def _positions(self, sl: slice, age: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Positions of the targets in slots *sl* at *age* ms after they were shown."""
+        w, h = self._bounds
+        coeffs = (self._nx[sl], self._ny[sl], self._c2[sl],
+                  self._amp[sl], self._omega[sl], self._half[sl])
+        return motion.position(self._x0[sl], self._y0[sl], self._vx[sl], self._vy[sl],
+                               coeffs, age, self._radius[sl], w, h)
+
+    def hit_test(self, mouse_x: float, mouse_y: float, at_ms: float | None = None) -> int:
+        """
+        Return the slot index of the target under the cursor, or ``-1``.
+
+        Args:
+            mouse_x, mouse_y: Cursor position.
+            at_ms:            Simulation time of the click; targets are
+                              tested where they were at that moment
+                              (default: their positions at the last update).
+
+        When targets overlap the one drawn last (topmost) wins.
+        """
+        n = self._count
+        if n == 0:
+            return -1
+        if at_ms is None or self._bounds[0] <= 0:
+            x, y = self._x[:n], self._y[:n]
+        else:
+            # Targets not shown yet sit at their spawn point (age zero)
+            age  = np.where(self._pending[:n], 0.0, np.maximum(0.0, at_ms - self._spawn_time[:n]))
+            x, y = self._positions(slice(0, n), age)
+        dx = x - mouse_x
+        dy = y - mouse_y
+        r  = self._radius[:n]
+        hits = np.flatnonzero(dx * dx + dy * dy <= r.astype(np.float64) ** 2)
+        return int(hits[-1]) if hits.size else -1
+
+    def time_on_target(
+        self, index: int, times: np.ndarray, xs: np.ndarray, ys: np.ndarray,
+    ) -> tuple[float, float]:
+        """
+        Time a cursor path spent on target *index*; see :mod:`classes.tracking`.
+
+        Args:
+            index:  Target slot.
+            times:  Simulation times of the path's knots, ascending.
+            xs, ys: Cursor position at each knot.
+
+        Returns:
+            ``(on_ms, total_ms)``; time before the target was shown is not
+            counted in either.
+        """
+        if not 0 <= index < self._count or self._pending[index] or self._bounds[0] <= 0:
+            return 0.0, 0.0
+        start = float(self._spawn_time[index])
+        t = np.maximum(times, start)
+        tx, ty = self._positions(slice(index, index + 1), t - start)
+        return tracking.time_on_target(t, xs, ys, tx, ty, float(self._radius[index]))
+
+    def mark_presented(self, now_ms: float, sim_time_ms: float | None = None) -> None:
+        """
+        Start the clocks of every pending target (call after a flip).
+
+        Args:
+            now_ms:      Wall-clock time of the flip, for reaction times.
+            sim_time_ms: Simulation time of the flip, for TTL and motion
+                         (defaults to *now_ms*).
+        """
+        n = self._count
+        pending = self._pending[:n]
+        if n and pending.any():
+            sim = now_ms if sim_time_ms is None else sim_time_ms
+            self._shown_at[:n][pending]    = now_ms
+            self._spawn_time[:n][pending]  = sim
+            self._last_update[:n][pending] = sim
+            pending[:] = False
+
+    def reaction_time(self, index: int, hit_time_ms: float) -> float:
+        """Wall-clock milliseconds from the target's first frame to *hit_time_ms*."""
+        return max(0.0, hit_time_ms - float(self._shown_at[index]))
+
+    def ttl(self, index: int) -> float:
+        return float(self._ttl[index])
+
+    def position(self, index: int) -> tuple[float, float]:
+        return float(self._x[index]), float(self._y[index])
+
+    @property
+    def count(self) -> int:
+        """Number of live targets."""
+        return self._count
+
+    def __len__(self) -> int:
+        return self._count
+
+    # ------------------------------------------------------------------
+    # Drawing
+    # ------------------------------------------------------------------
+
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> list[pygame.Rect]:
+        """
+        Blit every live target sprite and its countdown arc onto *surface*.
+
+        Args:
+            surface: Destination surface.
+            alpha:   Fraction of the way from the previous simulation step
+                     to the latest one (1.0 draws the latest state).
+
+        Returns:
+            The rectangles that were drawn to.
+        """
+        n = self._count
+        if n == 0:
+            return []
+
+        ttl   = self._ttl[:n]
+        ratio = np.where(ttl > 0, np.minimum(1.0, self._elapsed[:n] / np.where(ttl > 0, ttl, 1.0)), 0.0)
+        buckets = np.minimum(COLOR_STEPS - 1, (ratio * (COLOR_STEPS - 1) + 0.5).astype(np.int32))
+        if alpha >= 1.0:
+            px, py = self._x[:n], self._y[:n]
+        else:
+            px = self._prev_x[:n] + (self._x[:n] - self._prev_x[:n]) * alpha
+            py = self._prev_y[:n] + (self._y[:n] - self._prev_y[:n]) * alpha
+        xs = px.astype(np.int32)
+        ys = py.astype(np.int32)
+
+        radii = self._radius[:n].tolist()
+        seq = []
+        for r, b, dx, dy in zip(radii, buckets.tolist(), xs.tolist(), ys.tolist()):
+            sprite = get_sprite(r, b)
+            half = sprite.get_width() // 2
+            seq.append((sprite, (dx - half, dy - half)))
+        rects = surface.blits(seq)
+
+        fx, fy = px.tolist(), py.tolist()
+        for i, arc_ratio in enumerate((1.0 - ratio).tolist()):
+            if arc_ratio > 0.01:
+                r = radii[i]
+                arc_rect = pygame.Rect(fx[i] - r, fy[i] - r, r * 2, r * 2)
+                pygame.draw.arc(surface, YELLOW, arc_rect,
+                                _ARC_START,
+                                _ARC_START + arc_ratio * 2 * math.pi,
+                                _ARC_WIDTH)
+        return rects
@@ -0,0 +1,123 @@
+"""
+TextCache — bounded LRU cache of rendered text surfaces.
+
+``pygame.font.Font.render`` rasterises every glyph on every call, and most
+of the text on screen (button labels, HUD captions, "MISS" labels) is the
+same from one frame to the next.  The cache keys each rendered surface by
+``(font, text, color, antialias)`` so a warm frame performs almost no
+render calls at all.
+
+Surfaces returned by the cache are shared — callers must treat them as
+read-only (blit them, don't draw on them).  A caller that needs to change
+per-surface alpha should set it immediately before blitting and restore it
+afterwards.
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+
+import pygame
+
+_DEFAULT_CAPACITY = 512
+
+
+class TextCache:
+    """
+    Least-recently-used cache of ``Font.render`` results.
+
+    Typical usage::
+
+        surf = render_text(font, "Start Game", BTN_TEXT)
+        surface.blit(surf, surf.get_rect(center=rect.center))
+
+    The ``hits``, ``misses`` and ``evictions`` counters are cumulative;
+    ``misses`` equals the number of real ``Font.render`` calls made.
+    """
+
+    def __init__(self, capacity: int = _DEFAULT_CAPACITY) -> None:
+        """
+        Args:
+            capacity: Maximum number of surfaces kept before the least
+                      recently used one is evicted.
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity!r}.")
+        self._capacity = capacity
+        self._entries: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+        self.hits:      int = 0
+        self.misses:    int = 0
+        self.evictions: int = 0
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: tuple[int, int, int],
+        antialias: bool = True,
+    ) -> pygame.Surface:
+        """
+        Return the rendered surface for *text*, rendering it on a miss.
+
+        Args:
+            font:      Font to render with.
+            text:      String to render.
+            color:     Foreground colour.
+            antialias: Passed through to ``Font.render``.
+        """
+        key = (font, text, tuple(color), antialias)
+        surf = self._entries.get(key)
+        if surf is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._entries[key] = surf
+        if len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    def clear(self) -> None:
+        """Drop every cached surface (counters are kept)."""
+        self._entries.clear()
+
+    def reset_stats(self) -> None:
+        """Zero the hit / miss / eviction counters."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def size(self) -> int:
+        """Number of surfaces currently cached."""
+        return len(self._entries)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of the cache counters, e.g. for a debug overlay or log line."""
+        return {
+            "hits":      self.hits,
+            "misses":    self.misses,
+            "evictions": self.evictions,
+            "size":      len(self._entries),
+        }
+
+
+# Shared instance used by the HUD, feedback labels, screens and utils.
+text_cache = TextCache()
+
+
+def render_text(
+    font: pygame.font.Font,
+    text: str,
+    color: tuple[int, int, int],
+    antialias: bool = True,
+) -> pygame.Surface:
+    """Render *text* through the shared :data:`text_cache`."""
+    return text_cache.render(font, text, color, antialias)
@@ -23,11 +23,64 @@ MIN_RADIUS     = 15
 INITIAL_TTL    = 2500
 MIN_TTL        = 800
 
+# Targets kept alive at once in each game mode
+MODE_TARGET_COUNTS = {
+    "basic":    1,
+    "dynamic":  1,
+}
+
+# Tracking mode always shows exactly one target: how long it is followed
+# before the next one appears, and the points per second of time on target
+TRACKING_TARGET_MS     = 4000
+TRACKING_POINTS_PER_S  = 100
+
+# Motion pattern of dynamic-mode targets: "linear", "strafe", "sinusoidal",
+# "accelerating", or "random" for a different one per target
+DYNAMIC_PATTERN = "random"
+
 TTL_DECREASE_INTERVAL = 10
 TTL_DECREASE_AMOUNT   = 150
 RADIUS_DECREASE_INTERVAL = 15
 RADIUS_DECREASE_AMOUNT   = 3
 
+# Dirty-rectangle rendering while playing (toggle in game with F2).  Above
+# DIRTY_RECT_THRESHOLD of the screen area a full flip is used instead.
+DIRTY_RECTS          = False
+DIRTY_RECT_THRESHOLD = 0.5
+
+# Gameplay runs in fixed SIM_HZ steps, independent of the frame rate, and is
+# drawn interpolated between the last two steps.  Frames longer than
+# MAX_FRAME_MS (window drag, debugger) are clamped rather than caught up.
+# RENDER_FPS caps the frame rate while playing (0 = uncapped); menus use FPS.
+SIM_HZ       = 1000
+MAX_FRAME_MS = 250
+RENDER_FPS   = FPS
+
+# Menu screens skip redraws without input and, after IDLE_AFTER_MS without
+# input, wake only IDLE_FPS times per second until the next event.
+IDLE_FPS      = 10
+IDLE_AFTER_MS = 3000
+
+# Build the remaining screens on idle start-screen frames instead of on
+# their first use.
+WARM_SCREENS = True
+
+# Mixer output: a small buffer keeps click-to-sound latency low
+# (AUDIO_BUFFER / AUDIO_FREQUENCY seconds).  AUDIO_POOLS reserves channels
+# per sound; a full pool steals its oldest voice so no shot is dropped.
+AUDIO_FREQUENCY = 44100
+AUDIO_BUFFER    = 256
+AUDIO_POOLS = {
+    "shot": 8,
+    "hit":  4,
+}
+
+# Background music: menu and results volumes at 100% music volume in
+# Settings (the setting scales both), cross-faded over MUSIC_FADE_MS
+MUSIC_VOLUME         = 0.5
+RESULTS_MUSIC_VOLUME = 0.35
+MUSIC_FADE_MS        = 400
+
 FONT_SMALL  = 22
 FONT_MEDIUM = 28
 FONT_LARGE  = 48
@@ -0,0 +1,29 @@
+import os
+import sys
+
+# Headless SDL: the game's modules touch pygame at import and in __init__
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from classes.clock import GameClock
+
+
+class FrameClock(GameClock):
+    """GameClock on a fake time source that only moves when pumped."""
+
+    def __init__(self) -> None:
+        self.ns = 0
+        super().__init__(lambda: self.ns)
+
+    def pump(self, frame_ms: float = 16.0) -> None:
+        self.ns += int(frame_ms * 1_000_000)
+        self.pumped()
+
+
+@pytest.fixture
+def clock():
+    return FrameClock()
@@ -0,0 +1,90 @@
+import math
+
+import pygame
+import pytest
+
+import constants
+from classes.App import App
+from classes.state_manager import GameState
+
+_FRAME_MS = 16.0
+
+# Calls that stall the frame they run in: decoding and restarting the
+# stream, SDL's blocking fade-out, and sleeps
+_BLOCKING = [
+    (pygame.mixer.music, "load"),
+    (pygame.mixer.music, "play"),
+    (pygame.mixer.music, "stop"),
+    (pygame.mixer.music, "fadeout"),
+    (pygame.time, "wait"),
+    (pygame.time, "delay"),
+]
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch, clock):
+    monkeypatch.chdir(tmp_path)                     # stats.db goes here
+    monkeypatch.setattr(constants, "GAME_DURATION", 1)
+    app = App(clock)
+    yield app
+    app._session_writer.close()
+    app._sessions.close()
+    pygame.quit()
+
+
+def _count_blocking(monkeypatch) -> list:
+    calls = []
+    for module, name in _BLOCKING:
+        original = getattr(module, name)
+
+        def wrapper(*args, _name=name, _original=original, **kwargs):
+            calls.append(_name)
+            return _original(*args, **kwargs)
+
+        monkeypatch.setattr(module, name, wrapper)
+    return calls
+
+
+def _frame(app: App) -> None:
+    """One pass of App.run's loop body without input, on the fake clock."""
+    app._game_clock.pump(_FRAME_MS)
+    app._music.update(_FRAME_MS)
+    app._handle_events(app._mouse.ingest(pygame.event.get(), app._game_clock))
+    app._update(int(_FRAME_MS))
+    app._draw()
+
+
+def test_results_transition_does_not_block(app, monkeypatch):
+    # Screens are built ahead of time on idle start-screen frames
+    while app._warm_next_screen():
+        pass
+    app._start_round()
+    started = app._game_clock.ns
+    for _ in range(math.ceil(constants.MUSIC_FADE_MS / _FRAME_MS)):
+        _frame(app)     # the round-start fade-out pauses the music
+    blocking = _count_blocking(monkeypatch)
+
+    for _ in range(int(constants.GAME_DURATION * 1000 / _FRAME_MS) + 10):
+        _frame(app)
+        if app._state.is_state(GameState.RESULTS):
+            break
+    else:
+        pytest.fail("round never reached the results screen")
+
+    # The round's last frame only unpaused the stream and started a ramp
+    assert blocking == []
+    assert app._music.fading
+    # ... on the first fixed step past the round's end, which the clock
+    # reaches one frame late (the round's first frame has no length)
+    round_ms = constants.GAME_DURATION * 1000
+    elapsed_ms = (app._game_clock.ns - started) / 1e6
+    assert 0 <= app._game_timer - round_ms < 1000.0 / constants.SIM_HZ
+    assert 0 <= elapsed_ms - _FRAME_MS - round_ms < _FRAME_MS
+
+    # The ramp is spread over MUSIC_FADE_MS of frames, one step per update
+    steps = 0
+    while app._music.fading:
+        _frame(app)
+        steps += 1
+    assert steps == math.ceil(constants.MUSIC_FADE_MS / _FRAME_MS)
+    assert blocking == []
@@ -0,0 +1,73 @@
+import random
+
+import pygame
+import pytest
+
+import constants
+from classes.input import RelativeMouse
+
+WIDTH, HEIGHT = 1280, 720
+
+
+def motion(dx, dy):
+    return pygame.event.Event(pygame.MOUSEMOTION, rel=(dx, dy), pos=(0, 0), buttons=(0, 0, 0))
+
+
+def click():
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(0, 0))
+
+
+def test_scripted_trace_loses_no_distance(monkeypatch, clock):
+    sens = 0.37
+    monkeypatch.setattr(constants, "MOUSE_SENSITIVITY", sens, raising=False)
+    rng = random.Random(1234)
+    mouse = RelativeMouse(WIDTH, HEIGHT)
+    start = (640.0, 360.0)
+    mouse.x, mouse.y = start
+
+    total_x = total_y = samples = 0
+    for _ in range(200):
+        frame = [motion(rng.randint(-7, 7), rng.randint(-7, 7)) for _ in range(rng.randint(0, 12))]
+        samples += len(frame)
+        for event in frame:
+            total_x += event.rel[0]
+            total_y += event.rel[1]
+            # The trace must never reach an edge, or clamping would eat distance
+            assert 0 < start[0] + sens * total_x < WIDTH
+            assert 0 < start[1] + sens * total_y < HEIGHT
+        clock.pump()
+        assert mouse.ingest(frame, clock) == []
+
+    assert mouse.x == pytest.approx(start[0] + sens * total_x, abs=1e-9)
+    assert mouse.y == pytest.approx(start[1] + sens * total_y, abs=1e-9)
+    assert mouse.samples.total == samples
+
+
+def test_motion_is_clamped_at_the_edges(monkeypatch, clock):
+    monkeypatch.setattr(constants, "MOUSE_SENSITIVITY", 1.0, raising=False)
+    mouse = RelativeMouse(WIDTH, HEIGHT)
+    mouse.x, mouse.y = 20.0, HEIGHT - 20.0
+
+    clock.pump()
+    mouse.ingest([motion(-50, 50), motion(10, -5)], clock)
+
+    # Pinned at the corner by the first step, then moved back by the second
+    assert (mouse.x, mouse.y) == (10.0, HEIGHT - 5.0)
+
+
+def test_click_resolves_mid_trace(monkeypatch, clock):
+    monkeypatch.setattr(constants, "MOUSE_SENSITIVITY", 0.5, raising=False)
+    mouse = RelativeMouse(WIDTH, HEIGHT)
+    mouse.x, mouse.y = 100.0, 100.0
+
+    first, mid, last = click(), click(), click()
+    key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0, unicode="a")
+    batch = [first, motion(20, 10), key, motion(20, 10), mid, motion(20, 10), last]
+    clock.pump()
+    remaining = mouse.ingest(batch, clock)
+
+    assert remaining == [first, key, mid, last]
+    assert mouse.position_of(first) == (100, 100)
+    assert mouse.position_of(mid) == (120, 110)
+    assert mouse.position_of(last) == (130, 115)
+    assert (mouse.x, mouse.y) == (130.0, 115.0)
@@ -0,0 +1,100 @@
+import math
+
+import numpy as np
+import pytest
+
+from classes import motion
+from classes.target_field import TargetField
+
+WIDTH, HEIGHT = 1280, 720
+RADIUS = 30
+X0, Y0 = 200.0, 150.0
+SPEED = (0.4, 0.3)          # 0.5 px/ms, several wall bounces in the run
+DURATION_MS = 3000.0
+STEP_MS = 0.5
+
+
+def _stepped(ux, uy, pattern, amp=0.0, period=0.0, accel=0.0):
+    """
+    Reference path from the pattern's velocity, integrated in small steps
+    and mirrored at the walls the way a bouncing target is.
+    """
+    speed = math.hypot(ux, uy)
+    nx, ny = -uy / speed, ux / speed
+    half = period / 2
+
+    def velocity(t):
+        if pattern == motion.STRAFE:
+            along = 1.0 if int(t // half) % 2 == 0 else -1.0
+        elif pattern == motion.ACCELERATING:
+            along = 1.0 + accel * t / speed
+        else:
+            along = 1.0
+        vx, vy = ux * along, uy * along
+        if pattern == motion.SINUSOIDAL:
+            omega = 2 * math.pi / period
+            side = amp * omega * math.cos(omega * t)
+            vx, vy = vx + nx * side, vy + ny * side
+        return vx, vy
+
+    x, y = X0, Y0
+    sx = sy = 1.0
+    lo_x, hi_x = RADIUS, WIDTH - RADIUS
+    lo_y, hi_y = RADIUS, HEIGHT - RADIUS
+    samples = {}
+    bounces = 0
+    t = 0.0
+    for k in range(int(DURATION_MS / STEP_MS)):
+        if k % 200 == 0:
+            samples[t] = (x, y)
+        vx, vy = velocity(t + STEP_MS / 2)    # midpoint rule
+        x += sx * vx * STEP_MS
+        y += sy * vy * STEP_MS
+        if x < lo_x:
+            x, sx, bounces = 2 * lo_x - x, -sx, bounces + 1
+        elif x > hi_x:
+            x, sx, bounces = 2 * hi_x - x, -sx, bounces + 1
+        if y < lo_y:
+            y, sy, bounces = 2 * lo_y - y, -sy, bounces + 1
+        elif y > hi_y:
+            y, sy, bounces = 2 * hi_y - y, -sy, bounces + 1
+        t = (k + 1) * STEP_MS
+    return samples, bounces
+
+
+@pytest.mark.parametrize("velocity, pattern, amp, period, accel", [
+    (SPEED,        motion.LINEAR,       0.0,  0.0,    0.0),
+    # A strafe returns to its start, so head it into the nearby corner
+    ((-0.4, -0.3), motion.STRAFE,       0.0,  1000.0, 0.0),
+    (SPEED,        motion.SINUSOIDAL,   80.0, 1200.0, 0.0),
+    (SPEED,        motion.ACCELERATING, 0.0,  0.0,    2e-4),
+])
+def test_closed_form_matches_stepped_bounces(velocity, pattern, amp, period, accel):
+    ux, uy = velocity
+    reference, bounces = _stepped(ux, uy, pattern, amp, period, accel)
+    assert bounces > 0      # the run must actually exercise the walls
+    coeffs = tuple(np.array([c]) for c in motion.coefficients(ux, uy, pattern, amp, period, accel))
+    times = np.array(list(reference))
+    x, y = motion.position(np.array([X0]), np.array([Y0]), np.array([ux]), np.array([uy]),
+                           coeffs, times, np.array([RADIUS]), WIDTH, HEIGHT)
+
+    expected = np.array(list(reference.values()))
+    np.testing.assert_allclose(x, expected[:, 0], atol=0.01)
+    np.testing.assert_allclose(y, expected[:, 1], atol=0.01)
+
+
+def test_reflect_folds_into_bounds():
+    u = np.array([-25.0, 0.0, 5.0, 10.0, 12.0, 25.0, 41.0])
+    np.testing.assert_allclose(motion.reflect(u, 0.0, 10.0), [5.0, 0.0, 5.0, 10.0, 8.0, 5.0, 1.0])
+
+
+def test_hit_test_uses_the_click_time():
+    field = TargetField()
+    field.add(200.0, 200.0, 10, ttl_ms=5000, now=0.0, vx=0.5)
+    field.mark_presented(0.0, 0.0)
+    field.update(100.0, WIDTH, HEIGHT)      # last update: x = 250
+
+    # Clicked where the target was at 60 ms, handled after the 100 ms update
+    assert field.hit_test(230, 200) == -1
+    assert field.hit_test(230, 200, at_ms=60.0) == 0
+    assert field.hit_test(250, 200, at_ms=60.0) == -1
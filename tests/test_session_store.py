@@ -0,0 +1,46 @@
+import numpy as np
+
+from classes.score_manager import ScoreManager
+from classes.session_store import SessionStore
+
+
+class CapturingWriter:
+    """Stands in for SessionWriter: keeps submitted records instead of writing them."""
+
+    def __init__(self) -> None:
+        self.records = []
+
+    def submit(self, record) -> None:
+        self.records.append(record)
+
+
+def _play(mode, hits=0, misses=0, tracking=None):
+    writer = CapturingWriter()
+    score = ScoreManager(writer)
+    score.reset(mode)
+    for _ in range(hits):
+        score.register_hit(250.0, 1000)
+    for _ in range(misses):
+        score.register_miss()
+    if tracking is not None:
+        score.register_tracking(*tracking)
+    score.save_session(mode)
+    return writer.records[0]
+
+
+def test_tracking_rounds_keep_click_accuracy_separate(tmp_path):
+    store = SessionStore(str(tmp_path / "stats.db"), legacy_json=None)
+    try:
+        store.append(_play("basic", hits=3, misses=1))
+        store.append(_play("tracking", tracking=(990.0, 1000.0)))
+
+        summary = store.summary()
+        assert summary.best_accuracy == 75.0
+        assert summary.high_scores["tracking"] > 0
+
+        accuracy, _ = store.series("accuracy")
+        np.testing.assert_allclose(accuracy, [75.0])
+        tracking, _ = store.series("tracking_accuracy", "tracking")
+        np.testing.assert_allclose(tracking, [99.0])
+    finally:
+        store.close()
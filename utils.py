@@ -1,5 +1,7 @@
 import pygame
 
+from classes.text_cache import render_text
+
 
 def draw_text(
     surface: pygame.Surface,
@@ -10,11 +12,11 @@ def draw_text(
     shadow: bool = True,
 ) -> None:
     if shadow:
-        shadow_surf = font.render(text, True, (20, 20, 20))
+        shadow_surf = render_text(font, text, (20, 20, 20))
         shadow_rect = shadow_surf.get_rect(center=(center_pos[0] + 2, center_pos[1] + 2))
         surface.blit(shadow_surf, shadow_rect)
 
-    text_surf = font.render(text, True, color)
+    text_surf = render_text(font, text, color)
     text_rect = text_surf.get_rect(center=center_pos)
     surface.blit(text_surf, text_rect)
 
@@ -34,7 +36,7 @@ def draw_button(
 
     pygame.draw.rect(surface, bg_color, rect, border_radius=12)
 
-    text_surf = font.render(text, True, text_color)
+    text_surf = render_text(font, text, text_color)
     text_rect = text_surf.get_rect(center=rect.center)
     surface.blit(text_surf, text_rect)
 